@@ -0,0 +1,403 @@
+"""Micro-benchmarks for egile-agent-prospectfinder.
+
+Run from the repository root:
+
+    python benchmarks/benchmark.py records [--count 100000]
+    python benchmarks/benchmark.py transports [--clients 10] [--calls 50]
+        [--transports direct inprocess stdio sse streamable-http]
+    python benchmarks/benchmark.py logging [--calls 20000] [--write-delay-us 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from egile_agent_prospectfinder.logging_config import TEXT_FORMAT, configure_logging
+from egile_agent_prospectfinder.prospect import Prospect, format_prospects
+
+SECTORS = ["Marketing", "Construction", "Technology", "Healthcare", "Finance"]
+COUNTRIES = ["Belgium", "France", "Netherlands", "Germany"]
+# Transports benchmarked without a TCP server
+LOCAL_TRANSPORTS = ("direct", "inprocess", "stdio")
+
+
+def _measure(build: Callable[[], Any]) -> tuple[Any, int, float]:
+    """Return (result, bytes allocated and retained, seconds) for ``build()``."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained, elapsed
+
+
+def _raw_results(count: int) -> list[tuple[str, str, str, str, str]]:
+    # Sector/country strings are rebuilt per row, as they are when decoded from JSON
+    return [
+        (
+            f"Company {i}",
+            f"https://company-{i}.example.com",
+            f"Snippet for company {i}",
+            "".join(SECTORS[i % len(SECTORS)]),
+            "".join(COUNTRIES[i % len(COUNTRIES)]).encode().decode(),
+        )
+        for i in range(count)
+    ]
+
+
+def bench_records(args: argparse.Namespace) -> None:
+    """Compare dict results with slotted Prospect records."""
+    raw = _raw_results(args.count)
+
+    dicts, dict_bytes, dict_time = _measure(
+        lambda: [
+            {"title": t, "link": url, "snippet": s, "sector": sec, "country": c, "source": "bench"}
+            for t, url, s, sec, c in raw
+        ]
+    )
+    prospects, prospect_bytes, prospect_time = _measure(
+        lambda: [Prospect(t, url, s, sec, c, "bench") for t, url, s, sec, c in raw]
+    )
+
+    start = time.perf_counter()
+    for offset in range(0, len(dicts), 50):
+        text = "Found 50 prospects:\n\n"
+        for i, res in enumerate(dicts[offset:offset + 50], 1):
+            text += f"{i}. {res['title']} - {res['link']}\n"
+    dict_format = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for offset in range(0, len(prospects), 50):
+        format_prospects(prospects[offset:offset + 50], "Marketing", "Belgium")
+    prospect_format = time.perf_counter() - start
+
+    # The field strings themselves are shared by both layouts; report container cost
+    n = args.count
+    print(f"records: {n} results")
+    print(f"  {'':10} {'bytes/record':>14} {'build ns/record':>16} {'format ns/record':>17}")
+    print(
+        f"  {'dict':10} {dict_bytes / n:14.1f} {dict_time / n * 1e9:16.1f} "
+        f"{dict_format / n * 1e9:17.1f}"
+    )
+    print(
+        f"  {'Prospect':10} {prospect_bytes / n:14.1f} {prospect_time / n * 1e9:16.1f} "
+        f"{prospect_format / n * 1e9:17.1f}"
+    )
+    print(f"  memory saved: {100 * (1 - prospect_bytes / dict_bytes):.0f}%")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))] if ordered else 0.0
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _ConnectionCounter:
+    """ASGI middleware recording each distinct client (host, port), i.e. TCP connection."""
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.peers: set[tuple[str, int]] = set()
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            if scope["path"] == "/_stats":
+                body = json.dumps({"connections": len(self.peers)}).encode()
+                await send({"type": "http.response.start", "status": 200, "headers": []})
+                await send({"type": "http.response.body", "body": body})
+                return
+            if scope.get("client"):
+                self.peers.add(tuple(scope["client"]))
+        await self.app(scope, receive, send)
+
+
+def stub_find_prospects(sector: str, country: str = "Belgium", limit: int = 10) -> str:
+    """Stand-in find_prospects tool returning a fixed-shape listing."""
+    lines = [
+        f"{i}. {sector} Company {i}\n   URL: https://c{i}.example.com" for i in range(1, limit + 1)
+    ]
+    return f"Found {limit} prospects for {sector} in {country}:\n\n" + "\n\n".join(lines)
+
+
+def build_local_mcp(json_response: bool = True) -> Any:
+    """Build a FastMCP app serving the stand-in find_prospects tool."""
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("prospectfinder-bench", log_level="WARNING", json_response=json_response)
+    mcp.add_tool(stub_find_prospects, name="find_prospects")
+    return mcp
+
+
+def serve_local_mcp(args: argparse.Namespace) -> None:
+    """Serve the stand-in MCP app over stdio, SSE or streamable HTTP."""
+    mcp = build_local_mcp(args.json_response)
+    if args.transport == "stdio":
+        mcp.run("stdio")
+        return
+
+    import uvicorn
+
+    if args.transport == "sse":
+        app = mcp.sse_app()
+    else:
+        app = mcp.streamable_http_app()
+    uvicorn.run(_ConnectionCounter(app), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+class _DirectClient:
+    """Calls the stand-in tool function directly, as direct mode does: the baseline."""
+
+    async def connect(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def find_prospects(self, sector: str, country: str = "Belgium", limit: int = 10) -> str:
+        return stub_find_prospects(sector, country, limit)
+
+
+async def _server_connections(port: int) -> int:
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        return (await client.get(f"http://127.0.0.1:{port}/_stats")).json()["connections"]
+
+
+async def _wait_for_port(port: int, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"Server on port {port} did not start")
+
+
+def _start_server(transport: str, port: int, json_response: bool) -> subprocess.Popen:
+    command = [sys.executable, __file__, "_serve", "--transport", transport, "--port", str(port)]
+    if json_response:
+        command.append("--json-response")
+    return subprocess.Popen(command)
+
+
+async def _bench_transport(
+    transport: str, clients: int, calls: int, port: int = 0
+) -> dict[str, Any]:
+    from egile_agent_prospectfinder.mcp_client import MCPClient, close_shared_http_client
+
+    def make_client() -> Any:
+        if transport == "direct":
+            return _DirectClient()
+        if transport == "inprocess":
+            return MCPClient(transport=transport, server=build_local_mcp())
+        if transport == "stdio":
+            command = f"{sys.executable} {__file__} _serve --transport stdio"
+            return MCPClient(transport=transport, command=command)
+        return MCPClient(transport=transport, host="127.0.0.1", port=port)
+
+    mcp_clients = [make_client() for _ in range(clients)]
+    for client in mcp_clients:
+        await client.connect()
+    await mcp_clients[0].find_prospects("Marketing", limit=10)
+    connections_before = await _server_connections(port) if port else None
+
+    latencies: list[float] = []
+
+    async def run(client: Any) -> None:
+        for i in range(calls):
+            start = time.perf_counter()
+            await client.find_prospects("Marketing", "Belgium", limit=10)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(client) for client in mcp_clients))
+    elapsed = time.perf_counter() - start
+
+    connections = await _server_connections(port) if port else None
+    # Transports nest cancel scopes in this task, so close in reverse order
+    for client in reversed(mcp_clients):
+        await client.close()
+    await close_shared_http_client()
+
+    requests = clients * calls
+    return {
+        "transport": transport,
+        "calls_per_s": requests / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "connections": connections,
+        "new_connections": None if connections is None else connections - connections_before,
+        "connections_per_request": None if connections is None else connections / requests,
+    }
+
+
+def bench_transports(args: argparse.Namespace) -> None:
+    """Compare per-call latency and connection use of MCP transports."""
+    # The inprocess server logs every request in this process; keep the runs comparable
+    logging.disable(logging.INFO)
+    print(f"transports: {args.clients} clients x {args.calls} calls")
+    print(
+        f"  {'transport':16} {'calls/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'conns':>6} {'new':>5} {'conns/req':>10}"
+    )
+    for transport in args.transports:
+        if transport in LOCAL_TRANSPORTS:
+            # Nothing to connect to over TCP: stdio spawns one server per client
+            report = asyncio.run(_bench_transport(transport, args.clients, args.calls))
+        else:
+            port = _free_port()
+            server = _start_server(transport, port, not args.sse_responses)
+            try:
+                asyncio.run(_wait_for_port(port))
+                report = asyncio.run(_bench_transport(transport, args.clients, args.calls, port))
+            finally:
+                server.terminate()
+                server.wait()
+        connections = (
+            f"{report['connections']:6d} {report['new_connections']:5d} "
+            f"{report['connections_per_request']:10.3f}"
+            if report["connections"] is not None
+            else f"{'-':>6} {'-':>5} {'-':>10}"
+        )
+        print(
+            f"  {report['transport']:16} {report['calls_per_s']:9.1f} {report['p50_ms']:8.2f} "
+            f"{report['p99_ms']:8.2f} {connections}"
+        )
+
+
+class _SlowStream:
+    """Text stream whose writes block, like a slow terminal or a full pipe."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+async def _log_hot_path(logger: logging.Logger, calls: int, lazy: bool) -> float:
+    """Emit the per-call INFO lines of find_prospects; return seconds spent on the loop."""
+    start = time.perf_counter()
+    for i in range(calls):
+        sector, country, limit = SECTORS[i % len(SECTORS)], COUNTRIES[i % len(COUNTRIES)], 10
+        arguments = {"sector": sector, "country": country, "limit": limit}
+        if lazy:
+            logger.info(
+                "Searching for prospects: sector=%s, country=%s, limit=%s", sector, country, limit
+            )
+            logger.info("🔌 MCP CLIENT: Calling tool '%s' with arguments: %s", "find_prospects",
+                        arguments)
+        else:
+            logger.info(
+                f"Searching for prospects: sector={sector}, country={country}, limit={limit}"
+            )
+            logger.info(f"🔌 MCP CLIENT: Calling tool 'find_prospects' with arguments: {arguments}")
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    return time.perf_counter() - start
+
+
+def bench_logging(args: argparse.Namespace) -> None:
+    """Compare event-loop time spent logging with synchronous and queued handlers."""
+    delay = args.write_delay_us / 1e6
+    print(f"logging: {args.calls} calls x 2 INFO lines, {args.write_delay_us}us per write")
+    print(f"  {'pipeline':34} {'loop us/call':>12} {'drain ms':>9} {'lines':>7}")
+    setups = [
+        ("basicConfig, f-strings", False, None),
+        ("queue + JSON, lazy %-args", True, 0),
+        ("queue + JSON, lazy, rate limited", True, args.burst),
+    ]
+    root = logging.getLogger()
+    for label, lazy, burst in setups:
+        stream = _SlowStream(delay)
+        listener = None
+        if burst is None:
+            logging.basicConfig(level=logging.INFO, format=TEXT_FORMAT, stream=stream, force=True)
+        else:
+            listener = configure_logging(stream=stream, burst=burst, force=True)
+        loop_time = asyncio.run(_log_hot_path(logging.getLogger("bench"), args.calls, lazy))
+        start = time.perf_counter()
+        if listener is not None:
+            listener.stop()
+        drain = time.perf_counter() - start
+        print(
+            f"  {label:34} {loop_time / args.calls * 1e6:12.1f} {drain * 1e3:9.1f} "
+            f"{stream.writes:7d}"
+        )
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    records = commands.add_parser("records", help="Prospect record memory and allocation cost")
+    records.add_argument("--count", type=int, default=100_000)
+    records.set_defaults(func=bench_records)
+
+    transports = commands.add_parser("transports", help="MCP transport latency and connections")
+    transports.add_argument("--clients", type=int, default=10)
+    transports.add_argument("--calls", type=int, default=50)
+    transports.add_argument(
+        "--transports", nargs="+", default=["sse", "streamable-http"],
+        choices=["direct", "inprocess", "stdio", "sse", "streamable-http"],
+    )
+    transports.add_argument(
+        "--sse-responses", action="store_true",
+        help="Serve streamable HTTP POST responses as SSE streams (FastMCP default); the "
+        "client stops reading them early, so their connections are not reused",
+    )
+    transports.set_defaults(func=bench_transports)
+
+    log = commands.add_parser("logging", help="Event-loop cost of hot-path logging")
+    log.add_argument("--calls", type=int, default=20_000)
+    log.add_argument(
+        "--write-delay-us", type=float, default=200.0,
+        help="Simulated blocking time of each write to stderr",
+    )
+    log.add_argument(
+        "--burst", type=int, default=10, help="Rate limit: lines per message per second"
+    )
+    log.set_defaults(func=bench_logging)
+
+    serve = commands.add_parser("_serve")
+    serve.add_argument("--transport", required=True)
+    serve.add_argument("--port", type=int, default=0)
+    serve.add_argument("--json-response", action="store_true")
+    serve.set_defaults(func=serve_local_mcp)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ Includes MCP server integration, AgentOS, and web UI support.
 """
 
 from .plugin import ProspectFinderPlugin
-from .mcp_client import MCPClient
+from .mcp_client import MCPClient, ToolResult
+from .prospect import Prospect
+from .registry import MCPConnectionRegistry, mcp_registry
 from .run_server import run_all, run_agent_only, run_mcp_only
 
 __version__ = "0.1.0"
@@ -14,6 +16,10 @@ __version__ = "0.1.0"
 __all__ = [
     "ProspectFinderPlugin",
     "MCPClient",
+    "ToolResult",
+    "MCPConnectionRegistry",
+    "mcp_registry",
+    "Prospect",
     "run_all",
     "run_agent_only",
     "run_mcp_only",
@@ -0,0 +1,158 @@
+"""Admission control and load shedding for tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+
+
+class OverloadedError(Exception):
+    """Raised when a call is shed instead of admitted."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"Overloaded ({reason}), retry after {retry_after:.1f}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionStats:
+    """Counters describing admitted and shed load."""
+
+    admitted: int = 0
+    shed_queue_full: int = 0
+    shed_queue_timeout: int = 0
+    inflight: int = 0
+    queued: int = 0
+    peak_inflight: int = 0
+    peak_queued: int = 0
+    queue_time_total: float = 0.0
+
+    @property
+    def shed(self) -> int:
+        """Total number of shed calls."""
+        return self.shed_queue_full + self.shed_queue_timeout
+
+
+class AdmissionController:
+    """
+    Bounds concurrent work with a fixed number of slots and a bounded FIFO queue.
+
+    Calls beyond ``max_inflight`` wait in a queue of at most ``max_queue``
+    entries for up to ``queue_timeout`` seconds. Calls that find the queue
+    full, or that time out waiting, are shed with ``OverloadedError`` so they fail
+    fast instead of piling up behind the backend timeout.
+    """
+
+    def __init__(self, max_inflight: int = 32, max_queue: int = 64, queue_timeout: float = 5.0):
+        """
+        Initialize the controller.
+
+        Args:
+            max_inflight: Maximum calls running at once
+            max_queue: Maximum calls waiting for a slot
+            queue_timeout: Maximum seconds a call waits for a slot
+        """
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._stats = AdmissionStats()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Moving average of how long admitted calls hold a slot, for retry hints
+        self._service_time = 1.0
+
+    def stats(self) -> dict[str, float]:
+        """Return a snapshot of the admission counters."""
+        snapshot = asdict(self._stats)
+        snapshot["shed"] = self._stats.shed
+        snapshot["queued"] = len(self._waiters)
+        return snapshot
+
+    def _retry_after(self) -> float:
+        backlog = (len(self._waiters) + 1) / self.max_inflight
+        return round(min(30.0, max(0.5, self._service_time * backlog)), 1)
+
+    def _shed(self, reason: str) -> OverloadedError:
+        if reason == QUEUE_FULL:
+            self._stats.shed_queue_full += 1
+        else:
+            self._stats.shed_queue_timeout += 1
+        # Per-call lines stay at DEBUG: under overload they would flood the log,
+        # and stats() already counts every shed call
+        logger.debug(
+            "Shedding call (%s): inflight=%d, queued=%d, shed total=%d",
+            reason, self._stats.inflight, len(self._waiters), self._stats.shed,
+        )
+        return OverloadedError(reason, self._retry_after())
+
+    async def _acquire(self) -> None:
+        stats = self._stats
+        if stats.inflight < self.max_inflight and not self._waiters:
+            stats.inflight += 1
+            stats.peak_inflight = max(stats.peak_inflight, stats.inflight)
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise self._shed(QUEUE_FULL)
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        stats.peak_queued = max(stats.peak_queued, len(self._waiters))
+        start = time.monotonic()
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        stats.queue_time_total += time.monotonic() - start
+        if not waiter.done():
+            self._abandon(waiter)
+            raise self._shed(QUEUE_TIMEOUT)
+        # The releasing call handed its slot over, inflight is unchanged
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> None:
+        """Drop a waiter, passing on a slot it was handed but will not use."""
+        if waiter.done() and not waiter.cancelled():
+            self._release()
+            return
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._stats.inflight -= 1
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the block.
+
+        Raises:
+            OverloadedError: If the call is shed
+        """
+        await self._acquire()
+        self._stats.admitted += 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._service_time += 0.2 * (time.monotonic() - start - self._service_time)
+            self._release()
@@ -0,0 +1,176 @@
+"""Content-addressed storage of tool results.
+
+Full ``find_prospects`` results are written once, gzip-compressed, under the
+SHA-256 of their text. The conversation then carries a compact summary plus
+the reference, which the ``get_prospect_result`` tool expands on demand, so
+session history and prompts do not grow with every full listing.
+
+Blobs older than ``max_age`` (by last write or read) are deleted, and the
+least recently used ones go first when the store exceeds ``max_bytes``.
+Collection runs at startup and whenever a ``put`` pushes the store over its
+size budget or the last collection is older than ``gc_interval``. All methods
+do blocking file I/O; call them through ``asyncio.to_thread`` from async code.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+REF_LENGTH = 16
+
+_REF_RE = re.compile(rf"^[0-9a-f]{{{REF_LENGTH}}}$")
+_ITEM_RE = re.compile(r"^\d+\.\s")
+
+
+class BlobStore:
+    """Local directory of gzip-compressed results keyed by content hash."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_age: float = 7 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        gc_interval: float = 3600.0,
+    ):
+        """
+        Initialize the store and collect expired blobs.
+
+        Args:
+            directory: Directory holding the blobs
+            max_age: Seconds since its last write or read after which a blob is deleted
+            max_bytes: Compressed size budget of the whole store
+            gc_interval: Maximum seconds between collections triggered by ``put``
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.gc_interval = gc_interval
+        self._lock = threading.Lock()
+        self._size = 0
+        self._last_gc = 0.0
+        self.collect()
+
+    def collect(self) -> int:
+        """
+        Delete expired blobs, then the least recently used ones over the size budget.
+
+        Returns:
+            Number of blobs deleted
+        """
+        with self._lock:
+            now = time.time()
+            blobs = []
+            for path in self.directory.glob("*/*.txt.gz"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, path))
+            blobs.sort()
+            size = sum(blob_size for _, blob_size, _ in blobs)
+            deleted = 0
+            for mtime, blob_size, path in blobs:
+                if now - mtime <= self.max_age and size <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                size -= blob_size
+                deleted += 1
+            self._size = size
+            self._last_gc = time.monotonic()
+        if deleted:
+            logger.info("Collected %d stored results (%d bytes kept)", deleted, size)
+        return deleted
+
+    @staticmethod
+    def ref_for(text: str) -> str:
+        """Return the reference (truncated SHA-256) of a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:REF_LENGTH]
+
+    def _path(self, ref: str) -> Path:
+        return self.directory / ref[:2] / f"{ref[2:]}.txt.gz"
+
+    def put(self, text: str) -> str:
+        """
+        Store a text, once per distinct content.
+
+        Returns:
+            The reference to pass to ``get``
+        """
+        ref = self.ref_for(text)
+        path = self._path(ref)
+        try:
+            # Storing the same result again counts as a use
+            os.utime(path)
+            return ref
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(exist_ok=True)
+        data = gzip.compress(text.encode("utf-8"), mtime=0)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._size += len(data)
+            due = (
+                self._size > self.max_bytes
+                or time.monotonic() - self._last_gc > self.gc_interval
+            )
+        if due:
+            self.collect()
+        return ref
+
+    def get(self, ref: str) -> str:
+        """
+        Return the text stored under a reference.
+
+        Raises:
+            KeyError: If the reference is malformed or unknown
+        """
+        ref = ref.strip().lower()
+        if not _REF_RE.match(ref):
+            raise KeyError(ref)
+        path = self._path(ref)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            raise KeyError(ref) from None
+        return gzip.decompress(data).decode("utf-8")
+
+
+def summarize_result(text: str, ref: str, max_items: int = 3) -> str:
+    """
+    Shorten a formatted prospect listing to a summary referencing the full text.
+
+    Keeps the heading and notice lines and the first ``max_items`` entries,
+    without their contact detail lines.
+    """
+    kept: list[str] = []
+    items = 0
+    for line in text.splitlines():
+        if _ITEM_RE.match(line):
+            items += 1
+            if items <= max_items:
+                kept.append(line)
+        elif not line.startswith(" "):
+            kept.append(line)
+    while kept and not kept[-1]:
+        kept.pop()
+    if items > max_items:
+        note = f"{items - max_items} more prospects and all details are in result {ref}"
+    else:
+        note = f"All details are in result {ref}"
+    kept.append(f'\n{note}; call get_prospect_result(ref="{ref}") for the full list.')
+    return "\n".join(kept)
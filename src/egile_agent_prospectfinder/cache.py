@@ -0,0 +1,61 @@
+"""Small in-process TTL cache shared by the result cache and the enricher."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """LRU cache whose entries expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid; 0 disables the cache
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> V | None:
+        """Return the live entry for ``key``, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds this entry stays valid (default: the cache's ``ttl``)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
@@ -0,0 +1,150 @@
+"""Record/replay cassettes for deterministic search backends.
+
+A cassette is a JSON Lines file (gzip-compressed when the path ends in
+``.gz``) with one entry per search call::
+
+    {"b": "direct", "a": {"sector": "Marketing", ...}, "r": [...], "t": 0.812}
+
+``b`` is the backend that served the call, ``a`` the call arguments, ``r`` the
+response and ``t`` the upstream latency in seconds. In record mode every call
+is forwarded to the real backend and appended to the cassette; in replay mode
+calls are served from the cassette, either immediately or after sleeping for
+the recorded latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import IO, Any, cast
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return cast(IO[str], gzip.open(path, mode + "t", encoding="utf-8"))
+    return open(path, mode, encoding="utf-8")
+
+
+def _key(backend: str, arguments: dict[str, Any]) -> str:
+    return backend + "\0" + json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+
+
+class Cassette:
+    """
+    Records search calls to a cassette file or replays them from one.
+
+    Repeated calls with the same arguments are replayed in recorded order;
+    once exhausted, the last response for those arguments is served again.
+    """
+
+    def __init__(self, path: str | Path, mode: str = REPLAY, replay_latency: bool = False):
+        """
+        Initialize the cassette.
+
+        Args:
+            path: Cassette file path (``.gz`` for gzip compression)
+            mode: "record" to capture calls or "replay" to serve them back
+            replay_latency: In replay mode, sleep for the recorded latency
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        # Replay index; record mode only writes to the file so memory stays flat
+        self._entries: dict[str, list[tuple[Any, float]]] = defaultdict(list)
+        self._recorded = 0
+        self._cursors: dict[str, int] = defaultdict(int)
+        self._file: IO[str] | None = None
+
+        if mode == REPLAY:
+            self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        with _open(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries[_key(entry["b"], entry["a"])].append((entry["r"], entry["t"]))
+        logger.info("Loaded %d recorded calls from cassette %s", len(self), self.path)
+
+    def __len__(self) -> int:
+        """Number of calls loaded for replay or recorded so far."""
+        return self._recorded + sum(len(responses) for responses in self._entries.values())
+
+    async def call(
+        self,
+        backend: str,
+        arguments: dict[str, Any],
+        func: Callable[[], Awaitable[Any]] | None = None,
+    ) -> Any:
+        """
+        Record or replay a single backend call.
+
+        Args:
+            backend: Backend identifier (e.g. "direct" or "mcp")
+            arguments: JSON-serializable call arguments
+            func: Coroutine factory performing the real call (record mode only)
+
+        Returns:
+            The backend response
+
+        Raises:
+            CassetteMissError: If replaying a call that was never recorded
+        """
+        if self.mode == REPLAY:
+            return await self._replay(backend, arguments)
+
+        if func is None:
+            raise ValueError("func is required in record mode")
+        start = time.perf_counter()
+        response = await func()
+        self._append(backend, arguments, response, time.perf_counter() - start)
+        return response
+
+    async def _replay(self, backend: str, arguments: dict[str, Any]) -> Any:
+        key = _key(backend, arguments)
+        responses = self._entries.get(key)
+        if not responses:
+            raise CassetteMissError(f"No recorded {backend} response for {arguments}")
+        index = min(self._cursors[key], len(responses) - 1)
+        self._cursors[key] += 1
+        response, latency = responses[index]
+        if self.replay_latency and latency > 0:
+            await asyncio.sleep(latency)
+        return response
+
+    def _append(
+        self, backend: str, arguments: dict[str, Any], response: Any, latency: float
+    ) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = _open(self.path, "a")
+        entry = {"b": backend, "a": arguments, "r": response, "t": round(latency, 6)}
+        self._file.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+        self._file.flush()
+        self._recorded += 1
+
+    def close(self) -> None:
+        """Close the cassette file if it is open for recording."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
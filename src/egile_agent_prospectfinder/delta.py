@@ -0,0 +1,201 @@
+"""Incremental delta sweeps over recurring prospect searches.
+
+For each (sector, country) key the store keeps the set of prospect URLs seen
+so far, as 64-bit BLAKE2b hashes of their canonical form. Each key's hashes
+live in one append-only binary file, and in memory as a sorted ``array``
+(8 bytes per URL) plus a small set of recent additions that is merged in
+periodically. A JSON index records per-key watermarks (last sweep time and
+counts).
+
+``WatermarkStore`` reads and writes files, so async callers run its methods
+in a worker thread. Sweeps of one key are serialized, and index rewrites of
+all keys, so concurrent sweeps neither lose hashes nor interleave writes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import threading
+import time
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .fanout import canonical_url
+from .prospect import Prospect
+
+logger = logging.getLogger(__name__)
+
+_MERGE_THRESHOLD = 1024
+
+
+def url_hash(link: str) -> int:
+    """Return the 64-bit hash of a URL's canonical form."""
+    digest = hashlib.blake2b(canonical_url(link).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class SeenSet:
+    """Compact membership set of 64-bit URL hashes."""
+
+    __slots__ = ("_sorted", "_recent")
+
+    def __init__(self, hashes: Iterable[int] = ()):
+        self._sorted = array("Q", sorted(set(hashes)))
+        self._recent: set[int] = set()
+
+    def __contains__(self, value: int) -> bool:
+        if value in self._recent:
+            return True
+        i = bisect.bisect_left(self._sorted, value)
+        return i < len(self._sorted) and self._sorted[i] == value
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+    def add(self, value: int) -> bool:
+        """Add a hash; return False if it was already present."""
+        if value in self:
+            return False
+        self._recent.add(value)
+        if len(self._recent) >= _MERGE_THRESHOLD:
+            self._sorted = array("Q", sorted([*self._sorted, *self._recent]))
+            self._recent.clear()
+        return True
+
+
+@dataclass
+class Watermark:
+    """Progress of recurring sweeps for one (sector, country) key."""
+
+    last_sweep: float = 0.0
+    seen: int = 0
+    sweeps: int = 0
+
+
+@dataclass
+class DeltaResult:
+    """Outcome of filtering one sweep."""
+
+    new: list[Prospect]
+    already_seen: int
+    previous_sweep: float
+
+
+class WatermarkStore:
+    """Persistent per-(sector, country) record of already-seen prospect URLs."""
+
+    def __init__(self, directory: str | Path):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the hash files and watermark index
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.directory / "watermarks.json"
+        self._watermarks: dict[str, Watermark] = {}
+        self._sets: dict[str, SeenSet] = {}
+        self._lock = threading.Lock()  # Guards the dicts and the index file
+        self._key_locks: dict[str, threading.Lock] = {}
+        if self._index_path.exists():
+            raw = json.loads(self._index_path.read_text(encoding="utf-8"))
+            self._watermarks = {key: Watermark(**value) for key, value in raw.items()}
+
+    @staticmethod
+    def _key(key: tuple[str, str]) -> str:
+        return "|".join(key)
+
+    def _path(self, key: str) -> Path:
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+        return self.directory / f"{name}.seen"
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _load(self, key: str) -> SeenSet:
+        """Return a key's seen set, reading it on first use; hold the key's lock."""
+        seen = self._sets.get(key)
+        if seen is None:
+            hashes = array("Q")
+            path = self._path(key)
+            if path.exists():
+                hashes.frombytes(path.read_bytes())
+            seen = self._sets[key] = SeenSet(hashes)
+        return seen
+
+    def watermark(self, key: tuple[str, str]) -> Watermark | None:
+        """Return the watermark for a key, if it was swept before."""
+        with self._lock:
+            return self._watermarks.get(self._key(key))
+
+    def unseen(self, key: tuple[str, str], prospects: Iterable[Prospect]) -> list[Prospect]:
+        """Return the prospects not seen in earlier sweeps, without marking them."""
+        name = self._key(key)
+        with self._key_lock(name):
+            seen = self._load(name)
+            return [prospect for prospect in prospects if url_hash(prospect.link) not in seen]
+
+    def filter_new(self, key: tuple[str, str], prospects: Iterable[Prospect]) -> DeltaResult:
+        """
+        Keep only prospects not seen in earlier sweeps, and mark them seen.
+
+        Args:
+            key: Canonical (sector, country) key
+            prospects: Prospects returned by this sweep
+
+        Returns:
+            The new prospects and how many were already known
+        """
+        name = self._key(key)
+        with self._key_lock(name):
+            seen = self._load(name)
+            new: list[Prospect] = []
+            added = array("Q")
+            already_seen = 0
+            for prospect in prospects:
+                value = url_hash(prospect.link)
+                if seen.add(value):
+                    new.append(prospect)
+                    added.append(value)
+                else:
+                    already_seen += 1
+
+            if added:
+                with open(self._path(name), "ab") as f:
+                    added.tofile(f)
+            with self._lock:
+                watermark = self._watermarks.setdefault(name, Watermark())
+                previous_sweep = watermark.last_sweep
+                watermark.last_sweep = time.time()
+                watermark.seen = len(seen)
+                watermark.sweeps += 1
+                self._save_index()
+
+        logger.info("Delta sweep %s: %d new, %d already seen", key, len(new), already_seen)
+        return DeltaResult(new=new, already_seen=already_seen, previous_sweep=previous_sweep)
+
+    def reset(self, key: tuple[str, str]) -> None:
+        """Forget everything seen for a key."""
+        name = self._key(key)
+        with self._key_lock(name):
+            self._sets.pop(name, None)
+            self._path(name).unlink(missing_ok=True)
+            with self._lock:
+                self._watermarks.pop(name, None)
+                self._save_index()
+
+    def _save_index(self) -> None:
+        """Rewrite the watermark index; hold ``_lock``."""
+        tmp = self._index_path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({key: vars(mark) for key, mark in self._watermarks.items()}),
+            encoding="utf-8",
+        )
+        tmp.replace(self._index_path)
@@ -0,0 +1,283 @@
+"""Concurrent homepage enrichment of prospects.
+
+Fetches each prospect's homepage through a shared ``httpx.AsyncClient`` and
+extracts contact emails, phone numbers and the meta description. Fetches are
+bounded by a global concurrency limit and a minimum interval between requests
+to the same host, response bodies are capped, and results are cached per
+homepage. Links come from untrusted search results, so hosts that resolve to
+private, loopback or link-local addresses are refused, including as redirect
+targets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import ipaddress
+import logging
+import re
+import socket
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from urllib.parse import unquote, urlsplit
+
+import httpx
+
+from .cache import TTLCache
+from .prospect import Prospect
+
+logger = logging.getLogger(__name__)
+
+# Anchored at the start of a run so long alphanumeric runs (inline base64) scan once
+_EMAIL_RE = re.compile(r"(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_TEL_LINK_RE = re.compile(r'href=["\']tel:([^"\']+)["\']', re.I)
+_PHONE_RE = re.compile(r"(?<![\w+])(?:\+|00)\d[\d\s().-]{7,16}\d(?!\w)")
+_META_RE = re.compile(r"<meta\b[^>]*>", re.I)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+# File-like matches such as "logo@2x.png" are not addresses
+_ASSET_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".css", ".js")
+MAX_REDIRECTS = 5
+
+
+class BlockedHostError(ValueError):
+    """Raised for homepages on hosts that resolve to non-public addresses."""
+
+
+@dataclass(slots=True)
+class Enrichment:
+    """Contact details extracted from a prospect's homepage."""
+
+    emails: tuple[str, ...] = ()
+    phones: tuple[str, ...] = ()
+    description: str = ""
+    error: str = ""
+
+
+def homepage_url(link: str) -> str | None:
+    """Return the homepage (scheme and host) of a result link."""
+    parts = urlsplit(link)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}/"
+
+
+def is_public_address(address: str) -> bool:
+    """Check whether an IP address is globally routable (not private, loopback, ...)."""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def extract_contacts(page: str, max_items: int = 5) -> Enrichment:
+    """
+    Extract emails, phone numbers and the meta description from an HTML page.
+
+    Args:
+        page: HTML text
+        max_items: Maximum number of emails and of phone numbers to keep
+
+    Returns:
+        The extracted details
+    """
+    text = html.unescape(unquote(page))
+
+    emails: dict[str, None] = {}
+    for email in _EMAIL_RE.findall(text):
+        email = email.lower().rstrip(".")
+        if not email.endswith(_ASSET_SUFFIXES):
+            emails.setdefault(email)
+
+    phones: dict[str, None] = {}
+    for phone in _TEL_LINK_RE.findall(page) + _PHONE_RE.findall(text):
+        normalized = re.sub(r"[^\d+]", "", phone)
+        if len(normalized.lstrip("+")) >= 8:
+            phones.setdefault(normalized)
+
+    description = ""
+    for tag in _META_RE.findall(page):
+        attrs = {name.lower(): a or b for name, a, b in _ATTR_RE.findall(tag)}
+        if attrs.get("name", attrs.get("property", "")).lower() in (
+            "description",
+            "og:description",
+        ) and attrs.get("content"):
+            description = " ".join(html.unescape(attrs["content"]).split())
+            break
+
+    return Enrichment(
+        emails=tuple(list(emails)[:max_items]),
+        phones=tuple(list(phones)[:max_items]),
+        description=description,
+    )
+
+
+class ProspectEnricher:
+    """Fetches and caches homepage enrichment for prospects."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        max_concurrency: int = 10,
+        per_domain_interval: float = 1.0,
+        max_bytes: int = 256 * 1024,
+        timeout: float = 10.0,
+        cache_ttl: float = 24 * 3600,
+        cache_size: int = 4096,
+        allow_private_hosts: bool = False,
+    ):
+        """
+        Initialize the enricher.
+
+        Args:
+            client: Shared HTTP client used for all fetches
+            max_concurrency: Maximum homepage fetches in flight
+            per_domain_interval: Minimum seconds between requests to one host
+            max_bytes: Maximum response bytes read per page
+            timeout: Per-page timeout in seconds
+            cache_ttl: Seconds an enrichment result stays cached
+            cache_size: Maximum number of cached homepages
+            allow_private_hosts: Also fetch hosts that resolve to private, loopback
+                or link-local addresses (for tests and trusted networks only)
+        """
+        self.client = client
+        self.per_domain_interval = per_domain_interval
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.allow_private_hosts = allow_private_hosts
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._domain_locks: dict[str, asyncio.Lock] = {}
+        self._domain_last: dict[str, float] = {}
+        self._cache: TTLCache[Enrichment] = TTLCache(cache_ttl, cache_size)
+        self._inflight: dict[str, asyncio.Future[Enrichment]] = {}
+
+    async def enrich(self, prospects: Iterable[Prospect]) -> dict[str, Enrichment]:
+        """
+        Enrich prospects concurrently.
+
+        Args:
+            prospects: Prospects to enrich
+
+        Returns:
+            Mapping of prospect link to its enrichment
+        """
+        links = [p.link for p in prospects if homepage_url(p.link)]
+        results = await asyncio.gather(
+            *(self.enrich_url(link) for link in links), return_exceptions=True
+        )
+        # One bad homepage must not fail the whole search
+        return {
+            link: result if isinstance(result, Enrichment)
+            else Enrichment(error=type(result).__name__)
+            for link, result in zip(links, results)
+        }
+
+    def peek(self, link: str) -> Enrichment | None:
+        """Return the cached enrichment of a link without fetching, or None."""
+        url = homepage_url(link)
+        return self._cache.get(url) if url else None
+
+    async def enrich_url(self, link: str) -> Enrichment:
+        """Enrich a single link, sharing cached and in-flight fetches of its homepage."""
+        url = homepage_url(link)
+        if url is None:
+            return Enrichment(error="unsupported URL")
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(url)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[Enrichment] = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            result = await self._fetch(url)
+            self._store(url, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._inflight[url]
+
+    def _store(self, url: str, result: Enrichment) -> None:
+        # Failures are cached too, but only briefly
+        ttl = self.cache_ttl if not result.error else min(self.cache_ttl, 300.0)
+        self._cache.put(url, result, ttl)
+        self._prune_domains()
+
+    def _prune_domains(self) -> None:
+        """Forget hosts whose politeness interval has passed and that nobody is waiting on."""
+        cutoff = time.monotonic() - self.per_domain_interval
+        for host, lock in list(self._domain_locks.items()):
+            if not lock.locked() and self._domain_last.get(host, 0.0) <= cutoff:
+                del self._domain_locks[host]
+                self._domain_last.pop(host, None)
+
+    async def _wait_for_domain(self, host: str) -> None:
+        """Space out request starts to the same host by ``per_domain_interval``."""
+        lock = self._domain_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._domain_last.get(host, 0.0) + self.per_domain_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._domain_last[host] = time.monotonic()
+
+    async def _fetch(self, url: str) -> Enrichment:
+        host = urlsplit(url).netloc.lower()
+        await self._wait_for_domain(host)
+        async with self._semaphore:
+            try:
+                page = await asyncio.wait_for(self._read_capped(url), timeout=self.timeout)
+            except Exception as e:
+                logger.debug("Enrichment fetch failed for %s: %s: %s", url, type(e).__name__, e)
+                return Enrichment(error=type(e).__name__)
+        return extract_contacts(page)
+
+    async def _check_host(self, url: str) -> None:
+        """
+        Refuse URLs whose host resolves to a non-public address.
+
+        The check resolves the name separately from the connection, so it does
+        not stop a DNS server that answers differently the second time.
+        """
+        if self.allow_private_hosts:
+            return
+        parts = urlsplit(url)
+        if not parts.hostname:
+            raise BlockedHostError(f"No host in {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            parts.hostname, port, type=socket.SOCK_STREAM
+        )
+        for *_, sockaddr in infos:
+            if not is_public_address(str(sockaddr[0])):
+                raise BlockedHostError(f"{parts.hostname} resolves to non-public {sockaddr[0]}")
+
+    async def _read_capped(self, url: str) -> str:
+        """GET ``url`` and return at most ``max_bytes`` of its body as text."""
+        # Redirects are followed by hand so every hop's host is checked
+        for _ in range(MAX_REDIRECTS + 1):
+            await self._check_host(url)
+            async with self.client.stream("GET", url, follow_redirects=False) as response:
+                if response.next_request is not None:
+                    url = str(response.next_request.url)
+                    continue
+                response.raise_for_status()
+                chunks: list[bytes] = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_bytes:
+                        break
+                body = b"".join(chunks)[: self.max_bytes]
+                return body.decode(response.encoding or "utf-8", errors="replace")
+        raise httpx.TooManyRedirects(f"More than {MAX_REDIRECTS} redirects from {url}")
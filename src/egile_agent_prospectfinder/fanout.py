@@ -0,0 +1,172 @@
+"""Concurrent multi-provider search with first-k merging."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import httpx
+
+from .prospect import Prospect
+from .providers import SearchProvider
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_url(link: str) -> str:
+    """
+    Normalize a result URL for deduplication.
+
+    Scheme, ``www.`` prefix, default ports, query fragments and trailing
+    slashes are ignored so the same company page found by different engines
+    collapses to one key.
+    """
+    parts = urlsplit(link.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/")
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+
+@dataclass
+class FanOutResult:
+    """Merged results of a fan-out search."""
+
+    results: list[Prospect] = field(default_factory=list)
+    completed: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    cancelled: list[str] = field(default_factory=list)
+    timed_out: bool = False
+
+
+async def fan_out_search(
+    providers: list[SearchProvider],
+    client: httpx.AsyncClient,
+    sector: str,
+    country: str,
+    limit: int,
+    deadline: float = 10.0,
+    outcome: FanOutResult | None = None,
+) -> FanOutResult:
+    """
+    Query several providers concurrently and merge their results.
+
+    Results are deduplicated by canonical URL as each provider answers. The
+    search returns as soon as ``limit`` unique results are collected or the
+    deadline passes; providers still running at that point are cancelled.
+
+    Args:
+        providers: Providers to query
+        client: Shared HTTP client
+        sector: Business sector to search for
+        country: Country to search in
+        limit: Number of unique results wanted
+        deadline: Maximum time to wait in seconds
+        outcome: Result to fill in place, so callers can read partial progress
+
+    Returns:
+        FanOutResult with up to ``limit`` results, in arrival order
+    """
+    outcome = outcome if outcome is not None else FanOutResult()
+    seen: set[str] = set()
+    tasks = {
+        asyncio.create_task(provider.search(client, sector, country, limit)): provider.name
+        for provider in providers
+    }
+    pending = set(tasks)
+    expires = time.monotonic() + deadline
+
+    try:
+        while pending and len(outcome.results) < limit:
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                outcome.timed_out = True
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                name = tasks[task]
+                try:
+                    results = task.result()
+                except Exception as e:
+                    logger.warning("Search provider %s failed: %s: %s", name, type(e).__name__, e)
+                    outcome.failed.append(name)
+                    continue
+                outcome.completed.append(name)
+                for result in results:
+                    key = canonical_url(result.link)
+                    if key and key not in seen:
+                        seen.add(key)
+                        outcome.results.append(result)
+    finally:
+        for task in pending:
+            task.cancel()
+            outcome.cancelled.append(tasks[task])
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    del outcome.results[limit:]
+    logger.info(
+        "Fan-out search: %d results from %s, cancelled=%s, failed=%s",
+        len(outcome.results), outcome.completed, outcome.cancelled, outcome.failed,
+    )
+    return outcome
+
+
+async def search_in_order(
+    providers: list[SearchProvider],
+    client: httpx.AsyncClient,
+    sector: str,
+    country: str,
+    limit: int,
+    outcome: FanOutResult | None = None,
+) -> FanOutResult:
+    """
+    Query providers one after another until ``limit`` unique results are found.
+
+    This is the order-of-preference strategy of ``SearchService`` (API-backed
+    engines first, DuckDuckGo as the keyless fallback): later providers are
+    only queried when earlier ones fail or come up short.
+
+    Args:
+        providers: Providers in order of preference
+        client: Shared HTTP client
+        sector: Business sector to search for
+        country: Country to search in
+        limit: Number of unique results wanted
+        outcome: Result to fill in place, so callers can read partial progress
+
+    Returns:
+        FanOutResult with up to ``limit`` results, in provider order
+    """
+    outcome = outcome if outcome is not None else FanOutResult()
+    seen: set[str] = set()
+    for provider in providers:
+        if len(outcome.results) >= limit:
+            break
+        try:
+            results = await provider.search(client, sector, country, limit - len(outcome.results))
+        except Exception as e:
+            logger.warning(
+                "Search provider %s failed: %s: %s", provider.name, type(e).__name__, e
+            )
+            outcome.failed.append(provider.name)
+            continue
+        outcome.completed.append(provider.name)
+        for result in results:
+            key = canonical_url(result.link)
+            if key and key not in seen:
+                seen.add(key)
+                outcome.results.append(result)
+
+    del outcome.results[limit:]
+    logger.debug(
+        "In-order search: %d results from %s, failed=%s",
+        len(outcome.results), outcome.completed, outcome.failed,
+    )
+    return outcome
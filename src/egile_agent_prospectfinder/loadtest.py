@@ -0,0 +1,471 @@
+"""End-to-end load test for the ProspectFinder AgentOS.
+
+Runs the same AgentOS that ``create_prospectfinder_agent_os`` builds, but with
+a deterministic stub model and a stub search backend so that no API keys or
+network access are needed. The stub model is an OpenAI-compatible chat
+completions endpoint that always answers a user message with a
+``find_prospects`` tool call and then a short summary once the tool result is
+back. The OpenAI model class picks it up through ``OPENAI_BASE_URL``.
+
+Usage:
+    prospectfinder-loadtest --sessions 20 --requests 5
+    prospectfinder-loadtest --sessions 50 --no-stream --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .logging_config import configure_logging_from_env
+
+logger = logging.getLogger(__name__)
+
+STUB_SECTORS = ["Marketing", "Construction", "Technology", "Healthcare", "Finance"]
+STUB_COUNTRIES = ["Belgium", "France", "Netherlands", "Germany"]
+
+
+class StubSearchService:
+    """Deterministic in-memory stand-in for ``SearchService``."""
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initialize the stub search service.
+
+        Args:
+            latency: Simulated upstream latency in seconds per search
+        """
+        self.latency = latency
+
+    def search_prospects(self, sector: str, country: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Return ``limit`` synthetic prospects for the sector and country."""
+        if self.latency:
+            time.sleep(self.latency)
+        slug = f"{sector}-{country}".lower().replace(" ", "-")
+        return [
+            {
+                "title": f"{sector} Company {i} ({country})",
+                "link": f"https://{slug}-{i}.example.com",
+                "snippet": f"Synthetic {sector.lower()} prospect number {i} in {country}.",
+            }
+            for i in range(1, limit + 1)
+        ]
+
+
+def _stub_tool_arguments(prompt: str) -> dict[str, Any]:
+    """Pick deterministic find_prospects arguments for a user prompt."""
+    digest = hashlib.sha1(prompt.encode("utf-8")).digest()
+    return {
+        "sector": STUB_SECTORS[digest[0] % len(STUB_SECTORS)],
+        "country": STUB_COUNTRIES[digest[1] % len(STUB_COUNTRIES)],
+        "limit": 10,
+    }
+
+
+class _StubModelHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible ``/chat/completions`` handler that always calls find_prospects."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Silence per-request access logs."""
+
+    def do_POST(self) -> None:  # noqa: N802
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get("Content-Length", "0"))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        messages = body.get("messages", [])
+        last = messages[-1] if messages else {}
+
+        if last.get("role") == "tool":
+            message: dict[str, Any] = {
+                "role": "assistant",
+                "content": "Here are the prospects I found.",
+            }
+            finish_reason = "stop"
+        else:
+            prompt = last.get("content") or ""
+            if not isinstance(prompt, str):
+                prompt = json.dumps(prompt, sort_keys=True)
+            message = {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{uuid.uuid4().hex[:12]}",
+                        "type": "function",
+                        "function": {
+                            "name": "find_prospects",
+                            "arguments": json.dumps(_stub_tool_arguments(prompt)),
+                        },
+                    }
+                ],
+            }
+            finish_reason = "tool_calls"
+
+        if body.get("stream"):
+            self._send_stream(body.get("model", "stub"), message, finish_reason)
+        else:
+            self._send_json(
+                {
+                    "id": f"chatcmpl-{uuid.uuid4().hex}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "stub"),
+                    "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }
+            )
+
+    def _send_json(self, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, model: str, message: dict[str, Any], finish_reason: str) -> None:
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        delta: dict[str, Any] = {"role": "assistant"}
+        if message.get("tool_calls"):
+            delta["tool_calls"] = [
+                dict(call, index=i) for i, call in enumerate(message["tool_calls"])
+            ]
+        else:
+            delta["content"] = message["content"]
+
+        chunks = [
+            {"index": 0, "delta": delta, "finish_reason": None},
+            {"index": 0, "delta": {}, "finish_reason": finish_reason},
+        ]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for choice in chunks:
+            event = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [choice],
+            }
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+
+def start_stub_model_server(host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start the stub model server in a daemon thread and return it."""
+    server = ThreadingHTTPServer((host, port), _StubModelHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-model", daemon=True).start()
+    return server
+
+
+def serve(
+    host: str,
+    port: int,
+    search_latency: float,
+    cassette: str | None = None,
+    replay_latency: bool = False,
+) -> None:
+    """Run the AgentOS app against the stub model and a stub or replayed search backend."""
+    import uvicorn
+
+    model_server = start_stub_model_server()
+    model_port = model_server.server_address[1]
+
+    # Force the OpenAI model onto the stub endpoint
+    for key in ("MISTRAL_API_KEY", "XAI_API_KEY"):
+        os.environ.pop(key, None)
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{model_port}/v1"
+    os.environ["OPENAI_MODEL"] = "stub-model"
+
+    from .plugin import ProspectFinderPlugin
+    from .run_server import create_prospectfinder_agent_os
+
+    if cassette:
+        plugin = ProspectFinderPlugin(
+            cassette_path=cassette, cassette_mode="replay", replay_latency=replay_latency
+        )
+    else:
+        plugin = ProspectFinderPlugin(search_service=StubSearchService(latency=search_latency))
+    agent_os = create_prospectfinder_agent_os(plugin=plugin)
+    uvicorn.run(agent_os.get_app(), host=host, port=port, log_level="warning")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def read_rss(pid: int) -> int | None:
+    """Return the resident set size of a process in bytes, if it can be read."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+    try:
+        rss: int = psutil.Process(pid).memory_info().rss
+        return rss
+    except psutil.Error:
+        return None
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def _run_session(
+    client: Any,
+    url: str,
+    requests_per_session: int,
+    stream: bool,
+    latencies: list[float],
+    first_chunks: list[float],
+    errors: list[str],
+) -> None:
+    session_id = str(uuid.uuid4())
+    for i in range(requests_per_session):
+        sector = STUB_SECTORS[i % len(STUB_SECTORS)]
+        data = {
+            "message": f"Find {sector} prospects (request {i})",
+            "stream": "true" if stream else "false",
+            "session_id": session_id,
+            "user_id": "loadtest",
+        }
+        start = time.perf_counter()
+        try:
+            if stream:
+                async with client.stream("POST", url, data=data) as response:
+                    response.raise_for_status()
+                    first = None
+                    async for chunk in response.aiter_bytes():
+                        if first is None and chunk:
+                            first = time.perf_counter() - start
+                    if first is not None:
+                        first_chunks.append(first)
+            else:
+                response = await client.post(url, data=data)
+                response.raise_for_status()
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+async def drive(
+    base_url: str,
+    agent_id: str,
+    sessions: int,
+    requests_per_session: int,
+    stream: bool,
+    server_pid: int | None = None,
+) -> dict[str, Any]:
+    """
+    Drive the AgentOS run endpoint with concurrent sessions.
+
+    Args:
+        base_url: AgentOS base URL
+        agent_id: Agent to run
+        sessions: Number of concurrent sessions
+        requests_per_session: Sequential requests issued by each session
+        stream: Whether to request streaming responses
+        server_pid: Server process to sample RSS from
+
+    Returns:
+        Report with throughput, latency percentiles and RSS figures
+    """
+    import httpx
+
+    url = f"{base_url}/agents/{agent_id}/runs"
+    latencies: list[float] = []
+    first_chunks: list[float] = []
+    errors: list[str] = []
+    rss_samples: list[int] = []
+    done = asyncio.Event()
+
+    async def sample_rss() -> None:
+        while not done.is_set() and server_pid is not None:
+            rss = read_rss(server_pid)
+            if rss is not None:
+                rss_samples.append(rss)
+            try:
+                await asyncio.wait_for(done.wait(), timeout=0.25)
+            except asyncio.TimeoutError:
+                pass
+
+    rss_before = read_rss(server_pid) if server_pid is not None else None
+    limits = httpx.Limits(max_connections=sessions, max_keepalive_connections=sessions)
+    async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+        sampler = asyncio.create_task(sample_rss())
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                _run_session(
+                    client, url, requests_per_session, stream, latencies, first_chunks, errors
+                )
+                for _ in range(sessions)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        done.set()
+        await sampler
+
+    return {
+        "sessions": sessions,
+        "requests": sessions * requests_per_session,
+        "completed": len(latencies),
+        "errors": len(errors),
+        "sample_errors": errors[:5],
+        "elapsed_s": elapsed,
+        "requests_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_p50_ms": percentile(latencies, 50) * 1000,
+        "latency_p99_ms": percentile(latencies, 99) * 1000,
+        "ttfc_p50_ms": percentile(first_chunks, 50) * 1000 if stream else None,
+        "ttfc_p99_ms": percentile(first_chunks, 99) * 1000 if stream else None,
+        "rss_before_mb": rss_before / 2**20 if rss_before else None,
+        "rss_peak_mb": max(rss_samples) / 2**20 if rss_samples else None,
+    }
+
+
+async def _wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"AgentOS server exited with code {process.returncode}")
+            try:
+                await client.get(f"{base_url}/health")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise TimeoutError(f"AgentOS server not ready after {timeout}s")
+
+
+def _format_report(report: dict[str, Any]) -> str:
+    def fmt(value: float | None, unit: str) -> str:
+        return "n/a" if value is None else f"{value:.1f}{unit}"
+
+    lines = [
+        "=" * 60,
+        "ProspectFinder load test",
+        "=" * 60,
+        f"Sessions:        {report['sessions']}",
+        f"Requests:        {report['completed']}/{report['requests']} ok, "
+        f"{report['errors']} errors",
+        f"Throughput:      {report['requests_per_s']:.2f} req/s",
+        f"Latency p50/p99: {fmt(report['latency_p50_ms'], 'ms')} / "
+        f"{fmt(report['latency_p99_ms'], 'ms')}",
+        f"TTFC p50/p99:    {fmt(report['ttfc_p50_ms'], 'ms')} / {fmt(report['ttfc_p99_ms'], 'ms')}",
+        f"Server RSS:      {fmt(report['rss_before_mb'], 'MB')} idle, "
+        f"{fmt(report['rss_peak_mb'], 'MB')} peak",
+    ]
+    for error in report["sample_errors"]:
+        lines.append(f"  error: {error}")
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for ``prospectfinder-loadtest``."""
+    parser = argparse.ArgumentParser(description="Load test the ProspectFinder AgentOS offline")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--requests", type=int, default=5, help="Requests per session")
+    parser.add_argument("--no-stream", action="store_true", help="Use non-streaming runs")
+    parser.add_argument("--agent-id", default="prospectfinder", help="Agent to drive")
+    parser.add_argument("--port", type=int, default=0, help="AgentOS port (default: free port)")
+    parser.add_argument(
+        "--search-latency", type=float, default=0.0, help="Simulated search latency in seconds"
+    )
+    parser.add_argument("--cassette", help="Replay searches from a recorded cassette")
+    parser.add_argument(
+        "--replay-latency", action="store_true", help="Reproduce recorded search latency"
+    )
+    parser.add_argument(
+        "--url", help="Drive an already running AgentOS instead of starting one (no RSS)"
+    )
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    configure_logging_from_env("json" if args.serve else "text")
+
+    if args.serve:
+        serve("127.0.0.1", args.port, args.search_latency, args.cassette, args.replay_latency)
+        return
+
+    process: subprocess.Popen | None = None
+    base_url = args.url
+    try:
+        if base_url is None:
+            port = args.port or _free_port()
+            base_url = f"http://127.0.0.1:{port}"
+            logger.info("Starting AgentOS with stub model on %s...", base_url)
+            command = [
+                sys.executable, "-m", "egile_agent_prospectfinder.loadtest", "--serve",
+                "--port", str(port), "--search-latency", str(args.search_latency),
+            ]
+            if args.cassette:
+                command += ["--cassette", args.cassette]
+            if args.replay_latency:
+                command.append("--replay-latency")
+            process = subprocess.Popen(command)
+            asyncio.run(_wait_until_ready(base_url, process, args.startup_timeout))
+
+        logger.info("Running %d sessions x %d requests...", args.sessions, args.requests)
+        report = asyncio.run(
+            drive(
+                base_url,
+                args.agent_id,
+                args.sessions,
+                args.requests,
+                stream=not args.no_stream,
+                server_pid=process.pid if process else None,
+            )
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(json.dumps(report, indent=2) if args.json else _format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Queue-based structured logging for the server process.
+
+Log calls on the event loop only create a record and put it on an in-memory
+queue. A ``QueueListener`` thread does the expensive work: %-style message
+formatting, JSON encoding and the blocking write to stderr. Hot-path INFO and
+DEBUG messages are rate limited per message template before they are queued.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import IO, Any
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as one JSON object per line, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most ``burst`` records per message template every ``period`` seconds.
+
+    Records are keyed by logger name and unformatted message, so every call
+    site is limited on its own. WARNING and above always pass. The number of
+    records dropped since the last one that passed is added to it as
+    ``suppressed``. Windows idle for ``idle_periods`` periods are forgotten.
+    Loggers in ``exempt`` (and their children) are never limited: uvicorn's
+    access log uses one template for every request, so limiting it would
+    drop requests beyond ``burst`` per second.
+    """
+
+    def __init__(
+        self,
+        burst: int = 10,
+        period: float = 1.0,
+        idle_periods: int = 60,
+        exempt: tuple[str, ...] = ("uvicorn.access",),
+    ):
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self.idle_periods = idle_periods
+        self.exempt = exempt
+        self._windows: dict[tuple[str, Any], list[float]] = {}
+        self._next_prune = 0.0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Drop expired windows; keep those still owing a ``suppressed`` count a while longer."""
+        for key, (start, _, suppressed) in list(self._windows.items()):
+            idle = now - start
+            if idle >= self.period * self.idle_periods or (idle >= self.period and not suppressed):
+                del self._windows[key]
+        self._next_prune = now + self.period
+
+    def _is_exempt(self, name: str) -> bool:
+        return any(name == logger or name.startswith(logger + ".") for logger in self.exempt)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self._is_exempt(record.name):
+            return True
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        with self._lock:
+            if now >= self._next_prune:
+                self._prune(now)
+            # [window start, records passed, records suppressed]
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                suppressed = 0
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock handler formats each record on the calling thread before
+    queuing it. This one queues the record as is, so ``%`` arguments are only
+    rendered, off the event loop, if the record is emitted.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """QueueListener whose ``stop`` may be called again, e.g. at exit after a manual stop."""
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+def configure_logging_from_env(
+    default_format: str = "json",
+) -> logging.handlers.QueueListener | None:
+    """
+    Configure logging from ``LOG_LEVEL``, ``LOG_FORMAT`` and ``LOG_RATE_LIMIT``.
+
+    Meant for process entry points only; importing the package never
+    configures logging.
+
+    Args:
+        default_format: "json" or "text" when ``LOG_FORMAT`` is not set
+    """
+    return configure_logging(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        json_format=os.getenv("LOG_FORMAT", default_format) != "text",
+        burst=int(os.getenv("LOG_RATE_LIMIT", "10")),
+    )
+
+
+def configure_logging(
+    level: int | str = logging.INFO,
+    json_format: bool = True,
+    stream: IO[str] | None = None,
+    burst: int = 10,
+    period: float = 1.0,
+    force: bool = False,
+) -> logging.handlers.QueueListener | None:
+    """
+    Route all logging through a queue to a background writer thread.
+
+    Like ``logging.basicConfig``, does nothing if the root logger already has
+    handlers, unless ``force`` is set. The listener is stopped, flushing
+    queued records, at interpreter exit.
+
+    Args:
+        level: Root logger level
+        json_format: Write JSON lines; otherwise the classic text format
+        stream: Output stream (default: stderr)
+        burst: Records per message template allowed every ``period`` seconds
+            below WARNING; 0 disables rate limiting
+        period: Rate limiting window in seconds
+        force: Replace existing root handlers
+
+    Returns:
+        The running QueueListener, or None if logging was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers and not force:
+        return None
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = DeferredQueueHandler(log_queue)
+    if burst > 0:
+        handler.addFilter(RateLimitFilter(burst, period))
+
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    listener = _QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -2,22 +2,286 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import concurrent.futures
 import logging
-from typing import Any, Optional
-from contextlib import AsyncExitStack
+import tempfile
+import threading
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import IO, Any
 
+import anyio
+import httpx
 from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
 from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+from mcp.server.fastmcp import FastMCP
+
+try:
+    from mcp.client.streamable_http import streamable_http_client
+except ImportError:  # mcp releases that only ship the factory-based client
+    streamable_http_client = None  # type: ignore[assignment]
+    from mcp.client.streamable_http import streamablehttp_client
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits of the client shared by streamable HTTP connections
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+
+
+@dataclass
+class _LoopPool:
+    client: httpx.AsyncClient
+    borrowers: int = 0
+
+
+# One pooled client per event loop: httpx clients cannot be used across loops
+_shared_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_pool() -> _LoopPool:
+    loop = asyncio.get_running_loop()
+    pool = _shared_pools.get(loop)
+    if pool is None or pool.client.is_closed:
+        # Same timeouts as the MCP SDK defaults: long reads for server streams
+        client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, read=300.0), limits=HTTP_POOL_LIMITS)
+        pool = _shared_pools[loop] = _LoopPool(client)
+    return pool
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the running event loop's pooled HTTP client, creating it on first use."""
+    return _loop_pool().client
+
+
+async def close_shared_http_client() -> None:
+    """Close the running event loop's pooled HTTP client."""
+    pool = _shared_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.client.aclose()
+
+
+@asynccontextmanager
+async def _borrow_shared_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Lend the loop's pooled client; the last borrower to return it closes it."""
+    loop = asyncio.get_running_loop()
+    pool = _loop_pool()
+    pool.borrowers += 1
+    try:
+        yield pool.client
+    finally:
+        pool.borrowers -= 1
+        if pool.borrowers == 0 and _shared_pools.get(loop) is pool:
+            del _shared_pools[loop]
+            await pool.client.aclose()
+
+
+class _BorrowedHttpClient:
+    """Context manager handing out a shared client without closing it on exit."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def __aenter__(self) -> _BorrowedHttpClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+
+def _streamable_http_transport(url: str, client: httpx.AsyncClient) -> Any:
+    """Open a streamable HTTP transport on an externally owned HTTP client."""
+    if streamable_http_client is not None:
+        return streamable_http_client(url, http_client=client)
+    # The factory-based client closes whatever the factory returns
+    return streamablehttp_client(
+        url, httpx_client_factory=lambda **kwargs: _BorrowedHttpClient(client)
+    )
+
+
+async def _relay(source: Any, target: Any, target_loop: asyncio.AbstractEventLoop) -> None:
+    """Forward messages from a memory stream to a stream owned by another event loop."""
+    try:
+        async with source:
+            async for message in source:
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(target.send(message), target_loop)
+                )
+    except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+        pass  # The other side went away
+    finally:
+        if not target_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(target.aclose(), target_loop)
+
+
+@asynccontextmanager
+async def _serve_on_thread(server: Any) -> AsyncIterator[tuple[Any, Any]]:
+    """
+    Run an MCP server on a dedicated thread with its own event loop.
+
+    Yields the client's (read, write) memory streams; messages are relayed
+    between the two loops. FastMCP runs synchronous tools inline on its loop,
+    so hosting it on the caller's loop would let a blocking tool stall every
+    other coroutine and defeat timeouts and deadlines.
+    """
+    if isinstance(server, FastMCP):
+        server = server._mcp_server
+    client_loop = asyncio.get_running_loop()
+    server_loop = asyncio.new_event_loop()
+    to_client, client_read = anyio.create_memory_object_stream[Any](1)
+    client_write, from_client = anyio.create_memory_object_stream[Any](1)
+    inbox: concurrent.futures.Future[Any] = concurrent.futures.Future()
+
+    async def serve() -> None:
+        server_inbox, server_read = anyio.create_memory_object_stream[Any](1)
+        server_write, outbox = anyio.create_memory_object_stream[Any](1)
+        inbox.set_result(server_inbox)
+        async with server_read, server_write, anyio.create_task_group() as tg:
+            tg.start_soon(_relay, outbox, to_client, client_loop)
+            await server.run(server_read, server_write, server.create_initialization_options())
+            tg.cancel_scope.cancel()
+
+    serving = server_loop.create_task(serve())
+
+    def run() -> None:
+        try:
+            server_loop.run_until_complete(serving)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            if not inbox.done():
+                inbox.set_exception(e)
+            logger.exception("In-process MCP server failed")
+        finally:
+            server_loop.close()
+
+    thread = threading.Thread(target=run, name="mcp-inprocess", daemon=True)
+    thread.start()
+    pump: asyncio.Task[None] | None = None
+    try:
+        server_inbox = await asyncio.wrap_future(inbox)
+        pump = asyncio.create_task(_relay(from_client, server_inbox, server_loop))
+        async with client_read, client_write:
+            yield client_read, client_write
+    finally:
+        if pump is not None:
+            pump.cancel()
+            await asyncio.gather(pump, return_exceptions=True)
+        if not server_loop.is_closed():
+            try:
+                server_loop.call_soon_threadsafe(serving.cancel)
+            except RuntimeError:
+                pass  # Closed since the check
+        await asyncio.to_thread(thread.join)
+        await to_client.aclose()
+        await from_client.aclose()
+
+
+# Text results above this many characters are spooled out of memory by default
+DEFAULT_SPOOL_THRESHOLD = 1024 * 1024
+
+
+@dataclass
+class ToolResult:
+    """
+    Result of an MCP tool call with structured content preserved.
+
+    ``structured`` holds the server's structured JSON output (if any) and
+    ``content`` the remaining content blocks. When the text blocks were too
+    large to keep in memory they live in ``spool`` instead and are read back
+    with ``text()`` or ``iter_text()``. ``size`` is the text length in
+    characters either way.
+    """
+
+    structured: dict[str, Any] | None = None
+    content: list[Any] = field(default_factory=list)
+    is_error: bool = False
+    spool: IO[bytes] | None = None
+    size: int = 0
+
+    @property
+    def spooled(self) -> bool:
+        """Whether the text content was moved to a spool."""
+        return self.spool is not None
+
+    def _spool_text_blocks(self, max_memory: int) -> None:
+        """Move text blocks into a temporary file, keeping other blocks in place."""
+        spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        remaining = []
+        size = 0
+        first = True
+        for item in self.content:
+            text = getattr(item, 'text', None)
+            if not isinstance(text, str):
+                remaining.append(item)
+                continue
+            if not first:
+                spool.write(b'\n')
+                size += 1
+            spool.write(text.encode('utf-8'))
+            size += len(text)
+            first = False
+        self.size = size
+        spool.seek(0)
+        self.spool = spool
+        self.content = remaining
+
+    def text(self) -> str:
+        """Return the text content joined into a single string."""
+        if self.spool is not None:
+            self.spool.seek(0)
+            return self.spool.read().decode('utf-8')
+        return '\n'.join(
+            item.text for item in self.content if isinstance(getattr(item, 'text', None), str)
+        )
+
+    def iter_text(self, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield the text content in chunks without materializing it at once."""
+        if self.spool is None:
+            yield self.text()
+            return
+        self.spool.seek(0)
+        # Incremental decoding keeps multi-byte characters intact across chunks
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while chunk := self.spool.read(chunk_size):
+            yield decoder.decode(chunk)
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+    def iter_lines(self, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """Yield the text content line by line, without line endings, from ``iter_text``."""
+        pending = ""
+        for chunk in self.iter_text(chunk_size):
+            *lines, pending = (pending + chunk).split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        if pending:
+            yield pending.rstrip("\r")
+
+    def close(self) -> None:
+        """Release the spool, if any."""
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
+
 
 class MCPClient:
     """
     MCP client for communicating with the ProspectFinder MCP server.
     
-    Supports both stdio (recommended) and SSE transports.
+    Supports stdio (recommended), SSE, streamable HTTP and in-process transports.
     """
 
     def __init__(
@@ -25,27 +289,37 @@ class MCPClient:
         transport: str = "stdio",
         host: str = "localhost",
         port: int = 8000,
-        command: Optional[str] = None,
+        command: str | None = None,
         timeout: float = 30.0,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        server: Any | None = None,
     ):
         """
         Initialize the MCP client.
 
         Args:
-            transport: Transport mode - "stdio" (recommended) or "sse"
-            host: Server host (for SSE transport)
-            port: Server port (for SSE transport)
+            transport: Transport mode - "stdio" (recommended), "sse", "streamable-http"
+                or "inprocess"
+            host: Server host (for SSE and streamable HTTP transports)
+            port: Server port (for SSE and streamable HTTP transports)
             command: Command to start MCP server (for stdio transport)
             timeout: Request timeout in seconds
+            spool_threshold: Text size above which structured tool results
+                spool their content to a temporary file
+            server: MCP server (``FastMCP`` or low-level ``Server``) hosted by the
+                inprocess transport (default: ``egile_mcp_prospectfinder.server.mcp``)
         """
         self.transport = transport
         self.host = host
         self.port = port
         self.command = command
         self.timeout = timeout
+        self.spool_threshold = spool_threshold
+        self.server = server
         self.base_url = f"http://{host}:{port}/sse"  # For SSE
-        self._session: Optional[ClientSession] = None
-        self._exit_stack: Optional[AsyncExitStack] = None
+        self.streamable_http_url = f"http://{host}:{port}/mcp"  # For streamable HTTP
+        self._session: ClientSession | None = None
+        self._exit_stack: AsyncExitStack | None = None
 
     async def __aenter__(self) -> MCPClient:
         """Async context manager entry."""
@@ -68,7 +342,7 @@ class MCPClient:
             if not self.command:
                 raise ValueError("command is required for stdio transport")
             
-            logger.info(f"Starting MCP server via stdio: {self.command}")
+            logger.info("Starting MCP server via stdio: %s", self.command)
             
             # Parse command into list
             import shlex
@@ -93,7 +367,7 @@ class MCPClient:
             
         elif self.transport == "sse":
             # Use SSE transport - connect to existing server
-            logger.info(f"Connecting to MCP server at {self.base_url}")
+            logger.info("Connecting to MCP server at %s", self.base_url)
             
             sse_transport = await self._exit_stack.enter_async_context(
                 sse_client(self.base_url)
@@ -105,6 +379,44 @@ class MCPClient:
             
             await self._session.initialize()
             logger.info("MCP client connected via SSE and initialized")
+            
+        elif self.transport == "streamable-http":
+            # Use streamable HTTP transport - plain POSTs over the shared keep-alive pool
+            logger.info("Connecting to MCP server at %s", self.streamable_http_url)
+            
+            http_client = await self._exit_stack.enter_async_context(
+                _borrow_shared_http_client()
+            )
+            http_transport = await self._exit_stack.enter_async_context(
+                _streamable_http_transport(self.streamable_http_url, http_client)
+            )
+            
+            self._session = await self._exit_stack.enter_async_context(
+                ClientSession(http_transport[0], http_transport[1])
+            )
+            
+            await self._session.initialize()
+            logger.info("MCP client connected via streamable HTTP and initialized")
+        elif self.transport == "inprocess":
+            # Host the server in this process on its own thread and event loop and
+            # talk to it over in-memory streams: full MCP semantics without a
+            # subprocess, pipes or HTTP, and blocking tools cannot stall our loop
+            server = self.server
+            if server is None:
+                from egile_mcp_prospectfinder.server import mcp as default_server
+
+                server = default_server
+            logger.info("Starting in-process MCP server")
+
+            memory_transport = await self._exit_stack.enter_async_context(
+                _serve_on_thread(server)
+            )
+            self._session = await self._exit_stack.enter_async_context(
+                ClientSession(memory_transport[0], memory_transport[1])
+            )
+
+            await self._session.initialize()
+            logger.info("MCP client connected in-process and initialized")
         else:
             raise ValueError(f"Unsupported transport: {self.transport}")
 
@@ -116,56 +428,105 @@ class MCPClient:
             self._session = None
             logger.info("MCP client connection closed")
 
-    async def call_tool(
-        self, tool_name: str, arguments: Optional[dict[str, Any]] = None
-    ) -> str:
-        """
-        Call a tool on the MCP server using the MCP SDK with timeout protection.
-
-        Args:
-            tool_name: Name of the tool to call
-            arguments: Tool arguments as a dictionary
-
-        Returns:
-            The tool response as a string
-        """
+    async def _call_tool_raw(
+        self, tool_name: str, arguments: dict[str, Any] | None = None
+    ) -> Any:
+        """Invoke a tool and return the raw MCP ``CallToolResult``."""
         if not self._session:
             raise RuntimeError("MCP client not connected. Call connect() first.")
         
         arguments = arguments or {}
-        logger.info(f"🔌 MCP CLIENT: Calling tool '{tool_name}' with arguments: {arguments}")
+        logger.info("🔌 MCP CLIENT: Calling tool '%s' with arguments: %s", tool_name, arguments)
         
         try:
-            import asyncio
-            
             # Add aggressive timeout to prevent hanging
-            result = await asyncio.wait_for(
+            return await asyncio.wait_for(
                 self._session.call_tool(tool_name, arguments=arguments),
                 timeout=self.timeout
             )
-            
-            # Extract text content from result
-            if hasattr(result, 'content') and result.content:
-                # result.content is a list of TextContent or ImageContent objects
-                text_parts = []
-                for content_item in result.content:
-                    if hasattr(content_item, 'text'):
-                        text_parts.append(content_item.text)
-                result_text = '\n'.join(text_parts)
-            else:
-                result_text = str(result)
-            
-            logger.info(f"🔌 MCP CLIENT: Tool completed, {len(result_text)} chars returned")
-            return result_text
-            
         except asyncio.TimeoutError:
             error_msg = f"Tool '{tool_name}' timed out after {self.timeout}s"
-            logger.error(f"🔌 MCP CLIENT: {error_msg}")
+            logger.error("🔌 MCP CLIENT: %s", error_msg)
             raise TimeoutError(error_msg)
         except Exception as e:
-            logger.error(f"🔌 MCP CLIENT: Tool '{tool_name}' failed: {type(e).__name__}: {e}")
+            logger.error(
+                "🔌 MCP CLIENT: Tool '%s' failed: %s: %s", tool_name, type(e).__name__, e
+            )
             raise
 
+    async def call_tool(
+        self, tool_name: str, arguments: dict[str, Any] | None = None
+    ) -> str:
+        """
+        Call a tool on the MCP server using the MCP SDK with timeout protection.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments as a dictionary
+
+        Returns:
+            The tool response as a string
+        """
+        result = await self._call_tool_raw(tool_name, arguments)
+        
+        # Extract text content from result
+        if hasattr(result, 'content') and result.content:
+            # result.content is a list of TextContent or ImageContent objects
+            result_text = '\n'.join(
+                content_item.text
+                for content_item in result.content
+                if hasattr(content_item, 'text')
+            )
+        else:
+            result_text = str(result)
+        
+        logger.info("🔌 MCP CLIENT: Tool completed, %d chars returned", len(result_text))
+        return result_text
+
+    async def call_tool_structured(
+        self, tool_name: str, arguments: dict[str, Any] | None = None
+    ) -> ToolResult:
+        """
+        Call a tool and return its result without flattening it to a string.
+
+        Structured content returned by the server is passed through as parsed
+        JSON. Text blocks larger than ``spool_threshold`` characters in total are
+        moved into a temporary spool instead of being kept in memory. The SDK
+        has already decoded the whole response by then, so spooling lowers the
+        memory retained by the result, not the peak memory of the call.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments as a dictionary
+
+        Returns:
+            A ToolResult holding structured content and content blocks
+        """
+        result = await self._call_tool_raw(tool_name, arguments)
+        
+        content = list(getattr(result, 'content', None) or [])
+        tool_result = ToolResult(
+            structured=getattr(result, 'structuredContent', None),
+            content=content,
+            is_error=bool(getattr(result, 'isError', False)),
+        )
+        
+        text_size = sum(
+            len(item.text) for item in content if isinstance(getattr(item, 'text', None), str)
+        )
+        if text_size > self.spool_threshold:
+            tool_result._spool_text_blocks(self.spool_threshold)
+        else:
+            tool_result.size = text_size
+        
+        logger.info(
+            "🔌 MCP CLIENT: Tool completed, structured=%s, %d chars%s",
+            tool_result.structured is not None,
+            tool_result.size,
+            " (spooled)" if tool_result.spooled else "",
+        )
+        return tool_result
+
     async def find_prospects(
         self, sector: str, country: str = "Belgium", limit: int = 10
     ) -> str:
@@ -213,5 +574,5 @@ class MCPClient:
                 for tool in result.tools
             ] if hasattr(result, 'tools') else []
         except Exception as e:
-            logger.error(f"Error listing MCP tools: {e}")
+            logger.error("Error listing MCP tools: %s", e)
             return []
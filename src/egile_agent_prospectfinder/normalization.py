@@ -0,0 +1,210 @@
+"""Canonical normalization of sector and country arguments.
+
+The LLM passes sectors and countries as free text ("FinTech", "financial
+technology", "Belgique", "BE"). Both are folded (case, accents, punctuation)
+and looked up in dictionaries precomputed at import time, so every spelling
+of the same query resolves in O(1) to one canonical form that is then used for
+all downstream dispatch and caching.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+
+# ISO 3166-1 alpha-2, alpha-3, English name, native names and common aliases
+COUNTRIES: list[tuple[str, str, str, tuple[str, ...]]] = [
+    ("AT", "AUT", "Austria", ("Österreich", "Oesterreich")),
+    ("BE", "BEL", "Belgium", ("België", "Belgie", "Belgique", "Belgien", "Belgio")),
+    ("BG", "BGR", "Bulgaria", ("България", "Bulgarie")),
+    ("HR", "HRV", "Croatia", ("Hrvatska", "Croatie")),
+    ("CY", "CYP", "Cyprus", ("Κύπρος", "Chypre")),
+    ("CZ", "CZE", "Czechia", ("Czech Republic", "Česko", "Česká republika", "Tchéquie")),
+    ("DK", "DNK", "Denmark", ("Danmark", "Danemark", "Dänemark")),
+    ("EE", "EST", "Estonia", ("Eesti", "Estonie")),
+    ("FI", "FIN", "Finland", ("Suomi", "Finlande")),
+    ("FR", "FRA", "France", ("Frankrijk", "Frankreich", "Francia")),
+    ("DE", "DEU", "Germany", ("Deutschland", "Allemagne", "Duitsland", "Germania")),
+    ("GR", "GRC", "Greece", ("Ελλάδα", "Hellas", "Grèce")),
+    ("HU", "HUN", "Hungary", ("Magyarország", "Hongrie")),
+    ("IE", "IRL", "Ireland", ("Éire", "Irlande")),
+    ("IT", "ITA", "Italy", ("Italia", "Italie", "Italien")),
+    ("LV", "LVA", "Latvia", ("Latvija", "Lettonie")),
+    ("LT", "LTU", "Lithuania", ("Lietuva", "Lituanie")),
+    ("LU", "LUX", "Luxembourg", ("Lëtzebuerg", "Luxemburg")),
+    ("MT", "MLT", "Malta", ("Malte",)),
+    ("NL", "NLD", "Netherlands", ("The Netherlands", "Nederland", "Holland", "Pays-Bas",
+                                  "Niederlande", "Paesi Bassi")),
+    ("PL", "POL", "Poland", ("Polska", "Pologne", "Polen")),
+    ("PT", "PRT", "Portugal", ()),
+    ("RO", "ROU", "Romania", ("România", "Roumanie")),
+    ("SK", "SVK", "Slovakia", ("Slovensko", "Slovaquie")),
+    ("SI", "SVN", "Slovenia", ("Slovenija", "Slovénie")),
+    ("ES", "ESP", "Spain", ("España", "Espagne", "Spanje", "Spanien")),
+    ("SE", "SWE", "Sweden", ("Sverige", "Suède", "Schweden")),
+    ("NO", "NOR", "Norway", ("Norge", "Norvège", "Norwegen")),
+    ("IS", "ISL", "Iceland", ("Ísland", "Islande")),
+    ("CH", "CHE", "Switzerland", ("Schweiz", "Suisse", "Svizzera", "Zwitserland")),
+    ("GB", "GBR", "United Kingdom", ("UK", "Great Britain", "Britain", "Royaume-Uni",
+                                     "Verenigd Koninkrijk")),
+    ("US", "USA", "United States", ("United States of America", "Etats-Unis",
+                                    "Verenigde Staten")),
+    ("CA", "CAN", "Canada", ()),
+    ("MX", "MEX", "Mexico", ("México", "Mexique")),
+    ("BR", "BRA", "Brazil", ("Brasil", "Brésil")),
+    ("AR", "ARG", "Argentina", ("Argentine",)),
+    ("AU", "AUS", "Australia", ("Australie",)),
+    ("NZ", "NZL", "New Zealand", ("Aotearoa",)),
+    ("JP", "JPN", "Japan", ("日本", "Nippon", "Japon")),
+    ("CN", "CHN", "China", ("中国", "Chine")),
+    ("IN", "IND", "India", ("Bharat", "Inde")),
+    ("SG", "SGP", "Singapore", ("Singapour",)),
+    ("KR", "KOR", "South Korea", ("Republic of Korea", "대한민국", "Corée du Sud")),
+    ("IL", "ISR", "Israel", ("Israël",)),
+    ("AE", "ARE", "United Arab Emirates", ("UAE", "Emirates", "Émirats arabes unis")),
+    ("TR", "TUR", "Turkey", ("Türkiye", "Turquie")),
+    ("ZA", "ZAF", "South Africa", ("Afrique du Sud",)),
+    ("MA", "MAR", "Morocco", ("Maroc",)),
+    ("UA", "UKR", "Ukraine", ("Україна",)),
+]
+
+# Canonical sector name and its synonyms. Only true synonyms, abbreviations,
+# translations and spelling variants belong here: a narrower or broader term
+# (solar, audit, travel, ...) would change what is searched, not just how
+SECTORS: dict[str, tuple[str, ...]] = {
+    "Marketing": ("marketing agency", "marketing services"),
+    "Advertising": ("ad agency", "advertising agency", "advertisement"),
+    "Fintech": ("fin tech", "financial technology", "finance technology", "fintech startup"),
+    "Finance": ("financial services", "financial"),
+    "Banking": ("bank", "banks"),
+    "Insurance": ("insurer", "assurance"),
+    "Technology": ("tech", "it", "information technology", "it services", "ict"),
+    "Software": ("software development", "software house", "software vendor"),
+    "Artificial Intelligence": ("ai", "a.i."),
+    "Cybersecurity": ("cyber security", "information security", "infosec"),
+    "Healthcare": ("health care", "healthcare services"),
+    "Pharmaceuticals": ("pharma", "pharmaceutical"),
+    "Biotechnology": ("biotech",),
+    "Construction": ("bouw", "batiment", "btp"),
+    "Real Estate": ("realty", "real-estate", "immobilier", "vastgoed"),
+    "Legal": ("law", "lawyer", "attorney", "law firm", "legal services", "solicitor"),
+    "Accounting": ("accountant", "accountancy"),
+    "Consulting": ("consultancy", "consultant"),
+    "Manufacturing": ("manufacturer",),
+    "Logistics": ("logistics services",),
+    "Retail": ("retailer",),
+    "E-commerce": ("ecommerce", "e commerce", "online retail", "online shop", "webshop"),
+    "Hospitality": ("horeca",),
+    "Education": ("educational services", "onderwijs", "enseignement"),
+    "Energy": ("energie",),
+    "Renewable Energy": ("renewables", "clean energy", "green energy"),
+    "Automotive": ("car", "automobile", "auto"),
+    "Telecommunications": ("telecom", "telco", "telecommunication"),
+    "Media": (),
+    "Agriculture": ("farming", "agribusiness"),
+    "Food & Beverage": ("food and beverage", "f&b", "food industry"),
+    "Human Resources": ("hr", "hr services"),
+    "Architecture": ("architect", "architecture firm"),
+    "Design": ("design agency",),
+}
+
+# Words that describe the kind of result rather than the sector
+_SECTOR_STOPWORDS = frozenset(
+    {"company", "companies", "firm", "firms", "business", "businesses", "industry",
+     "sector", "startup", "startups", "organisation", "organization", "the", "in", "of"}
+)
+_NON_WORD_RE = re.compile(r"[^\w&]+")
+
+
+def fold(text: str) -> str:
+    """Lowercase, strip accents and collapse punctuation and whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_WORD_RE.sub(" ", stripped).split())
+
+
+def lemma(word: str) -> str:
+    """Reduce an English plural to its singular form."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _sector_key(text: str) -> str:
+    words = [lemma(word) for word in fold(text).split()]
+    kept = [word for word in words if word not in _SECTOR_STOPWORDS]
+    return " ".join(kept or words)
+
+
+def _build_country_index() -> dict[str, tuple[str, str]]:
+    index: dict[str, tuple[str, str]] = {}
+    for alpha2, alpha3, name, aliases in COUNTRIES:
+        for variant in (alpha2, alpha3, name, *aliases):
+            index[fold(variant)] = (alpha2, name)
+    return index
+
+
+def _build_sector_index() -> dict[str, str]:
+    index: dict[str, str] = {}
+    for canonical, synonyms in SECTORS.items():
+        for variant in (canonical, *synonyms):
+            index[_sector_key(variant)] = canonical
+    return index
+
+
+_COUNTRY_INDEX = _build_country_index()
+_SECTOR_INDEX = _build_sector_index()
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedQuery:
+    """Canonical form of a find_prospects query."""
+
+    sector: str
+    country: str
+    country_code: str | None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Stable key for caching and dispatch."""
+        return (self.sector.casefold(), self.country_code or fold(self.country))
+
+
+@lru_cache(maxsize=4096)
+def normalize_country(country: str) -> tuple[str | None, str]:
+    """
+    Resolve a country name, native name or ISO code.
+
+    Returns:
+        (ISO 3166-1 alpha-2 code, English name); unknown countries give
+        (None, the input with surrounding whitespace removed)
+    """
+    match = _COUNTRY_INDEX.get(fold(country))
+    if match is None:
+        return None, country.strip()
+    return match
+
+
+@lru_cache(maxsize=4096)
+def normalize_sector(sector: str) -> str:
+    """
+    Resolve a sector through the synonym and lemma table.
+
+    Unknown sectors keep their wording, with whitespace collapsed and the
+    first letter capitalized, so they still share one spelling.
+    """
+    canonical = _SECTOR_INDEX.get(_sector_key(sector))
+    if canonical is not None:
+        return canonical
+    cleaned = " ".join(sector.split())
+    return cleaned[:1].upper() + cleaned[1:]
+
+
+def normalize_query(sector: str, country: str) -> NormalizedQuery:
+    """Normalize both find_prospects arguments."""
+    code, name = normalize_country(country)
+    return NormalizedQuery(sector=normalize_sector(sector), country=name, country_code=code)
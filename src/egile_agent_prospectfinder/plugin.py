@@ -2,11 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+import math
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+import httpx
 from egile_agent_core.plugins import Plugin
+
+from .admission import AdmissionController, OverloadedError
+from .blobstore import BlobStore, summarize_result
+from .cache import TTLCache
+from .cassette import REPLAY, Cassette
+from .delta import WatermarkStore
+from .enrichment import Enrichment, ProspectEnricher
+from .fanout import FanOutResult, fan_out_search, search_in_order
 from .mcp_client import MCPClient
+from .normalization import normalize_query
+from .prospect import (
+    Prospect,
+    UnparsedListingError,
+    format_prospects,
+    prospects_from_lines,
+    prospects_from_structured,
+    prospects_from_text,
+)
+from .providers import DEFAULT_PROVIDERS, SearchProvider, build_http_client, build_providers
+from .registry import mcp_registry
 
 if TYPE_CHECKING:
     from egile_agent_core.agent import Agent
@@ -49,20 +74,81 @@ class ProspectFinderPlugin(Plugin):
         mcp_host: str = "localhost",
         mcp_port: int = 8000,
         mcp_transport: str = "stdio",
-        mcp_command: Optional[str] = None,
+        mcp_command: str | None = None,
         timeout: float = 30.0,
         use_mcp: bool = False,
+        search_service: Any | None = None,
+        cassette_path: str | None = None,
+        cassette_mode: str | None = None,
+        replay_latency: bool = False,
+        search_providers: list[str] | None = None,
+        fanout_deadline: float = 10.0,
+        enrich: bool = False,
+        enrich_concurrency: int = 10,
+        enrich_per_domain_interval: float = 1.0,
+        max_inflight: int = 32,
+        max_queue: int = 64,
+        queue_timeout: float = 5.0,
+        normalize_queries: bool = True,
+        delta_dir: str | None = None,
+        result_cache_ttl: float = 0.0,
+        result_cache_size: int = 256,
+        result_store_dir: str | None = None,
+        summary_items: int = 3,
+        result_store_max_age: float = 7 * 24 * 3600,
+        result_store_max_bytes: int = 256 * 1024 * 1024,
+        rerank: bool = False,
+        overfetch: float = 2.0,
+        blocklist: list[str] | None = None,
     ):
         """
         Initialize the ProspectFinder plugin.
 
         Args:
-            mcp_host: Host where the MCP server is running (for SSE transport)
-            mcp_port: Port where the MCP server is running (for SSE transport)
-            mcp_transport: Transport mode - "stdio" (recommended) or "sse"
+            mcp_host: Host where the MCP server is running (for SSE and streamable HTTP)
+            mcp_port: Port where the MCP server is running (for SSE and streamable HTTP)
+            mcp_transport: Transport mode - "stdio" (recommended), "sse", "streamable-http"
+                or "inprocess" (hosts the MCP server in this process)
             mcp_command: Command to start MCP server (for stdio transport)
             timeout: Request timeout in seconds
             use_mcp: If True, use MCP client; if False, use direct search_service (default: False for Windows compatibility)
+            search_service: Object exposing ``search_prospects(sector, country, limit)``
+                to use in direct mode instead of the native asyncio search backend
+            cassette_path: Cassette file used to record or replay search calls
+            cassette_mode: "record" to capture every search call to ``cassette_path``,
+                "replay" to serve them back without touching any backend
+            replay_latency: In replay mode, reproduce the recorded upstream latency
+            search_providers: Providers to query concurrently in direct mode
+                ("google", "brave", "duckduckgo", "search_service"); results are
+                merged and returned as soon as ``limit`` unique prospects arrive
+            fanout_deadline: Maximum seconds to wait for providers when fanning out
+            enrich: Fetch each prospect's homepage and add contact emails, phone
+                numbers and the meta description to the results
+            enrich_concurrency: Maximum homepage fetches in flight
+            enrich_per_domain_interval: Minimum seconds between fetches to one host
+            max_inflight: Maximum find_prospects calls running at once
+            max_queue: Maximum calls waiting for a slot; further calls get a "busy" result
+            queue_timeout: Maximum seconds a call waits for a slot before getting "busy"
+            normalize_queries: Map sector and country spellings ("FinTech", "Belgique",
+                "BE") to one canonical form before searching
+            delta_dir: Directory where URLs already returned per (sector, country)
+                are recorded, enabling ``only_new`` sweeps
+            result_cache_ttl: Seconds a completed search stays cached (default 0:
+                disabled); when enabled, searches cut short by ``deadline_ms``
+                finish in the background into it
+            result_cache_size: Maximum number of cached searches
+            result_store_dir: Directory of a content-addressed store for full results;
+                when set, find_prospects returns a compact summary and a reference
+                that the get_prospect_result tool expands
+            summary_items: Number of prospects listed in a summary
+            result_store_max_age: Seconds a stored result is kept after its last use
+            result_store_max_bytes: Compressed size budget of the result store; the
+                least recently used results are deleted beyond it
+            rerank: Drop aggregator domains and near-duplicates and re-rank results by
+                relevance to the sector (requires the ``rerank`` extra, i.e. NumPy)
+            overfetch: With ``rerank``, request this many times ``limit`` results from
+                the backend so enough remain after pruning
+            blocklist: Aggregator domains dropped by ``rerank`` (default: the built-in list)
         """
         self.mcp_host = mcp_host
         self.mcp_port = mcp_port
@@ -70,9 +156,47 @@ class ProspectFinderPlugin(Plugin):
         self.mcp_command = mcp_command or "python -m egile_mcp_prospectfinder.server"
         self.timeout = timeout
         self.use_mcp = use_mcp
-        self._client: Optional[MCPClient] = None
-        self._search_service = None
-        self._agent: Optional[Agent] = None
+        self._client: MCPClient | None = None
+        self._search_service = search_service
+        self.search_providers = search_providers
+        self.fanout_deadline = fanout_deadline
+        self._providers: list[SearchProvider] = []
+        self.enrich = enrich
+        self.enrich_concurrency = enrich_concurrency
+        self.enrich_per_domain_interval = enrich_per_domain_interval
+        self._http_client: httpx.AsyncClient | None = None
+        self._enricher: ProspectEnricher | None = None
+        self._admission = AdmissionController(max_inflight, max_queue, queue_timeout)
+        self.normalize_queries = normalize_queries
+        self._watermarks = WatermarkStore(delta_dir) if delta_dir else None
+        self._results: TTLCache[tuple[list[Prospect], dict[str, Enrichment] | None]] = (
+            TTLCache(result_cache_ttl, result_cache_size)
+        )
+        self._background: set[asyncio.Task[Any]] = set()
+        self._blobs = (
+            BlobStore(result_store_dir, result_store_max_age, result_store_max_bytes)
+            if result_store_dir
+            else None
+        )
+        self.summary_items = summary_items
+        self.overfetch = overfetch
+        self._ranker = None
+        if rerank:
+            try:
+                from .ranking import ResultRanker
+            except ImportError as e:
+                raise ImportError(
+                    "rerank requires NumPy: pip install egile-agent-prospectfinder[rerank]"
+                ) from e
+            self._ranker = ResultRanker(blocklist)
+        self._agent: Agent | None = None
+        self._cassette: Cassette | None = None
+        if cassette_mode is not None:
+            if not cassette_path:
+                raise ValueError("cassette_path is required when cassette_mode is set")
+            self._cassette = Cassette(
+                cassette_path, mode=cassette_mode, replay_latency=replay_latency
+            )
 
     @property
     def name(self) -> str:
@@ -103,29 +227,72 @@ class ProspectFinderPlugin(Plugin):
         """
         self._agent = agent
         
-        if self.use_mcp:
+        if self._cassette is not None and self._cassette.mode == REPLAY:
+            # Replay mode serves every search from the cassette, fully offline
+            logger.info("ProspectFinder plugin replaying searches from %s", self._cassette.path)
+        elif self.use_mcp:
             # Use MCP client (external compatibility mode)
             try:
-                self._client = MCPClient(
+                # Plugins with the same settings share one connection (and one
+                # stdio server process) through the process-wide registry
+                self._client = await mcp_registry.acquire(
                     transport=self.mcp_transport,
                     host=self.mcp_host,
                     port=self.mcp_port,
                     command=self.mcp_command,
                     timeout=self.timeout,
                 )
-                await self._client.connect()
-                logger.info(f"ProspectFinder plugin connected to MCP server via {self.mcp_transport}")
+                logger.info(
+                    "ProspectFinder plugin connected to MCP server via %s", self.mcp_transport
+                )
             except Exception as e:
-                logger.error(f"Failed to connect to MCP server: {e}")
+                logger.error("Failed to connect to MCP server: %s", e)
                 raise
         else:
             # Use direct mode (faster, more reliable)
-            from egile_mcp_prospectfinder.search_service import SearchService
-            self._search_service = SearchService()
-            logger.info("ProspectFinder plugin initialized in direct mode (using search_service)")
+            if self.search_providers:
+                self._providers = build_providers(self.search_providers, self._search_service)
+                if not self._providers:
+                    raise RuntimeError("No search providers could be configured")
+                self._ensure_http_client()
+                logger.info(
+                    "ProspectFinder plugin initialized in direct mode, fanning out to %s",
+                    [provider.name for provider in self._providers],
+                )
+            elif self._search_service is not None:
+                logger.info(
+                    "ProspectFinder plugin initialized in direct mode (using search_service)"
+                )
+            else:
+                # Native asyncio backend: the engines SearchService queries, tried in
+                # order on one pooled client instead of per-call connections in threads
+                self._providers = build_providers(DEFAULT_PROVIDERS)
+                self._ensure_http_client()
+                logger.info(
+                    "ProspectFinder plugin initialized in direct mode, searching %s in order",
+                    [provider.name for provider in self._providers],
+                )
+        
+        if self.enrich:
+            self._enricher = ProspectEnricher(
+                self._ensure_http_client(),
+                max_concurrency=self.enrich_concurrency,
+                per_domain_interval=self.enrich_per_domain_interval,
+            )
+
+    def _ensure_http_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client shared by search providers and enrichment."""
+        if self._http_client is None:
+            self._http_client = build_http_client(self.timeout)
+        return self._http_client
 
     async def find_prospects(
-        self, sector: str, country: str = "Belgium", limit: int = 10
+        self,
+        sector: str,
+        country: str = "Belgium",
+        limit: int = 10,
+        only_new: bool = False,
+        deadline_ms: int | None = None,
     ) -> str:
         """
         Search for business prospects.
@@ -134,6 +301,11 @@ class ProspectFinderPlugin(Plugin):
             sector: Business sector to search for (e.g., "Marketing", "Construction")
             country: Country to search in (default: "Belgium")
             limit: Maximum number of results (default: 10)
+            only_new: Return only prospects not returned by earlier sweeps of the
+                same sector and country (requires ``delta_dir``)
+            deadline_ms: Time budget in milliseconds; when it expires the results
+                gathered so far are returned marked as partial, and with the result
+                cache enabled the search finishes in the background to fill it
 
         Returns:
             Formatted string with search results
@@ -141,42 +313,315 @@ class ProspectFinderPlugin(Plugin):
         Raises:
             RuntimeError: If plugin is not initialized
         """
+        if only_new and self._watermarks is None:
+            raise RuntimeError("only_new requires the plugin to be created with delta_dir")
+        if self.normalize_queries:
+            # Every spelling of the same query dispatches (and caches) identically
+            query = normalize_query(sector, country)
+            sector, country = query.sector, query.country
+            key = query.key
+        else:
+            # Cache and watermarks only merge queries the backend saw verbatim
+            key = (sector, country)
+        
         logger.info(
-            f"Searching for prospects: sector={sector}, country={country}, limit={limit}"
+            "Searching for prospects: sector=%s, country=%s, limit=%s, only_new=%s, deadline_ms=%s",
+            sector, country, limit, only_new, deadline_ms,
         )
         
         try:
-            if self.use_mcp:
-                # Use MCP client
-                if not self._client:
-                    raise RuntimeError("MCP client not initialized. Call on_agent_start first.")
-                result = await self._client.find_prospects(
-                    sector=sector, country=country, limit=limit
-                )
+            # Delta sweeps always search afresh
+            cached = None if only_new else self._results.get((key, limit))
+            is_partial = False
+            if cached is not None:
+                prospects, enrichments = cached
             else:
-                # Use direct search service
-                if not self._search_service:
-                    raise RuntimeError("Search service not initialized. Call on_agent_start first.")
-                
-                # Call search_service directly (synchronous)
-                results = self._search_service.search_prospects(sector, country, limit)
-                
-                # Return compact structured data that the LLM will format
-                if not results:
-                    result = f"No prospects found for {sector} in {country}."
+                progress = FanOutResult()
+                work = asyncio.create_task(
+                    self._gather(sector, country, limit, key, only_new, progress)
+                )
+                if deadline_ms is None:
+                    prospects, enrichments = await work
                 else:
-                    # Compact format - just title, URL, and key details
-                    result = f"Found {len(results)} {sector} prospects in {country}:\n\n"
-                    for i, res in enumerate(results, 1):
-                        result += f"{i}. {res['title']} - {res['link']}\n"
+                    try:
+                        await asyncio.wait({work}, timeout=max(deadline_ms, 0) / 1000)
+                    except asyncio.CancelledError:
+                        work.cancel()
+                        raise
+                    if work.done():
+                        prospects, enrichments = work.result()
+                    else:
+                        is_partial = True
+                        if self._results.ttl > 0:
+                            self._finish_in_background(work)
+                        else:
+                            # Nothing would keep the complete results
+                            work.cancel()
+                        prospects = self._rank(progress.results, sector, limit)
+                        enrichments = self._peek_enrichments(prospects)
+            
+            if only_new and self._watermarks is not None:
+                # Only prospects unseen by earlier sweeps are returned
+                delta = await asyncio.to_thread(self._watermarks.filter_new, key, prospects)
+                prospects = delta.new
+            
+            # Return compact structured data that the LLM will format
+            result = format_prospects(prospects, sector, country, enrichments, only_new)
+            if is_partial:
+                notice = (
+                    f"Partial results: the {deadline_ms} ms deadline expired before the search "
+                    "finished."
+                )
+                if self._results.ttl > 0:
+                    notice += (
+                        " It continues in the background; repeat the same search shortly "
+                        "for the complete results."
+                    )
+                result = notice + "\n\n" + result
+            if self._blobs is not None:
+                result = await self._store_result(result)
             
-            logger.info(f"Search completed: {len(result)} characters")
+            logger.info("Search completed: %d characters", len(result))
             return result
+        except UnparsedListingError as e:
+            # MCP output without a single listed prospect (e.g. a notice) is passed
+            # through verbatim, unless the caller asked for per-prospect processing
+            skipped = [
+                feature
+                for feature, requested in (
+                    ("only_new", only_new),
+                    ("rerank", self._ranker is not None),
+                    ("enrich", self._enricher is not None),
+                )
+                if requested
+            ]
+            if skipped:
+                raise RuntimeError(
+                    f"Failed to search for prospects: the MCP server returned no prospect "
+                    f"listing, so {', '.join(skipped)} cannot be applied: {e.text[:200]}"
+                ) from e
+            logger.info("Returning unparsed MCP output: %d characters", len(e.text))
+            return e.text
+        except OverloadedError as e:
+            # Fail fast with a result the LLM can relay instead of an error
+            return json.dumps(
+                {
+                    "status": "busy",
+                    "reason": e.reason,
+                    "retry_after_seconds": e.retry_after,
+                    "message": "The prospect search service is busy. Please retry later.",
+                }
+            )
         except Exception as e:
             error_msg = f"Failed to search for prospects: {str(e)}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+    async def _gather(
+        self,
+        sector: str,
+        country: str,
+        limit: int,
+        key: tuple[str, str],
+        only_new: bool,
+        progress: FanOutResult,
+    ) -> tuple[list[Prospect], dict[str, Enrichment] | None]:
+        """
+        Search and enrich one query under admission control.
+
+        Incremental backends fill ``progress`` as results arrive so a caller
+        whose deadline expires can return them. Complete results are cached.
+        """
+        async with self._admission.admit():
+            if self.use_mcp:
+                backend, search = "mcp", self._search_mcp
+            elif self.search_providers:
+                backend, search = "direct", partial(self._search_fanout, outcome=progress)
+            elif self._providers:
+                backend, search = "direct", partial(self._search_native, outcome=progress)
+            else:
+                backend, search = "direct", self._search_direct
+            prospects = await self._call_backend(
+                backend, sector, country, self._fetch_limit(limit), search
+            )
+            prospects = progress.results = self._rank(prospects, sector, limit)
+            # Delta sweeps only enrich the prospects they will return
+            to_enrich = (
+                await asyncio.to_thread(self._watermarks.unseen, key, prospects)
+                if only_new and self._watermarks is not None
+                else prospects
+            )
+            enrichments = await self._enricher.enrich(to_enrich) if self._enricher else None
+        if not only_new:
+            self._results.put((key, limit), (prospects, enrichments))
+        return prospects, enrichments
+
+    def _fetch_limit(self, limit: int) -> int:
+        """Number of results to request so ``limit`` remain after re-ranking."""
+        if self._ranker is None:
+            return limit
+        return max(limit, min(math.ceil(limit * self.overfetch), 100))
+
+    def _rank(self, prospects: list[Prospect], sector: str, limit: int) -> list[Prospect]:
+        """Re-rank and prune results when re-ranking is enabled, keeping ``limit``."""
+        if self._ranker is None:
+            return prospects[:limit]
+        ranked, _ = self._ranker.rank(prospects, sector, limit)
+        return ranked
+
+    async def _store_result(self, result: str) -> str:
+        """Store a full result and return its summary, if that is shorter."""
+        if self._blobs is None:
+            return result
+        summary = summarize_result(result, self._blobs.ref_for(result), self.summary_items)
+        if len(summary) >= len(result):
+            return result
+        # Compression and file I/O stay off the event loop
+        await asyncio.to_thread(self._blobs.put, result)
+        return summary
+
+    async def get_prospect_result(self, ref: str) -> str:
+        """
+        Expand a stored find_prospects result.
+
+        Args:
+            ref: Reference given in a find_prospects summary
+
+        Returns:
+            The full result text
+
+        Raises:
+            RuntimeError: If result storage is not enabled
+        """
+        if self._blobs is None:
+            raise RuntimeError(
+                "get_prospect_result requires the plugin to be created with result_store_dir"
+            )
+        try:
+            return await asyncio.to_thread(self._blobs.get, ref)
+        except KeyError:
+            return f"No stored prospect result with reference {ref!r}."
+
+    def _peek_enrichments(self, prospects: list[Prospect]) -> dict[str, Enrichment] | None:
+        """Collect the enrichments already cached for partial results."""
+        if self._enricher is None:
+            return None
+        enrichments = {}
+        for prospect in prospects:
+            enrichment = self._enricher.peek(prospect.link)
+            if enrichment is not None:
+                enrichments[prospect.link] = enrichment
+        return enrichments
+
+    def _finish_in_background(self, task: asyncio.Task[Any]) -> None:
+        """Keep a search that outlived its deadline running until it completes."""
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task[Any]) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            e = task.exception()
+            logger.warning("Background search failed: %s: %s", type(e).__name__, e)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get runtime metrics for the plugin.
+
+        Returns:
+            Dictionary with admission control counters (admitted, shed, queued, ...),
+            the number of searches finishing in the background and of cached results
+        """
+        return {
+            "admission": self._admission.stats(),
+            "background_searches": len(self._background),
+            "cached_results": len(self._results),
+        }
+
+    async def _call_backend(
+        self,
+        backend: str,
+        sector: str,
+        country: str,
+        limit: int,
+        search: Callable[[str, str, int], Awaitable[list[Prospect]]],
+    ) -> list[Prospect]:
+        """Run a backend search, recording or replaying it through the cassette if set."""
+        if self._cassette is None:
+            return await search(sector, country, limit)
+
+        async def record() -> list[dict[str, str]]:
+            return [prospect.to_dict() for prospect in await search(sector, country, limit)]
+
+        rows = await self._cassette.call(
+            backend, {"sector": sector, "country": country, "limit": limit}, record
+        )
+        if isinstance(rows, str):
+            # Cassettes recorded before results were structured hold MCP text output
+            return prospects_from_text(rows, sector, country)
+        return [Prospect.from_dict(row, sector, country) for row in rows]
+
+    async def _search_mcp(self, sector: str, country: str, limit: int) -> list[Prospect]:
+        """Search through the MCP client."""
+        if not self._client:
+            raise RuntimeError("MCP client not initialized. Call on_agent_start first.")
+        tool_result = await self._client.call_tool_structured(
+            "find_prospects", {"sector": sector, "country": country, "limit": limit}
+        )
+        try:
+            if tool_result.is_error:
+                raise RuntimeError(f"MCP server error: {tool_result.text() or 'no details'}")
+            prospects = prospects_from_structured(tool_result.structured, sector, country)
+            if prospects is None:
+                # Parse line by line so a spooled result is never read back whole
+                prospects = prospects_from_lines(tool_result.iter_lines(), sector, country)
+                if not prospects and (text := tool_result.text()).strip():
+                    raise UnparsedListingError(text)
+        finally:
+            tool_result.close()
+        return prospects
+
+    async def _search_direct(self, sector: str, country: str, limit: int) -> list[Prospect]:
+        """Search through the direct search service."""
+        if not self._search_service:
+            raise RuntimeError("Search service not initialized. Call on_agent_start first.")
+        
+        # The search service is synchronous; keep it off the event loop
+        results = await asyncio.to_thread(
+            self._search_service.search_prospects, sector, country, limit
+        )
+        return [Prospect.from_dict(result, sector, country) for result in results]
+
+    async def _search_fanout(
+        self, sector: str, country: str, limit: int, outcome: FanOutResult | None = None
+    ) -> list[Prospect]:
+        """Search all configured providers concurrently and merge the first results."""
+        if self._http_client is None:
+            raise RuntimeError("Search providers not initialized. Call on_agent_start first.")
+        outcome = await fan_out_search(
+            self._providers, self._http_client, sector, country, limit, self.fanout_deadline,
+            outcome,
+        )
+        if not outcome.completed:
+            raise RuntimeError(
+                f"No search provider completed: failed={outcome.failed}, "
+                f"cancelled={outcome.cancelled}"
+            )
+        return outcome.results
+
+    async def _search_native(
+        self, sector: str, country: str, limit: int, outcome: FanOutResult | None = None
+    ) -> list[Prospect]:
+        """Search the default providers in order of preference."""
+        if self._http_client is None:
+            raise RuntimeError("Search providers not initialized. Call on_agent_start first.")
+        outcome = await search_in_order(
+            self._providers, self._http_client, sector, country, limit, outcome
+        )
+        if not outcome.completed:
+            raise RuntimeError(f"All search providers failed: {outcome.failed}")
+        return outcome.results
+
     async def on_message_received(self, message: str, **kwargs: Any) -> str:
         """
         Process incoming messages to detect prospect search requests.
@@ -223,9 +668,19 @@ class ProspectFinderPlugin(Plugin):
 
     async def cleanup(self) -> None:
         """Clean up resources and close connections."""
+        for task in list(self._background):
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
         if self._client:
-            await self._client.close()
+            await mcp_registry.release(self._client)
+            self._client = None
             logger.info("ProspectFinder plugin disconnected from MCP server")
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._cassette is not None:
+            self._cassette.close()
 
     def get_tool_functions(self) -> dict[str, Any]:
         """
@@ -234,10 +689,13 @@ class ProspectFinderPlugin(Plugin):
         Returns:
             Dictionary mapping function names to their implementations
         """
-        return {
+        functions = {
             "find_prospects": self.find_prospects,
             "list_available_tools": self.list_available_tools,
         }
+        if self._blobs is not None:
+            functions["get_prospect_result"] = self.get_prospect_result
+        return functions
     
     def get_tools(self) -> list[dict[str, Any]]:
         """
@@ -246,7 +704,7 @@ class ProspectFinderPlugin(Plugin):
         Returns:
             List of tool definitions in OpenAI function calling format
         """
-        return [
+        tools: list[dict[str, Any]] = [
             {
                 "type": "function",
                 "function": {
@@ -269,9 +727,54 @@ class ProspectFinderPlugin(Plugin):
                                 "description": "Maximum number of results to return (default: 10, max: 50)",
                                 "default": 10,
                             },
+                            "deadline_ms": {
+                                "type": "integer",
+                                "description": (
+                                    "Optional time budget in milliseconds. When it expires, "
+                                    "the prospects found so far are returned marked as partial"
+                                ),
+                            },
+                            "only_new": {
+                                "type": "boolean",
+                                "description": (
+                                    "Only return prospects not found by earlier searches for "
+                                    "the same sector and country (for recurring sweeps)"
+                                ),
+                                "default": False,
+                            },
                         },
                         "required": ["sector"],
                     },
                 },
             }
         ]
+        if self._watermarks is None:
+            # Delta sweeps are only offered when seen URLs can be recorded
+            del tools[0]["function"]["parameters"]["properties"]["only_new"]
+        if self._blobs is not None:
+            tools.append(
+                {
+                    "type": "function",
+                    "function": {
+                        "name": "get_prospect_result",
+                        "description": (
+                            "Get the full list of prospects, with contact details, of an "
+                            "earlier find_prospects search from the reference given in its "
+                            "summary."
+                        ),
+                        "parameters": {
+                            "type": "object",
+                            "properties": {
+                                "ref": {
+                                    "type": "string",
+                                    "description": (
+                                        "Result reference from the find_prospects summary"
+                                    ),
+                                },
+                            },
+                            "required": ["ref"],
+                        },
+                    },
+                }
+            )
+        return tools
@@ -0,0 +1,187 @@
+"""Compact prospect record shared by all search backends."""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .enrichment import Enrichment
+
+
+@dataclass(slots=True)
+class Prospect:
+    """
+    A single search result.
+
+    Uses ``__slots__`` so cached prospects carry no per-instance ``__dict__``,
+    and interns the low-cardinality ``sector`` and ``country`` strings so
+    thousands of prospects share one copy of each. ``details`` holds extra
+    ``Name: value`` lines a backend attached to the result, such as the MCP
+    server's "Potential Gen AI Use Cases".
+    """
+
+    title: str
+    link: str
+    snippet: str = ""
+    sector: str = ""
+    country: str = ""
+    source: str = ""
+    details: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        self.sector = sys.intern(self.sector)
+        self.country = sys.intern(self.country)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], sector: str = "", country: str = "") -> Prospect:
+        """Build a prospect from a search result dict (``link`` or ``url`` keys)."""
+        return cls(
+            title=data.get("title") or "",
+            link=data.get("link") or data.get("url") or "",
+            snippet=data.get("snippet") or data.get("description") or "",
+            sector=data.get("sector") or sector,
+            country=data.get("country") or country,
+            source=data.get("source") or "",
+            details=tuple(data.get("details") or ()),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the prospect as a plain dict (``details`` only when present)."""
+        data: dict[str, Any] = {
+            "title": self.title,
+            "link": self.link,
+            "snippet": self.snippet,
+            "sector": self.sector,
+            "country": self.country,
+            "source": self.source,
+        }
+        if self.details:
+            data["details"] = list(self.details)
+        return data
+
+
+# "1. Title - https://..." (compact format) or "1. Title" followed by "URL: ..." lines
+_ITEM_RE = re.compile(r"^\s*\d+\.\s+(?P<title>.+?)(?:\s+-\s+(?P<link>https?://\S+))?\s*$")
+_FIELD_RE = re.compile(r"^\s+(?P<name>URL|Snippet):\s*(?P<value>.*)$")
+
+
+class UnparsedListingError(ValueError):
+    """Raised when tool output text is not a prospect listing."""
+
+    def __init__(self, text: str):
+        super().__init__("Tool output is not a prospect listing this client can parse")
+        self.text = text
+
+
+def prospects_from_lines(
+    lines: Iterable[str], sector: str = "", country: str = ""
+) -> list[Prospect]:
+    """
+    Parse prospects from the lines of a numbered text listing, one line at a time.
+
+    Args:
+        lines: Listing lines without line endings
+        sector: Sector to attach to the parsed prospects
+        country: Country to attach to the parsed prospects
+
+    Returns:
+        Parsed prospects, in listing order; indented lines under an item other
+        than ``URL`` and ``Snippet`` are kept in its ``details``
+    """
+    prospects: list[Prospect] = []
+    current: Prospect | None = None
+    for line in lines:
+        match = _ITEM_RE.match(line)
+        if match:
+            current = Prospect(match["title"], match["link"] or "", sector=sector, country=country)
+            prospects.append(current)
+            continue
+        field_match = _FIELD_RE.match(line)
+        if current is not None and field_match:
+            if field_match["name"] == "URL":
+                current.link = field_match["value"].strip()
+            else:
+                current.snippet = field_match["value"].strip()
+        elif current is not None and line[:1].isspace() and line.strip():
+            # e.g. "   Potential Gen AI Use Cases: ..." under an item
+            current.details += (line.strip(),)
+    return prospects
+
+
+def prospects_from_text(
+    text: str, sector: str = "", country: str = "", strict: bool = False
+) -> list[Prospect]:
+    """
+    Parse prospects from the numbered text listings produced by the MCP server.
+
+    Args:
+        text: Tool output text
+        sector: Sector to attach to the parsed prospects
+        country: Country to attach to the parsed prospects
+        strict: Raise instead of returning no prospects for text that has no items
+
+    Returns:
+        Parsed prospects, in listing order (see ``prospects_from_lines``)
+
+    Raises:
+        UnparsedListingError: In strict mode, if non-empty text yields no prospects
+    """
+    prospects = prospects_from_lines(text.splitlines(), sector, country)
+    if strict and not prospects and text.strip():
+        raise UnparsedListingError(text)
+    return prospects
+
+
+def prospects_from_structured(
+    data: Any, sector: str = "", country: str = ""
+) -> list[Prospect] | None:
+    """
+    Convert structured tool output to prospects.
+
+    Accepts a list of result dicts or a dict wrapping one under ``results``,
+    ``prospects`` or ``result``. Returns None when the payload has no
+    recognizable result list.
+    """
+    if isinstance(data, dict):
+        for key in ("results", "prospects", "result"):
+            if isinstance(data.get(key), list):
+                data = data[key]
+                break
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        return None
+    return [Prospect.from_dict(item, sector, country) for item in data]
+
+
+def format_prospects(
+    prospects: Iterable[Prospect],
+    sector: str,
+    country: str,
+    enrichments: dict[str, Enrichment] | None = None,
+    only_new: bool = False,
+) -> str:
+    """
+    Render prospects in the compact numbered format handed to the LLM.
+
+    With ``only_new`` the heading says the prospects are new since the last sweep.
+    """
+    lines = []
+    count = 0
+    for count, p in enumerate(prospects, 1):
+        lines.append(f"{count}. {p.title} - {p.link}")
+        lines.extend(f"   {detail}" for detail in p.details)
+        enrichment = enrichments.get(p.link) if enrichments else None
+        if enrichment is not None:
+            if enrichment.emails:
+                lines.append(f"   Email: {', '.join(enrichment.emails)}")
+            if enrichment.phones:
+                lines.append(f"   Phone: {', '.join(enrichment.phones)}")
+            if enrichment.description:
+                lines.append(f"   About: {enrichment.description[:200]}")
+    new = "new " if only_new else ""
+    if not count:
+        return f"No {new}prospects found for {sector} in {country}."
+    return f"Found {count} {new}{sector} prospects in {country}:\n\n" + "\n".join(lines) + "\n"
@@ -0,0 +1,267 @@
+"""Search provider adapters used by direct mode.
+
+Each provider turns a (sector, country, limit) search into one or more HTTP
+requests against a search engine and returns ``Prospect`` records.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from .prospect import Prospect
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # HTTP/2 needs the optional "http2" extra
+    HTTP2_AVAILABLE = False
+
+# Engines queried by the native direct backend, in order of preference
+DEFAULT_PROVIDERS = ["google", "brave", "duckduckgo"]
+
+# Connection pool of the long-lived direct-mode client; with HTTP/2 each
+# connection multiplexes many concurrent searches
+DIRECT_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100, keepalive_expiry=60.0
+)
+
+
+def build_http_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    """
+    Create the pooled client shared by search providers and enrichment.
+
+    Uses HTTP/2 when the ``h2`` package is installed, keep-alive connections
+    and ``DIRECT_POOL_LIMITS``, so concurrent searches reuse TLS connections.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=DIRECT_POOL_LIMITS,
+        http2=HTTP2_AVAILABLE,
+        follow_redirects=True,
+    )
+
+
+def build_query(sector: str, country: str) -> str:
+    """Build the search engine query for a sector and country."""
+    return f"{sector} companies in {country}"
+
+
+class SearchProvider(ABC):
+    """Base class for search engine adapters."""
+
+    name: str = "provider"
+
+    @abstractmethod
+    async def search(
+        self, client: httpx.AsyncClient, sector: str, country: str, limit: int
+    ) -> list[Prospect]:
+        """
+        Search for prospects.
+
+        Args:
+            client: Shared HTTP client to issue requests with
+            sector: Business sector to search for
+            country: Country to search in
+            limit: Maximum number of results
+
+        Returns:
+            List of prospects
+        """
+
+    def _result(
+        self, title: str, link: str, snippet: str, sector: str, country: str
+    ) -> Prospect:
+        return Prospect(title, link, snippet, sector=sector, country=country, source=self.name)
+
+
+class GoogleCSEProvider(SearchProvider):
+    """Google Custom Search JSON API."""
+
+    name = "google"
+    url = "https://www.googleapis.com/customsearch/v1"
+    page_size = 10
+
+    def __init__(self, api_key: str, cse_id: str):
+        self.api_key = api_key
+        self.cse_id = cse_id
+
+    async def search(
+        self, client: httpx.AsyncClient, sector: str, country: str, limit: int
+    ) -> list[Prospect]:
+        results: list[Prospect] = []
+        start = 1
+        while len(results) < limit:
+            response = await client.get(
+                self.url,
+                params={
+                    "key": self.api_key,
+                    "cx": self.cse_id,
+                    "q": build_query(sector, country),
+                    "num": min(self.page_size, limit - len(results)),
+                    "start": start,
+                },
+            )
+            response.raise_for_status()
+            items = response.json().get("items", [])
+            if not items:
+                break
+            results.extend(
+                self._result(
+                    item.get("title", ""), item.get("link", ""), item.get("snippet", ""),
+                    sector, country,
+                )
+                for item in items
+            )
+            start += len(items)
+        return results[:limit]
+
+
+class BraveProvider(SearchProvider):
+    """Brave Search API."""
+
+    name = "brave"
+    url = "https://api.search.brave.com/res/v1/web/search"
+    max_count = 20
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    async def search(
+        self, client: httpx.AsyncClient, sector: str, country: str, limit: int
+    ) -> list[Prospect]:
+        response = await client.get(
+            self.url,
+            params={"q": build_query(sector, country), "count": min(self.max_count, limit)},
+            headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
+        )
+        response.raise_for_status()
+        items = response.json().get("web", {}).get("results", [])
+        return [
+            self._result(
+                item.get("title", ""), item.get("url", ""), item.get("description", ""),
+                sector, country,
+            )
+            for item in items[:limit]
+        ]
+
+
+class DuckDuckGoProvider(SearchProvider):
+    """DuckDuckGo HTML endpoint (no API key needed)."""
+
+    name = "duckduckgo"
+    url = "https://html.duckduckgo.com/html/"
+
+    _result_re = re.compile(
+        r'<a[^>]*class="result__a"[^>]*href="(?P<href>[^"]+)"[^>]*>(?P<title>.*?)</a>'
+        r'(?:(?:(?!class="result__a").)*?class="result__snippet"[^>]*>(?P<snippet>.*?)</a>)?',
+        re.S,
+    )
+    _tag_re = re.compile(r"<[^>]+>")
+
+    async def search(
+        self, client: httpx.AsyncClient, sector: str, country: str, limit: int
+    ) -> list[Prospect]:
+        response = await client.post(
+            self.url,
+            data={"q": build_query(sector, country)},
+            headers={"User-Agent": "Mozilla/5.0 (compatible; egile-prospectfinder)"},
+        )
+        response.raise_for_status()
+        return self.parse(response.text, limit, sector, country)
+
+    def parse(
+        self, page: str, limit: int, sector: str = "", country: str = ""
+    ) -> list[Prospect]:
+        """Extract results from a DuckDuckGo HTML results page."""
+        results = []
+        for match in self._result_re.finditer(page):
+            link = self._unwrap(html.unescape(match.group("href")))
+            title = html.unescape(self._tag_re.sub("", match.group("title"))).strip()
+            snippet = html.unescape(self._tag_re.sub("", match.group("snippet") or "")).strip()
+            results.append(self._result(title, link, snippet, sector, country))
+            if len(results) >= limit:
+                break
+        return results
+
+    @staticmethod
+    def _unwrap(href: str) -> str:
+        """Resolve DuckDuckGo redirect links to the target URL."""
+        parsed = urlparse(href)
+        if parsed.path.startswith("/l/"):
+            target = parse_qs(parsed.query).get("uddg")
+            if target:
+                return target[0]
+        if href.startswith("//"):
+            return f"https:{href}"
+        return href
+
+
+class SearchServiceProvider(SearchProvider):
+    """Adapter running the synchronous ``SearchService`` in a worker thread."""
+
+    name = "search_service"
+
+    def __init__(self, service: Any | None = None):
+        if service is None:
+            from egile_mcp_prospectfinder.search_service import SearchService
+            service = SearchService()
+        self.service = service
+
+    async def search(
+        self, client: httpx.AsyncClient, sector: str, country: str, limit: int
+    ) -> list[Prospect]:
+        results = await asyncio.to_thread(self.service.search_prospects, sector, country, limit)
+        return [
+            Prospect.from_dict({"source": self.name, **result}, sector, country)
+            for result in results
+        ]
+
+
+def build_providers(
+    names: list[str], search_service: Any | None = None
+) -> list[SearchProvider]:
+    """
+    Build providers by name, reading API keys from the environment.
+
+    Providers whose credentials are missing are skipped with a warning.
+
+    Args:
+        names: Provider names ("google", "brave", "duckduckgo", "search_service")
+        search_service: Service instance backing the "search_service" provider
+
+    Returns:
+        The configured providers, in the requested order
+    """
+    providers: list[SearchProvider] = []
+    for name in names:
+        if name == "google":
+            api_key, cse_id = os.getenv("GOOGLE_API_KEY"), os.getenv("GOOGLE_CSE_ID")
+            if not (api_key and cse_id):
+                logger.warning("Skipping google provider: GOOGLE_API_KEY/GOOGLE_CSE_ID not set")
+                continue
+            providers.append(GoogleCSEProvider(api_key, cse_id))
+        elif name == "brave":
+            api_key = os.getenv("BRAVE_API_KEY")
+            if not api_key:
+                logger.warning("Skipping brave provider: BRAVE_API_KEY not set")
+                continue
+            providers.append(BraveProvider(api_key))
+        elif name == "duckduckgo":
+            providers.append(DuckDuckGoProvider())
+        elif name == "search_service":
+            providers.append(SearchServiceProvider(search_service))
+        else:
+            raise ValueError(f"Unsupported search provider: {name}")
+    return providers
@@ -0,0 +1,217 @@
+"""Relevance re-ranking and near-duplicate pruning of search results.
+
+Search engines mix company sites with directories, job boards and the same
+company under several URLs. ``ResultRanker`` drops results from a blocklist of
+aggregator domains, keeps one result per site, scores the rest against the
+sector with TF-IDF cosine similarity, and prunes near-duplicates whose title
+and snippet MinHash signatures match. All scoring is vectorized with NumPy,
+which is an optional dependency (``pip install egile-agent-prospectfinder[rerank]``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from .normalization import SECTORS, fold, lemma
+from .prospect import Prospect
+
+logger = logging.getLogger(__name__)
+
+# Directories, review sites, job boards and social networks list companies
+# rather than being one
+DEFAULT_BLOCKLIST = frozenset(
+    {
+        "linkedin.com", "facebook.com", "instagram.com", "twitter.com", "x.com",
+        "youtube.com", "wikipedia.org", "crunchbase.com", "bloomberg.com",
+        "indeed.com", "glassdoor.com", "monster.com", "stepstone.be", "jobat.be",
+        "welcometothejungle.com", "yelp.com", "trustpilot.com", "tripadvisor.com",
+        "clutch.co", "goodfirms.co", "sortlist.com", "sortlist.be", "europages.com",
+        "kompass.com", "yellowpages.com", "goldenpages.be", "pagesdor.be",
+        "dnb.com", "zoominfo.com", "opencorporates.com", "companyweb.be",
+        "trendstop.knack.be", "infobel.com", "cylex.be", "hotfrog.be",
+    }
+)
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the to "
+    "we with you your de des du et la le les en het een van voor und der die".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Fold, split and lemmatize text into index terms."""
+    return [lemma(word) for word in fold(text).split() if word not in _STOPWORDS]
+
+
+def site_of(link: str) -> str:
+    """Return the host of a link without ``www.``."""
+    host = link.split("://", 1)[-1].split("/", 1)[0].split(":", 1)[0].lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def is_blocked(link: str, blocklist: Iterable[str]) -> bool:
+    """Check whether a link's host is a blocklisted domain or one of its subdomains."""
+    host = site_of(link)
+    return any(host == domain or host.endswith("." + domain) for domain in blocklist)
+
+
+def sector_terms(sector: str) -> list[str]:
+    """Query terms for a sector: its name plus the synonyms of a canonical sector."""
+    synonyms = SECTORS.get(sector, ())
+    return tokenize(" ".join((sector, *synonyms)))
+
+
+def tfidf_scores(documents: list[list[str]], query: list[str]) -> np.ndarray:
+    """
+    Cosine similarity between each document and the query in TF-IDF space.
+
+    Term frequencies are sublinear (1 + log tf), IDF is smoothed over the
+    documents, and rows are L2-normalized.
+    """
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for row, terms in enumerate([*documents, query]):
+        for term in terms:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+    counts = np.zeros((len(documents) + 1, max(len(vocabulary), 1)))
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+
+    tf = np.zeros_like(counts)
+    np.log(counts, out=tf, where=counts > 0)
+    tf[counts > 0] += 1.0
+    df = np.count_nonzero(counts[:-1], axis=0)
+    idf = np.log((1 + len(documents)) / (1 + df)) + 1.0
+    weights = tf * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    weights /= np.where(norms == 0, 1.0, norms)
+    scores: np.ndarray = weights[:-1] @ weights[-1]
+    return scores
+
+
+class MinHasher:
+    """MinHash signatures of word-shingle sets, for estimating Jaccard similarity."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 2, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        # Multiply-xor hash family over 64-bit shingle hashes (wrapping arithmetic)
+        self._xor = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+        self._mul = rng.integers(0, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+    def signature(self, terms: list[str]) -> np.ndarray:
+        """Return the MinHash signature of a term sequence."""
+        k = self.shingle_size
+        shingles = {" ".join(terms[i : i + k]) for i in range(max(len(terms) - k + 1, 1))}
+        hashes = np.array(
+            [
+                int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+                for s in shingles
+            ],
+            dtype=np.uint64,
+        )
+        with np.errstate(over="ignore"):
+            permuted = (hashes[:, None] ^ self._xor) * self._mul
+        signature: np.ndarray = permuted.min(axis=0)
+        return signature
+
+
+@dataclass
+class RankingStats:
+    """What a ranking pass removed."""
+
+    blocked: int = 0
+    same_site: int = 0
+    near_duplicates: int = 0
+
+
+class ResultRanker:
+    """Blocklist filtering, relevance re-ranking and near-duplicate pruning."""
+
+    def __init__(
+        self,
+        blocklist: Iterable[str] | None = None,
+        duplicate_threshold: float = 0.7,
+        one_per_site: bool = True,
+    ):
+        """
+        Initialize the ranker.
+
+        Args:
+            blocklist: Aggregator domains to drop (default: ``DEFAULT_BLOCKLIST``)
+            duplicate_threshold: Estimated Jaccard similarity of title and snippet
+                shingles above which a lower-ranked result is a near-duplicate
+            one_per_site: Keep only the best result per host
+        """
+        self.blocklist = frozenset(
+            DEFAULT_BLOCKLIST if blocklist is None else (d.lower() for d in blocklist)
+        )
+        self.duplicate_threshold = duplicate_threshold
+        self.one_per_site = one_per_site
+        self._minhash = MinHasher()
+
+    def rank(
+        self, prospects: list[Prospect], sector: str, limit: int
+    ) -> tuple[list[Prospect], RankingStats]:
+        """
+        Return the ``limit`` most relevant distinct prospects.
+
+        Args:
+            prospects: Search results, in engine order
+            sector: Sector the results are scored against
+            limit: Number of results to keep
+
+        Returns:
+            The kept prospects, best first, and what was removed
+        """
+        stats = RankingStats()
+        candidates = []
+        seen_sites: set[str] = set()
+        for prospect in prospects:
+            if is_blocked(prospect.link, self.blocklist):
+                stats.blocked += 1
+                continue
+            if self.one_per_site:
+                site = site_of(prospect.link)
+                if site in seen_sites:
+                    stats.same_site += 1
+                    continue
+                seen_sites.add(site)
+            candidates.append(prospect)
+        if not candidates:
+            return [], stats
+
+        documents = [tokenize(f"{p.title} {p.snippet}") for p in candidates]
+        scores = tfidf_scores(documents, sector_terms(sector))
+        # Stable sort keeps the engine order among equally relevant results
+        order = np.argsort(-scores, kind="stable")
+
+        signatures = np.stack(
+            [
+                self._minhash.signature(terms or [p.link])
+                for terms, p in zip(documents, candidates)
+            ]
+        )
+        kept: list[int] = []
+        for index in order:
+            if len(kept) >= limit:
+                break
+            if kept:
+                similarity = (signatures[kept] == signatures[index]).mean(axis=1)
+                if similarity.max() >= self.duplicate_threshold:
+                    stats.near_duplicates += 1
+                    continue
+            kept.append(int(index))
+
+        logger.debug(
+            "Ranked %d results: kept %d, blocked=%d, same_site=%d, near_duplicates=%d",
+            len(prospects), len(kept), stats.blocked, stats.same_site, stats.near_duplicates,
+        )
+        return [candidates[i] for i in kept], stats
@@ -0,0 +1,189 @@
+"""Process-wide registry of shared, reference-counted MCP connections."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from .mcp_client import MCPClient
+
+logger = logging.getLogger(__name__)
+
+ConnectionKey = tuple[str, str, int, str | None]
+
+
+@dataclass
+class _SharedConnection:
+    client: MCPClient
+    refs: int = 0
+    ready: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task | None = None
+
+
+class MCPConnectionRegistry:
+    """
+    Shares one MCPClient per (transport, host, port, command) across users.
+
+    Each connection is opened and closed by a dedicated background task, so a
+    stdio server subprocess is spawned once no matter how many plugins use it
+    and is torn down when the last user releases it. Settings not part of the
+    key (such as ``timeout``) are taken from the first caller.
+    """
+
+    def __init__(self) -> None:
+        self._connections: dict[ConnectionKey, _SharedConnection] = {}
+        # Dead connections still held by users, kept so they can be released
+        self._retired: list[_SharedConnection] = []
+        self._lock: asyncio.Lock | None = None
+
+    @staticmethod
+    def key_for(transport: str, host: str, port: int, command: str | None) -> ConnectionKey:
+        """Return the registry key for a set of connection settings."""
+        # Host, port and command only matter for the transports that use them
+        if transport == "stdio":
+            return (transport, "", 0, command)
+        if transport == "inprocess":
+            return (transport, "", 0, None)
+        return (transport, host, port, None)
+
+    async def acquire(
+        self,
+        transport: str = "stdio",
+        host: str = "localhost",
+        port: int = 8000,
+        command: str | None = None,
+        **client_kwargs: Any,
+    ) -> MCPClient:
+        """
+        Get a connected client for the given settings, connecting on first use.
+
+        Args:
+            transport: Transport mode
+            host: Server host (for network transports)
+            port: Server port (for network transports)
+            command: Command to start the server (for stdio transport)
+            **client_kwargs: Extra MCPClient arguments used when connecting
+
+        Returns:
+            A connected, shared MCPClient
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        key = self.key_for(transport, host, port, command)
+
+        # The lock only guards the table; connecting happens outside it so a slow
+        # server does not hold up users of other keys
+        async with self._lock:
+            connection = self._connections.get(key)
+            if connection is not None and self._is_dead(connection):
+                logger.warning("Shared MCP connection %s died; reconnecting", key)
+                del self._connections[key]
+                self._retired.append(connection)
+                connection = None
+            created = connection is None
+            if connection is None:
+                client = MCPClient(
+                    transport=transport, host=host, port=port, command=command, **client_kwargs
+                )
+                connection = _SharedConnection(client=client)
+                connection.task = asyncio.create_task(self._run(connection))
+                self._connections[key] = connection
+            connection.refs += 1
+
+        try:
+            await asyncio.shield(connection.ready)
+        except BaseException:
+            async with self._lock:
+                connection.refs -= 1
+                failed = connection.ready.done() and (
+                    connection.ready.cancelled() or connection.ready.exception() is not None
+                )
+                if self._connections.get(key) is connection and (failed or connection.refs == 0):
+                    del self._connections[key]
+                    connection.stop.set()
+            raise
+        if created:
+            logger.info("Opened shared MCP connection %s", key)
+        logger.info("Acquired shared MCP connection %s (refs=%d)", key, connection.refs)
+        return connection.client
+
+    async def release(self, client: MCPClient) -> None:
+        """
+        Release a client obtained from ``acquire``.
+
+        The underlying connection is closed when its last user releases it.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            for connection in self._retired:
+                if connection.client is client:
+                    # Its background task already closed the client
+                    connection.refs -= 1
+                    if connection.refs <= 0:
+                        self._retired.remove(connection)
+                    return
+            for key, connection in self._connections.items():
+                if connection.client is client:
+                    break
+            else:
+                logger.warning("Releasing an MCP client that is not registered; closing it")
+                await client.close()
+                return
+
+            connection.refs -= 1
+            logger.info("Released shared MCP connection %s (refs=%d)", key, connection.refs)
+            if connection.refs > 0:
+                return
+            del self._connections[key]
+
+        connection.stop.set()
+        if connection.task is not None:
+            await connection.task
+        logger.info("Closed shared MCP connection %s", key)
+
+    def refcount(self, client: MCPClient) -> int:
+        """Return the number of users holding ``client``."""
+        for connection in [*self._connections.values(), *self._retired]:
+            if connection.client is client:
+                return connection.refs
+        return 0
+
+    @staticmethod
+    def _is_dead(connection: _SharedConnection) -> bool:
+        """Whether a connected connection's task ended without being asked to stop."""
+        return (
+            connection.task is not None
+            and connection.task.done()
+            and not connection.stop.is_set()
+            and connection.ready.done()
+            and not connection.ready.cancelled()
+            and connection.ready.exception() is None
+        )
+
+    @staticmethod
+    async def _run(connection: _SharedConnection) -> None:
+        """Own the connection lifecycle so it is entered and exited in the same task."""
+        try:
+            await connection.client.connect()
+        except asyncio.CancelledError:
+            connection.ready.cancel()
+            raise
+        except Exception as e:
+            connection.ready.set_exception(e)
+            return
+        connection.ready.set_result(None)
+        try:
+            await connection.stop.wait()
+        finally:
+            await connection.client.close()
+
+
+# Default registry shared by every plugin in the process
+mcp_registry = MCPConnectionRegistry()
@@ -22,32 +22,35 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
-import uvicorn
 
-from egile_agent_core.models import OpenAI, XAI, Mistral
+import uvicorn
+from dotenv import load_dotenv
+from egile_agent_core.models import XAI, Mistral, OpenAI
 from egile_agent_core.server import create_agent_os
-from egile_agent_prospectfinder import ProspectFinderPlugin
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.logging_config import configure_logging_from_env
+from egile_agent_prospectfinder.watchdog import ASGIApp, LoopWatchdog
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
-def create_prospectfinder_agent_os():
-    """Create AgentOS with ProspectFinder plugin."""
+def create_prospectfinder_agent_os(plugin: ProspectFinderPlugin | None = None):
+    """Create AgentOS with ProspectFinder plugin.
+
+    Args:
+        plugin: Preconfigured plugin to use instead of the environment-based default
+    """
     
     # Create the ProspectFinder plugin
-    plugin = ProspectFinderPlugin(
-        mcp_host=os.getenv("MCP_HOST", "localhost"),
-        mcp_port=int(os.getenv("MCP_PORT", "8001")),  # MCP on 8001, AgentOS on 8000
-    )
+    if plugin is None:
+        plugin = ProspectFinderPlugin(
+            mcp_host=os.getenv("MCP_HOST", "localhost"),
+            mcp_port=int(os.getenv("MCP_PORT", "8001")),  # MCP on 8001, AgentOS on 8000
+        )
     
     # Configure agent with the plugin
     # Model selection priority: Mistral > XAI > OpenAI
@@ -85,6 +88,19 @@ def create_prospectfinder_agent_os():
     return agent_os
 
 
+def watch_event_loop(app: ASGIApp) -> ASGIApp:
+    """Wrap the AgentOS app with the event-loop lag watchdog unless LOOP_WATCHDOG=0.
+
+    Lag is served as a histogram at /_watchdog/event-loop; stalls longer than
+    LOOP_LAG_THRESHOLD_MS (default 250) are logged with the blocking stack.
+    The watchdog stops when the server shuts down.
+    """
+    if os.getenv("LOOP_WATCHDOG", "1") == "0":
+        return app
+    watchdog = LoopWatchdog(threshold=float(os.getenv("LOOP_LAG_THRESHOLD_MS", "250")) / 1000)
+    return watchdog.asgi_app(app)
+
+
 async def start_mcp_server():
     """Start the MCP server in a subprocess."""
     logger.info("Starting MCP server on port 8001...")
@@ -104,7 +120,7 @@ async def start_mcp_server():
     
     if process.poll() is not None:
         stderr = process.stderr.read() if process.stderr else ""
-        logger.error(f"MCP server failed to start: {stderr}")
+        logger.error("MCP server failed to start: %s", stderr)
         return None
     
     logger.info("✅ MCP server started successfully")
@@ -119,7 +135,7 @@ def start_agent_ui():
     logger.info("To start the Agent UI, run in a separate terminal:")
     logger.info("="*60)
     if ui_path.exists():
-        logger.info(f"cd {ui_path}")
+        logger.info("cd %s", ui_path)
         logger.info("pnpm dev")
     else:
         logger.info("cd /path/to/agent-ui")
@@ -131,6 +147,9 @@ def start_agent_ui():
 
 def run_all():
     """Run all services (MCP server + AgentOS)."""
+    # Records are queued and written by a background thread, as JSON lines
+    # unless LOG_FORMAT=text
+    configure_logging_from_env()
     logger.info("🚀 Starting ProspectFinder Agent System...")
     logger.info("="*60)
     
@@ -151,7 +170,7 @@ def run_all():
         # Create and run AgentOS
         logger.info("Starting AgentOS on port 8000...")
         agent_os = create_prospectfinder_agent_os()
-        app = agent_os.get_app()
+        app = watch_event_loop(agent_os.get_app())
         
         logger.info("✅ AgentOS started successfully")
         logger.info("\n" + "="*60)
@@ -162,8 +181,8 @@ def run_all():
         logger.info("Agent UI:     http://localhost:3000 (start separately)")
         logger.info("="*60 + "\n")
         
-        # Run uvicorn
-        uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+        # Run uvicorn; log_config=None leaves its loggers on the queued root handler
+        uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", log_config=None)
         
     except KeyboardInterrupt:
         logger.info("\n🛑 Shutting down...")
@@ -176,11 +195,12 @@ def run_all():
 
 def run_agent_only():
     """Run only the AgentOS server (assumes MCP is running separately)."""
+    configure_logging_from_env()
     logger.info("🚀 Starting AgentOS on port 8000...")
     logger.info("(Connecting to MCP server at localhost:8001)")
     
     agent_os = create_prospectfinder_agent_os()
-    app = agent_os.get_app()
+    app = watch_event_loop(agent_os.get_app())
     
     logger.info("\n" + "="*60)
     logger.info("AgentOS Ready!")
@@ -190,13 +210,14 @@ def run_agent_only():
     logger.info("Agent UI:     http://localhost:3000 (start separately)")
     logger.info("="*60 + "\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", log_config=None)
 
 
 def run_mcp_only():
     """Run only the MCP server."""
     from egile_mcp_prospectfinder import server
     
+    configure_logging_from_env()
     logger.info("🚀 Starting MCP server on port 8001...")
     
     # Run the MCP server
@@ -0,0 +1,261 @@
+"""Event-loop lag watchdog.
+
+A heartbeat coroutine sleeps for a fixed interval and records how late it
+wakes up into a histogram. A sampling thread watches the heartbeat. When the
+loop has not beaten for longer than the threshold, it captures the loop
+thread's stack and logs it. The log line names the plugin method on that
+stack, so synchronous work on the loop is reported as it happens, not by
+users.
+
+The sampler only reads code objects and line numbers of the loop thread's
+frames, never their locals: materializing ``f_locals`` of a frame that is
+still executing in another thread races with that thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Awaitable, Callable
+from types import CodeType, FrameType
+from typing import Any
+
+from egile_agent_core.plugins import Plugin
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the lag histogram buckets, in seconds
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float("inf"))
+METRICS_PATH = "/_watchdog/event-loop"
+
+ASGIApp = Callable[[dict, Any, Any], Awaitable[None]]
+
+
+class LagHistogram:
+    """Cumulative histogram of event-loop lag samples."""
+
+    def __init__(self, buckets: tuple[float, ...] = LAG_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, lag: float) -> None:
+        """Record one lag sample in seconds."""
+        for i, bound in enumerate(self.buckets):
+            if lag <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total += lag
+        self.max = max(self.max, lag)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cumulative bucket counts and summary values (seconds)."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else f"{bound:g}"] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum": self.total, "max": self.max}
+
+    def prometheus(self, name: str = "event_loop_lag_seconds") -> str:
+        """Render the histogram in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [f"# HELP {name} Event loop scheduling lag.", f"# TYPE {name} histogram"]
+        for bound, count in snapshot["buckets"].items():
+            lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+        lines.append(f"{name}_sum {snapshot['sum']:.6f}")
+        lines.append(f"{name}_count {snapshot['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _plugin_methods() -> dict[CodeType, str]:
+    """Map the code object of every method defined on a Plugin class to its qualified name."""
+    methods: dict[CodeType, str] = {}
+    pending: list[type] = [Plugin]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        for value in vars(cls).values():
+            func = inspect.unwrap(getattr(value, "__func__", value))
+            code = getattr(func, "__code__", None)
+            if isinstance(code, CodeType):
+                methods[code] = func.__qualname__
+    return methods
+
+
+def attribute(frame: FrameType | None) -> str:
+    """
+    Describe what a blocked stack was doing.
+
+    Returns the outermost plugin method on the stack, i.e. the tool call, with
+    its location; otherwise the innermost frame's location. Frames are matched
+    by code object, so the (possibly running) frames' locals are never read.
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    if not frames:
+        return "unknown"
+    methods = _plugin_methods()
+    for candidate in reversed(frames):
+        code = candidate.f_code
+        if code in methods:
+            return f"{methods[code]} ({code.co_filename}:{candidate.f_lineno})"
+    code = frames[0].f_code
+    return f"{code.co_name} ({code.co_filename}:{frames[0].f_lineno})"
+
+
+class LoopWatchdog:
+    """Measures event-loop lag and reports what blocked the loop."""
+
+    def __init__(
+        self, interval: float = 0.1, threshold: float = 0.25, stack_depth: int = 15
+    ):
+        """
+        Initialize the watchdog.
+
+        Args:
+            interval: Seconds between heartbeats
+            threshold: Lag in seconds above which the blocking stack is captured
+            stack_depth: Innermost stack frames included in the report
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_depth = stack_depth
+        self.histogram = LagHistogram()
+        self.stalls = 0
+        self._last_beat = 0.0
+        self._stalled = False
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the heartbeat is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        if self.running:
+            return
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._beat())
+        self._sampler = threading.Thread(
+            target=self._sample, name="loop-watchdog", daemon=True
+        )
+        self._sampler.start()
+        logger.info(
+            "Event loop watchdog started (interval=%.0f ms, threshold=%.0f ms)",
+            self.interval * 1000, self.threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the sampling thread."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._sampler is not None:
+            await asyncio.to_thread(self._sampler.join)
+            self._sampler = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the lag histogram and the number of reported stalls."""
+        return {**self.histogram.snapshot(), "stalls": self.stalls}
+
+    async def _beat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._last_beat = time.monotonic()
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.histogram.observe(lag)
+            if self._stalled:
+                self._stalled = False
+                logger.warning("Event loop recovered after %.0f ms lag", lag * 1000)
+
+    def _sample(self) -> None:
+        """Sampling thread: capture the loop thread's stack while it is blocked."""
+        poll = min(self.interval, self.threshold) / 2
+        while not self._stop.wait(poll):
+            lag = time.monotonic() - self._last_beat - self.interval
+            if lag <= self.threshold or self._stalled:
+                continue
+            loop_thread = self._loop_thread
+            frame = sys._current_frames().get(loop_thread) if loop_thread is not None else None
+            culprit = attribute(frame)
+            stack = "".join(traceback.format_stack(frame)[-self.stack_depth :]) if frame else ""
+            del frame
+            self._stalled = True
+            self.stalls += 1
+            logger.warning(
+                "Event loop blocked for over %.0f ms in %s\n%s", lag * 1000, culprit, stack,
+                extra={"blocked_in": culprit, "lag_ms": round(lag * 1000)},
+            )
+
+    def asgi_app(
+        self,
+        app: ASGIApp,
+        metrics_path: str = METRICS_PATH,
+    ) -> ASGIApp:
+        """
+        Wrap an ASGI app so the watchdog runs in the server's event loop.
+
+        The watchdog starts with the first lifespan or request event and stops
+        on lifespan shutdown. The wrapper also serves the lag histogram at
+        ``metrics_path`` in the Prometheus text format.
+
+        Raises:
+            ValueError: If the wrapped app has a route at ``metrics_path``
+        """
+        routes = getattr(app, "routes", ())
+        if any(getattr(route, "path", None) == metrics_path for route in routes):
+            raise ValueError(f"{metrics_path} is already routed by the wrapped app")
+
+        async def watched(scope: dict, receive: Any, send: Any) -> None:
+            if not self.running:
+                self.start()
+            if scope["type"] == "lifespan":
+
+                async def receive_until_shutdown() -> dict:
+                    message: dict = await receive()
+                    if message["type"] == "lifespan.shutdown":
+                        await self.stop()
+                    return message
+
+                await app(scope, receive_until_shutdown, send)
+                return
+            if scope["type"] == "http" and scope["path"] == metrics_path:
+                body = self.histogram.prometheus().encode()
+                body += (
+                    "# HELP event_loop_stalls_total Event loop stalls over the threshold.\n"
+                    "# TYPE event_loop_stalls_total counter\n"
+                    f"event_loop_stalls_total {self.stalls}\n"
+                ).encode()
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 200,
+                        "headers": [(b"content-type", b"text/plain; version=0.0.4")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": body})
+                return
+            await app(scope, receive, send)
+
+        return watched
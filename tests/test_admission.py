@@ -0,0 +1,71 @@
+"""Tests for admission control and load shedding."""
+
+import asyncio
+import json
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.admission import AdmissionController, OverloadedError
+
+
+class TestAdmissionController:
+    """Tests for the AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_queue_full_is_shed_immediately(self):
+        """Test that calls beyond inflight + queue capacity fail fast."""
+        controller = AdmissionController(max_inflight=1, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.admit():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with pytest.raises(OverloadedError) as exc_info:
+            async with controller.admit():
+                pass
+        assert exc_info.value.reason == "queue_full"
+
+        release.set()
+        await asyncio.gather(holder, queued)
+        stats = controller.stats()
+        assert stats["admitted"] == 2
+        assert stats["shed_queue_full"] == 1
+        assert stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """Test that queued calls give up after queue_timeout."""
+        controller = AdmissionController(max_inflight=1, max_queue=4, queue_timeout=0.05)
+
+        async with controller.admit():
+            with pytest.raises(OverloadedError) as exc_info:
+                async with controller.admit():
+                    pass
+
+        assert exc_info.value.reason == "queue_timeout"
+        assert controller.stats()["shed_queue_timeout"] == 1
+        assert controller.stats()["inflight"] == 0
+
+
+class TestPluginAdmission:
+    """Tests for admission control in the plugin."""
+
+    @pytest.mark.asyncio
+    async def test_busy_result_when_saturated(self):
+        """Test that a saturated plugin returns a structured busy result."""
+        plugin = ProspectFinderPlugin(max_inflight=1, max_queue=0)
+
+        async with plugin._admission.admit():
+            result = await plugin.find_prospects("Marketing")
+
+        busy = json.loads(result)
+        assert busy["status"] == "busy"
+        assert busy["reason"] == "queue_full"
+        assert busy["retry_after_seconds"] > 0
+        assert plugin.get_metrics()["admission"]["shed"] == 1
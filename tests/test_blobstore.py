@@ -0,0 +1,111 @@
+"""Tests for content-addressed result storage."""
+
+import os
+import time
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.blobstore import BlobStore, summarize_result
+
+
+class FakeSearchService:
+    """Search service returning numbered results."""
+
+    def search_prospects(self, sector, country, limit):
+        return [
+            {"title": f"Company {i}", "link": f"https://c{i}.example/"}
+            for i in range(limit)
+        ]
+
+
+class TestBlobStore:
+    """Tests for BlobStore and result summaries."""
+
+    def test_put_is_content_addressed(self, tmp_path):
+        """Test that equal texts share one blob and can be read back."""
+        store = BlobStore(tmp_path)
+
+        ref = store.put("full result")
+
+        assert store.put("full result") == ref
+        assert store.get(ref) == "full result"
+        assert len(list(tmp_path.rglob("*.gz"))) == 1
+        with pytest.raises(KeyError):
+            store.get("0" * len(ref))
+        with pytest.raises(KeyError):
+            store.get("../../etc/passwd")
+
+    def test_collect_expired_and_over_budget(self, tmp_path):
+        """Test that old blobs expire and the least recently used go over budget."""
+        store = BlobStore(tmp_path, max_age=3600)
+        old, recent, used = (store.put(text * 200) for text in ("old", "recent", "used"))
+        two_hours_ago = time.time() - 7200
+        os.utime(store._path(old), (two_hours_ago, two_hours_ago))
+        os.utime(store._path(used), (two_hours_ago + 10, two_hours_ago + 10))
+        store.get(used)
+
+        assert store.collect() == 1
+        with pytest.raises(KeyError):
+            store.get(old)
+
+        # Over budget: the blob read least recently goes first
+        store.max_bytes = store._path(used).stat().st_size
+        store.get(used)
+        assert store.collect() == 1
+        assert store.get(used) == "used" * 200
+        with pytest.raises(KeyError):
+            store.get(recent)
+
+    def test_put_collects_over_budget(self, tmp_path):
+        """Test that a put exceeding the size budget triggers collection."""
+        store = BlobStore(tmp_path, max_bytes=1)
+
+        ref = store.put("only")
+
+        with pytest.raises(KeyError):
+            store.get(ref)
+        assert store._size == 0
+
+    def test_summarize_result(self):
+        """Test that summaries keep the heading and first items only."""
+        text = (
+            "Found 4 Legal prospects in Belgium:\n\n"
+            "1. A - https://a.be\n   Email: a@a.be\n"
+            "2. B - https://b.be\n3. C - https://c.be\n4. D - https://d.be\n"
+        )
+
+        summary = summarize_result(text, "abc", max_items=2)
+
+        assert summary.splitlines()[:4] == [
+            "Found 4 Legal prospects in Belgium:", "", "1. A - https://a.be", "2. B - https://b.be"
+        ]
+        assert "Email" not in summary
+        assert '2 more prospects' in summary and 'get_prospect_result(ref="abc")' in summary
+
+
+class TestResultReferences:
+    """Tests for summaries and get_prospect_result through the plugin."""
+
+    @pytest.mark.asyncio
+    async def test_summary_and_expansion(self, tmp_path):
+        """Test that find_prospects returns a summary that expands to the full result."""
+        plugin = ProspectFinderPlugin(
+            search_service=FakeSearchService(), result_store_dir=str(tmp_path)
+        )
+        await plugin.on_agent_start(None)
+
+        summary = await plugin.find_prospects("law firms", "BE", limit=20)
+        ref = summary.rsplit('ref="', 1)[1].split('"')[0]
+        full = await plugin.get_prospect_result(ref)
+
+        assert summary.startswith("Found 20 Legal prospects in Belgium")
+        assert "20. Company 19" in full and "20. Company 19" not in summary
+        assert len(summary) < len(full) / 2
+        assert "get_prospect_result" in plugin.get_tool_functions()
+        assert [t["function"]["name"] for t in plugin.get_tools()][-1] == "get_prospect_result"
+        assert "No stored prospect result" in await plugin.get_prospect_result("nope")
+
+    def test_disabled_by_default(self):
+        """Test that the tool is only offered with a result store."""
+        assert "get_prospect_result" not in ProspectFinderPlugin().get_tool_functions()
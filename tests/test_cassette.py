@@ -0,0 +1,80 @@
+"""Tests for cassette record/replay."""
+
+import json
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.cassette import Cassette, CassetteMissError
+
+
+class FakeSearchService:
+    """Search service that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def search_prospects(self, sector, country, limit=10):
+        self.calls += 1
+        return [{"title": f"{sector} Co", "link": "https://example.com"}][:limit]
+
+
+class TestCassette:
+    """Tests for the Cassette class."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        """Test that recorded calls are served back in order."""
+        path = tmp_path / "searches.jsonl.gz"
+        recorder = Cassette(path, mode="record")
+        responses = iter(["first", "second"])
+
+        async def call():
+            return next(responses)
+
+        args = {"sector": "Marketing", "country": "Belgium", "limit": 5}
+        assert await recorder.call("mcp", args, call) == "first"
+        assert await recorder.call("mcp", args, call) == "second"
+        # Recording writes through to the file without keeping responses in memory
+        assert len(recorder) == 2
+        assert not recorder._entries
+        recorder.close()
+
+        player = Cassette(path, mode="replay")
+        assert len(player) == 2
+        assert await player.call("mcp", args) == "first"
+        assert await player.call("mcp", args) == "second"
+        # Exhausted entries keep serving the last response
+        assert await player.call("mcp", args) == "second"
+
+        with pytest.raises(CassetteMissError):
+            await player.call("direct", args)
+
+    def test_invalid_mode(self, tmp_path):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            Cassette(tmp_path / "x.jsonl", mode="rewind")
+
+
+class TestPluginCassette:
+    """Tests for cassette support in the plugin."""
+
+    @pytest.mark.asyncio
+    async def test_direct_mode_record_and_replay(self, tmp_path):
+        """Test that replay reproduces recorded direct-mode results offline."""
+        path = tmp_path / "direct.jsonl"
+        service = FakeSearchService()
+        plugin = ProspectFinderPlugin(
+            search_service=service, cassette_path=str(path), cassette_mode="record"
+        )
+        await plugin.on_agent_start(agent=None)
+        recorded = await plugin.find_prospects("Marketing", "Belgium", 5)
+        await plugin.cleanup()
+
+        entry = json.loads(path.read_text().splitlines()[0])
+        assert entry["b"] == "direct"
+        assert service.calls == 1
+
+        replay = ProspectFinderPlugin(cassette_path=str(path), cassette_mode="replay")
+        await replay.on_agent_start(agent=None)
+        assert await replay.find_prospects("Marketing", "Belgium", 5) == recorded
@@ -0,0 +1,117 @@
+"""Tests for deadline-bounded searches with partial results."""
+
+import asyncio
+import time
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.cache import TTLCache
+from egile_agent_prospectfinder.providers import SearchProvider
+
+
+class DelayedProvider(SearchProvider):
+    """Provider answering after a delay."""
+
+    def __init__(self, name, links, delay):
+        self.name = name
+        self.links = links
+        self.delay = delay
+
+    async def search(self, client, sector, country, limit):
+        await asyncio.sleep(self.delay)
+        return [self._result(link, link, "", sector, country) for link in self.links]
+
+
+async def start_plugin(**kwargs):
+    plugin = ProspectFinderPlugin(**kwargs)
+    await plugin.on_agent_start(None)
+    plugin._providers = [
+        DelayedProvider("fast", ["https://a.be"], 0.0),
+        DelayedProvider("slow", ["https://b.be"], 0.2),
+    ]
+    return plugin
+
+
+class TestDeadline:
+    """Tests for the deadline_ms argument of find_prospects."""
+
+    @pytest.mark.asyncio
+    async def test_partial_then_cached(self):
+        """Test that an expired deadline returns partial results and fills the cache."""
+        plugin = await start_plugin(search_providers=["duckduckgo"], result_cache_ttl=300)
+
+        partial = await plugin.find_prospects("IT", "Belgium", limit=2, deadline_ms=50)
+        assert partial.startswith("Partial results: the 50 ms deadline expired")
+        assert "https://a.be" in partial and "https://b.be" not in partial
+        assert plugin.get_metrics()["background_searches"] == 1
+
+        await asyncio.sleep(0.3)
+        complete = await plugin.find_prospects("IT", "Belgium", limit=2, deadline_ms=50)
+        assert complete.startswith("Found 2 Technology prospects in Belgium")
+        assert plugin.get_metrics()["background_searches"] == 0
+        await plugin.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_in_time(self):
+        """Test that a search finishing within the deadline is complete."""
+        plugin = await start_plugin()
+
+        result = await plugin.find_prospects("IT", "Belgium", limit=2, deadline_ms=2000)
+
+        assert result.startswith("Found 2 Technology prospects in Belgium")
+        assert plugin.get_metrics()["cached_results"] == 0
+        await plugin.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_background_searches(self):
+        """Test that cleanup does not leave searches running."""
+        plugin = await start_plugin(result_cache_ttl=300)
+
+        await plugin.find_prospects("IT", "Belgium", limit=2, deadline_ms=10)
+        await plugin.cleanup()
+
+        assert plugin.get_metrics()["background_searches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_partial_without_cache(self):
+        """Test that without a result cache the cut-short search is cancelled."""
+        plugin = await start_plugin()
+
+        partial = await plugin.find_prospects("IT", "Belgium", limit=2, deadline_ms=50)
+
+        assert partial.startswith("Partial results: the 50 ms deadline expired")
+        assert "background" not in partial
+        assert plugin.get_metrics()["background_searches"] == 0
+        await plugin.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_deadline_covers_synchronous_search_service(self):
+        """Test that a blocking search service does not hold up the deadline."""
+
+        class SlowService:
+            def search_prospects(self, sector, country, limit):
+                time.sleep(0.3)
+                return [{"title": "Acme", "link": "https://acme.be"}]
+
+        plugin = ProspectFinderPlugin(search_service=SlowService())
+        await plugin.on_agent_start(None)
+
+        start = time.monotonic()
+        partial = await plugin.find_prospects("IT", "Belgium", deadline_ms=50)
+
+        assert time.monotonic() - start < 0.25
+        assert partial.startswith("Partial results")
+        await plugin.cleanup()
+
+    def test_ttl_cache_expiry(self):
+        """Test that cache entries expire and the size bound evicts the oldest."""
+        cache = TTLCache(ttl=60, maxsize=1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        expired = TTLCache(ttl=-1)
+        expired.put("a", 1)
+        assert expired.get("a") is None
@@ -0,0 +1,99 @@
+"""Tests for incremental delta sweeps."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.delta import SeenSet, WatermarkStore, url_hash
+from egile_agent_prospectfinder.prospect import Prospect
+
+
+class FakeSearchService:
+    """Search service returning a growing result list."""
+
+    def __init__(self):
+        self.links = ["https://a.example/", "https://b.example/"]
+
+    def search_prospects(self, sector, country, limit):
+        return [{"title": link, "link": link} for link in self.links[:limit]]
+
+
+class TestWatermarkStore:
+    """Tests for the persistent seen-URL store."""
+
+    def test_seen_set_membership(self):
+        """Test membership across the sorted array and recent additions."""
+        seen = SeenSet([3, 1, 2])
+
+        assert 2 in seen and 4 not in seen
+        assert seen.add(4) is True
+        assert seen.add(4) is False
+        assert len(seen) == 4
+
+    def test_url_hash_uses_canonical_form(self):
+        """Test that trivially different spellings of a URL hash alike."""
+        assert url_hash("https://www.Example.com/page/") == url_hash("http://example.com/page")
+
+    def test_filter_new_persists(self, tmp_path):
+        """Test that seen URLs survive a reopened store."""
+        key = ("marketing", "BE")
+        first = [Prospect("A", "https://a.example/"), Prospect("B", "https://b.example/")]
+
+        store = WatermarkStore(tmp_path)
+        assert len(store.filter_new(key, first).new) == 2
+
+        reopened = WatermarkStore(tmp_path)
+        delta = reopened.filter_new(key, first + [Prospect("C", "https://c.example/")])
+
+        assert [p.title for p in delta.new] == ["C"]
+        assert delta.already_seen == 2
+        assert delta.previous_sweep > 0
+        assert reopened.watermark(key).sweeps == 2
+        assert reopened.filter_new(("marketing", "FR"), first).already_seen == 0
+
+    def test_concurrent_sweeps(self, tmp_path):
+        """Test that sweeps from several threads neither lose hashes nor corrupt the index."""
+        store = WatermarkStore(tmp_path)
+        keys = [("marketing", "BE"), ("legal", "BE")]
+
+        def sweep(i):
+            prospects = [Prospect(str(j), f"https://{i}-{j}.example/") for j in range(20)]
+            return store.filter_new(keys[i % 2], prospects)
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(sweep, range(16)))
+
+        assert all(len(result.new) == 20 for result in results)
+        reopened = WatermarkStore(tmp_path)
+        for key in keys:
+            assert reopened.watermark(key).sweeps == 8
+            assert reopened.watermark(key).seen == 160
+        assert reopened.unseen(keys[0], [Prospect("0", "https://0-0.example/")]) == []
+
+
+class TestDeltaPlugin:
+    """Tests for only_new searches through the plugin."""
+
+    @pytest.mark.asyncio
+    async def test_only_new(self, tmp_path):
+        """Test that repeated sweeps only return newly found prospects."""
+        service = FakeSearchService()
+        plugin = ProspectFinderPlugin(search_service=service, delta_dir=str(tmp_path))
+        await plugin.on_agent_start(None)
+
+        first = await plugin.find_prospects("marketing", "BE", only_new=True)
+        service.links.append("https://c.example/")
+        second = await plugin.find_prospects("Marketing agencies", "Belgium", only_new=True)
+        third = await plugin.find_prospects("Marketing", "Belgium", only_new=True)
+
+        assert first.startswith("Found 2 new Marketing prospects in Belgium")
+        assert second.startswith("Found 1 new Marketing prospects in Belgium")
+        assert "https://c.example/" in second
+        assert third == "No new prospects found for Marketing in Belgium."
+
+    def test_only_new_requires_delta_dir(self):
+        """Test that only_new is offered only when a delta directory is set."""
+        properties = ProspectFinderPlugin().get_tools()[0]["function"]["parameters"]["properties"]
+
+        assert "only_new" not in properties
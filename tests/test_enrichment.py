@@ -0,0 +1,178 @@
+"""Tests for homepage enrichment against a local HTTP stand-in server."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from egile_agent_prospectfinder import Prospect
+from egile_agent_prospectfinder.enrichment import (
+    BlockedHostError,
+    ProspectEnricher,
+    extract_contacts,
+    is_public_address,
+)
+
+HOMEPAGE = b"""<html><head>
+<meta content="Digital marketing &amp; SEO agency in Brussels" name="description">
+</head><body>
+<a href="mailto:hello@acme.be">Mail us</a> or sales@acme.be (logo@2x.png)
+<a href="tel:+32 2 123 45 67">Call</a>
+</body></html>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves a homepage and a large page, recording request times."""
+
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        StandInHandler.requests.append((self.headers["Host"], self.path, time.monotonic()))
+        body = HOMEPAGE if self.headers["Host"].startswith("127.") else b"x" * 100_000
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "http://169.254.169.254/latest/meta-data/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stand_in():
+    """Run the stand-in server on a free port."""
+    StandInHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+class TestExtractContacts:
+    """Tests for contact extraction."""
+
+    def test_extracts_emails_phones_and_description(self):
+        """Test extraction from a typical homepage."""
+        enrichment = extract_contacts(HOMEPAGE.decode())
+
+        assert enrichment.emails == ("hello@acme.be", "sales@acme.be")
+        assert enrichment.phones == ("+3221234567",)
+        assert enrichment.description == "Digital marketing & SEO agency in Brussels"
+
+    def test_long_runs_scan_in_linear_time(self):
+        """Test that inline base64-like runs do not make extraction quadratic."""
+        start = time.perf_counter()
+        extract_contacts("x" * 200_000)
+
+        assert time.perf_counter() - start < 1.0
+
+
+class TestProspectEnricher:
+    """Tests for the enrichment stage."""
+
+    @pytest.mark.asyncio
+    async def test_enrich_caches_and_spaces_requests(self, stand_in):
+        """Test that one host is fetched once per homepage and politely spaced."""
+        prospects = [
+            Prospect("Acme", f"http://127.0.0.1:{stand_in}/about"),
+            Prospect("Acme again", f"http://127.0.0.1:{stand_in}/contact"),
+            Prospect("Beta", f"http://localhost:{stand_in}/"),
+        ]
+        async with httpx.AsyncClient() as client:
+            enricher = ProspectEnricher(
+                client, per_domain_interval=0.2, max_bytes=1024, allow_private_hosts=True
+            )
+            enrichments = await enricher.enrich(prospects)
+            await enricher.enrich(prospects[:1])
+
+        assert enrichments[prospects[0].link].emails == ("hello@acme.be", "sales@acme.be")
+        assert enrichments[prospects[1].link] is enrichments[prospects[0].link]
+        # Both hosts fetched exactly once, always at the homepage
+        assert sorted(path for _, path, _ in StandInHandler.requests) == ["/", "/"]
+
+    @pytest.mark.asyncio
+    async def test_per_domain_interval(self, stand_in):
+        """Test that requests to the same host are spaced out."""
+        async with httpx.AsyncClient() as client:
+            enricher = ProspectEnricher(
+                client, per_domain_interval=0.2, cache_ttl=0, allow_private_hosts=True
+            )
+            await enricher.enrich_url(f"http://127.0.0.1:{stand_in}/")
+            await enricher.enrich_url(f"http://127.0.0.1:{stand_in}/")
+
+        first, second = (t for _, _, t in StandInHandler.requests)
+        assert second - first >= 0.19
+
+    @pytest.mark.asyncio
+    async def test_response_size_cap(self, stand_in):
+        """Test that large pages are truncated to max_bytes."""
+        async with httpx.AsyncClient() as client:
+            enricher = ProspectEnricher(client, max_bytes=1024, allow_private_hosts=True)
+            page = await enricher._read_capped(f"http://localhost:{stand_in}/")
+
+        assert len(page) == 1024
+
+    @pytest.mark.asyncio
+    async def test_bad_url_does_not_fail_the_batch(self, stand_in):
+        """Test that a URL the HTTP client rejects yields an empty enrichment."""
+        prospects = [
+            Prospect("Broken", "http://exa mple.com/"),
+            Prospect("Acme", f"http://127.0.0.1:{stand_in}/"),
+        ]
+        async with httpx.AsyncClient() as client:
+            enricher = ProspectEnricher(client, allow_private_hosts=True)
+            enrichments = await enricher.enrich(prospects)
+
+        assert enrichments["http://exa mple.com/"].error
+        assert not enrichments["http://exa mple.com/"].emails
+        assert enrichments[prospects[1].link].emails
+
+    @pytest.mark.asyncio
+    async def test_refuses_non_public_hosts(self, stand_in):
+        """Test that loopback targets and redirects to link-local addresses are refused."""
+        assert not is_public_address("10.0.0.1")
+        assert not is_public_address("::ffff:127.0.0.1")
+        assert is_public_address("8.8.8.8")
+
+        async with httpx.AsyncClient() as client:
+            enricher = ProspectEnricher(client)
+            enrichment = await enricher.enrich_url(f"http://127.0.0.1:{stand_in}/")
+            with pytest.raises(BlockedHostError):
+                await enricher._read_capped(f"http://localhost:{stand_in}/")
+
+            # The first hop is allowed here, the redirect target is not
+            enricher.allow_private_hosts = True
+            original = enricher._check_host
+
+            async def check_after_first_hop(url):
+                if "169.254" in url:
+                    enricher.allow_private_hosts = False
+                await original(url)
+
+            enricher._check_host = check_after_first_hop
+            with pytest.raises(BlockedHostError):
+                await enricher._read_capped(f"http://127.0.0.1:{stand_in}/redirect")
+
+        assert enrichment.error == "BlockedHostError"
+        assert not StandInHandler.requests[1:]
+
+    @pytest.mark.asyncio
+    async def test_domain_state_is_pruned(self, stand_in):
+        """Test that per-host politeness state does not accumulate."""
+        async with httpx.AsyncClient() as client:
+            enricher = ProspectEnricher(client, per_domain_interval=0, allow_private_hosts=True)
+            await enricher.enrich_url(f"http://127.0.0.1:{stand_in}/")
+            await enricher.enrich_url(f"http://localhost:{stand_in}/")
+
+        assert enricher._domain_locks == {}
+        assert enricher._domain_last == {}
@@ -0,0 +1,134 @@
+"""Tests for multi-provider fan-out search."""
+
+import asyncio
+
+import pytest
+
+from egile_agent_prospectfinder import Prospect, ProspectFinderPlugin
+from egile_agent_prospectfinder.fanout import canonical_url, fan_out_search, search_in_order
+from egile_agent_prospectfinder.providers import DuckDuckGoProvider, SearchProvider
+
+
+class FakeProvider(SearchProvider):
+    """Provider returning canned links after a delay."""
+
+    def __init__(self, name, links, delay=0.0):
+        self.name = name
+        self.links = links
+        self.delay = delay
+        self.cancelled = False
+        self.calls = 0
+
+    async def search(self, client, sector, country, limit):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.links is None:
+            raise RuntimeError("provider down")
+        self.calls += 1
+        return [self._result(link, link, "", sector, country) for link in self.links]
+
+
+class TestFanOut:
+    """Tests for fan_out_search."""
+
+    def test_canonical_url(self):
+        """Test that URL variants collapse to one key."""
+        assert canonical_url("https://www.Acme.be/") == canonical_url("http://acme.be")
+        assert canonical_url("https://acme.be/about") != canonical_url("https://acme.be")
+
+    @pytest.mark.asyncio
+    async def test_returns_first_k_and_cancels_stragglers(self):
+        """Test that the search stops at limit unique results."""
+        fast = FakeProvider("fast", ["https://a.be", "https://www.a.be/", "https://b.be"])
+        medium = FakeProvider("medium", ["https://c.be", "https://d.be"], delay=0.01)
+        slow = FakeProvider("slow", ["https://e.be"], delay=10)
+
+        outcome = await fan_out_search([fast, medium, slow], None, "IT", "Belgium", limit=3)
+
+        assert [r.link for r in outcome.results] == [
+            "https://a.be", "https://b.be", "https://c.be"
+        ]
+        assert outcome.completed == ["fast", "medium"]
+        assert outcome.cancelled == ["slow"]
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_results(self):
+        """Test that the deadline bounds the wait."""
+        fast = FakeProvider("fast", ["https://a.be"])
+        slow = FakeProvider("slow", ["https://b.be"], delay=10)
+
+        outcome = await fan_out_search([fast, slow], None, "IT", "Belgium", 5, deadline=0.05)
+
+        assert outcome.timed_out
+        assert [r.link for r in outcome.results] == ["https://a.be"]
+
+    @pytest.mark.asyncio
+    async def test_plugin_raises_when_all_providers_fail(self):
+        """Test that a fan-out where every provider fails is an error, not an empty result."""
+        plugin = ProspectFinderPlugin(search_providers=["duckduckgo"])
+        await plugin.on_agent_start(None)
+        plugin._providers = [FakeProvider("google", None), FakeProvider("brave", None)]
+        try:
+            with pytest.raises(RuntimeError, match="No search provider completed") as excinfo:
+                await plugin.find_prospects("Marketing", "Belgium")
+            assert "'google'" in str(excinfo.value) and "'brave'" in str(excinfo.value)
+        finally:
+            await plugin.cleanup()
+
+
+class TestSearchInOrder:
+    """Tests for the native in-order direct backend."""
+
+    @pytest.mark.asyncio
+    async def test_stops_when_limit_reached(self):
+        """Test that later providers are only queried when earlier ones come up short."""
+        down = FakeProvider("google", None)
+        short = FakeProvider("brave", ["https://a.be", "https://www.a.be"])
+        fallback = FakeProvider("duckduckgo", ["https://b.be", "https://c.be"])
+        unused = FakeProvider("extra", ["https://d.be"])
+
+        outcome = await search_in_order([down, short, fallback, unused], None, "IT", "BE", 3)
+
+        assert [r.link for r in outcome.results] == ["https://a.be", "https://b.be", "https://c.be"]
+        assert outcome.failed == ["google"]
+        assert outcome.completed == ["brave", "duckduckgo"]
+        assert unused.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_plugin_uses_pooled_client(self):
+        """Test that the default direct mode opens one client and closes it on cleanup."""
+        plugin = ProspectFinderPlugin()
+        await plugin.on_agent_start(None)
+        client = plugin._http_client
+        assert [provider.name for provider in plugin._providers][-1] == "duckduckgo"
+
+        plugin._providers = [FakeProvider("fake", ["https://a.be"])]
+        result = await plugin.find_prospects("IT", "Belgium", limit=1)
+        await plugin.cleanup()
+
+        assert result.startswith("Found 1 Technology prospects in Belgium")
+        assert client.is_closed
+
+
+class TestDuckDuckGoProvider:
+    """Tests for DuckDuckGo result parsing."""
+
+    def test_parse_unwraps_redirects(self):
+        """Test that redirect links are resolved to the target URL."""
+        page = (
+            '<a rel="nofollow" class="result__a" '
+            'href="//duckduckgo.com/l/?uddg=https%3A%2F%2Facme.be%2F&amp;rut=x">Acme <b>BV</b></a>'
+            '<a class="result__snippet" href="#">Marketing &amp; more</a>'
+            '<a rel="nofollow" class="result__a" href="https://beta.be">Beta</a>'
+        )
+        results = DuckDuckGoProvider().parse(page, 10)
+
+        assert results[0] == Prospect(
+            "Acme BV", "https://acme.be/", "Marketing & more", source="duckduckgo"
+        )
+        assert results[1].link == "https://beta.be"
+        assert results[1].snippet == ""
@@ -0,0 +1,96 @@
+"""Tests for the offline load test harness."""
+
+import json
+
+import httpx
+import pytest
+
+from egile_agent_prospectfinder.loadtest import (
+    STUB_COUNTRIES,
+    STUB_SECTORS,
+    _stub_tool_arguments,
+    percentile,
+    start_stub_model_server,
+)
+
+
+@pytest.fixture
+def stub_model():
+    """Run the stub model server for one test."""
+    server = start_stub_model_server()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}/v1/chat/completions"
+    server.shutdown()
+    server.server_close()
+
+
+def stream_events(response):
+    """Decode the ``data:`` events of a server-sent event stream."""
+    lines = response.text.splitlines()
+    events = [line[len("data: "):] for line in lines if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    return [json.loads(event) for event in events[:-1]]
+
+
+class TestLoadtest:
+    """Tests for the percentile helper and the stub model."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles and the empty case."""
+        values = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+        assert percentile([], 50) == 0.0
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 95) == 5.0
+        assert percentile(values, 100) == 5.0
+
+    def test_stub_tool_arguments(self):
+        """Test that tool arguments are deterministic and drawn from the stub lists."""
+        arguments = _stub_tool_arguments("Find marketing agencies")
+
+        assert arguments == _stub_tool_arguments("Find marketing agencies")
+        assert arguments["sector"] in STUB_SECTORS
+        assert arguments["country"] in STUB_COUNTRIES
+        assert arguments["limit"] == 10
+
+    def test_chat_completions(self, stub_model):
+        """Test a tool call for a user message, then a stop once the tool answered."""
+        messages = [{"role": "user", "content": "Find prospects"}]
+        first = httpx.post(stub_model, json={"model": "stub", "messages": messages}).json()
+
+        choice = first["choices"][0]
+        assert choice["finish_reason"] == "tool_calls"
+        call = choice["message"]["tool_calls"][0]
+        assert call["function"]["name"] == "find_prospects"
+        assert json.loads(call["function"]["arguments"]) == _stub_tool_arguments("Find prospects")
+
+        messages.append(choice["message"])
+        messages.append({"role": "tool", "tool_call_id": call["id"], "content": "ok"})
+        second = httpx.post(stub_model, json={"model": "stub", "messages": messages}).json()
+
+        assert second["choices"][0]["finish_reason"] == "stop"
+        assert second["choices"][0]["message"]["content"]
+
+    def test_chat_completions_stream(self, stub_model):
+        """Test the streamed tool call and final answer chunks."""
+        messages = [{"role": "user", "content": "Find prospects"}]
+        body = {"model": "stub", "messages": messages, "stream": True}
+        events = stream_events(httpx.post(stub_model, json=body))
+
+        delta = events[0]["choices"][0]["delta"]
+        assert delta["tool_calls"][0]["index"] == 0
+        assert delta["tool_calls"][0]["function"]["name"] == "find_prospects"
+        assert events[-1]["choices"][0]["finish_reason"] == "tool_calls"
+
+        messages.append({"role": "tool", "tool_call_id": "call_1", "content": "ok"})
+        events = stream_events(httpx.post(stub_model, json=body))
+
+        assert events[0]["choices"][0]["delta"]["content"]
+        assert events[-1]["choices"][0]["finish_reason"] == "stop"
+
+    def test_unknown_path(self, stub_model):
+        """Test that other paths are rejected."""
+        response = httpx.post(stub_model.replace("/chat/completions", "/embeddings"), json={})
+
+        assert response.status_code == 404
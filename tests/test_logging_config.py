@@ -0,0 +1,117 @@
+"""Tests for the queued structured logging pipeline."""
+
+import io
+import json
+import logging
+import subprocess
+import sys
+
+from egile_agent_prospectfinder.logging_config import (
+    JsonFormatter,
+    RateLimitFilter,
+    configure_logging,
+)
+
+
+def make_record(msg="Searching %s", args=("IT",), level=logging.INFO, **extra):
+    record = logging.LogRecord("bench", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestLoggingConfig:
+    """Tests for JSON formatting, rate limiting and the queue pipeline."""
+
+    def test_json_formatter(self):
+        """Test that records render as JSON with lazy arguments and extra fields."""
+        entry = json.loads(JsonFormatter().format(make_record(sector="IT")))
+
+        assert entry["msg"] == "Searching IT"
+        assert entry["level"] == "INFO"
+        assert entry["sector"] == "IT"
+        assert "args" not in entry
+
+    def test_rate_limit_per_template(self, monkeypatch):
+        """Test that each message template is limited on its own and warnings pass."""
+        now = [100.0]
+        monkeypatch.setattr("egile_agent_prospectfinder.logging_config.time.monotonic",
+                            lambda: now[0])
+        limiter = RateLimitFilter(burst=2, period=1.0)
+
+        passed = [limiter.filter(make_record()) for _ in range(5)]
+        assert passed == [True, True, False, False, False]
+        assert limiter.filter(make_record("Other %s"))
+        assert limiter.filter(make_record(level=logging.WARNING))
+
+        now[0] += 1.0
+        record = make_record()
+        assert limiter.filter(record)
+        assert record.suppressed == 3
+
+    def test_rate_limit_exempts_access_log(self):
+        """Test that uvicorn access lines, which share one template, are never dropped."""
+        limiter = RateLimitFilter(burst=1, period=60.0)
+        access = logging.LogRecord(
+            "uvicorn.access", logging.INFO, __file__, 1, '%s - "%s %s"', ("a", "GET", "/"), None
+        )
+
+        assert all(limiter.filter(access) for _ in range(5))
+        assert [limiter.filter(make_record()) for _ in range(2)] == [True, False]
+
+    def test_rate_limit_prunes_idle_windows(self, monkeypatch):
+        """Test that windows for templates no longer logged are forgotten."""
+        now = [100.0]
+        monkeypatch.setattr("egile_agent_prospectfinder.logging_config.time.monotonic",
+                            lambda: now[0])
+        limiter = RateLimitFilter(burst=1, period=1.0, idle_periods=5)
+
+        for i in range(100):
+            limiter.filter(make_record(f"Template {i} %s"))
+        limiter.filter(make_record())
+        limiter.filter(make_record())
+        assert len(limiter._windows) == 101
+
+        now[0] += 2.0
+        limiter.filter(make_record("Fresh %s"))
+        # The window still owing a suppressed count survives until it expires
+        assert set(limiter._windows) == {("bench", "Searching %s"), ("bench", "Fresh %s")}
+
+        now[0] += 5.0
+        limiter.filter(make_record("Fresh %s"))
+        assert set(limiter._windows) == {("bench", "Fresh %s")}
+
+    def test_import_does_not_configure_logging(self):
+        """Test that importing the package leaves the root logger alone."""
+        code = (
+            "import logging, threading, egile_agent_prospectfinder; "
+            "print(len(logging.getLogger().handlers), threading.active_count())"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert out.split() == ["0", "1"]
+
+    def test_configure_logging(self):
+        """Test that records are written as JSON lines by the listener thread."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        stream = io.StringIO()
+        try:
+            root.addHandler(logging.NullHandler())
+            assert configure_logging(stream=stream) is None
+
+            listener = configure_logging(stream=stream, force=True)
+            logging.getLogger("egile.test").info("Found %d prospects", 3)
+            listener.stop()
+            listener.stop()
+        finally:
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+            for handler in saved_handlers:
+                root.addHandler(handler)
+            root.setLevel(saved_level)
+
+        entry = json.loads(stream.getvalue().splitlines()[-1])
+        assert entry["msg"] == "Found 3 prospects"
+        assert entry["logger"] == "egile.test"
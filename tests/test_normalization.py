@@ -0,0 +1,87 @@
+"""Tests for sector and country normalization."""
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.normalization import (
+    normalize_country,
+    normalize_query,
+    normalize_sector,
+)
+
+
+class TestNormalization:
+    """Tests for canonical query normalization."""
+
+    @pytest.mark.parametrize("country", ["Belgium", "belgium", "BE", "BEL", "Belgique", "België"])
+    def test_country_variants(self, country):
+        """Test that names, native names and ISO codes resolve to one country."""
+        assert normalize_country(country) == ("BE", "Belgium")
+
+    @pytest.mark.parametrize(
+        "sector", ["fintech", "FinTech", "financial technology", "Fintech startups"]
+    )
+    def test_sector_synonyms(self, sector):
+        """Test that sector synonyms and plurals resolve to one sector."""
+        assert normalize_sector(sector) == "Fintech"
+
+    @pytest.mark.parametrize(
+        "sector", ["restaurant", "travel", "tourism", "solar", "audit", "transport"]
+    )
+    def test_related_sectors_are_not_merged(self, sector):
+        """Test that narrower or neighbouring sectors keep their own search terms."""
+        assert normalize_sector(sector) == sector.capitalize()
+
+    @pytest.mark.parametrize("country", ["England", "Scotland", "Wales", "America"])
+    def test_regions_are_not_countries(self, country):
+        """Test that constituent countries and continents are not widened to a state."""
+        assert normalize_country(country) == (None, country)
+
+    def test_unknown_values_are_kept(self):
+        """Test that unknown values pass through with tidy spelling."""
+        assert normalize_sector("  pet   grooming ") == "Pet grooming"
+        assert normalize_country("Atlantis") == (None, "Atlantis")
+
+    def test_query_key(self):
+        """Test that equivalent queries share one key."""
+        a = normalize_query("Law firms", "Nederland")
+        b = normalize_query("lawyers", "the Netherlands")
+
+        assert a == b
+        assert a.key == ("legal", "NL")
+
+
+class RecordingSearchService:
+    """Search service recording the arguments it receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    def search_prospects(self, sector, country, limit):
+        self.calls.append((sector, country))
+        return [{"title": sector, "link": f"https://{sector.lower()}.example/"}]
+
+
+class TestPluginNormalization:
+    """Tests for query normalization in the plugin."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "normalize, expected",
+        [
+            (True, [("Technology", "Belgium")]),
+            (False, [("IT", "Belgium"), ("Technology", "Belgium")]),
+        ],
+    )
+    async def test_cache_key_follows_dispatched_query(self, normalize, expected):
+        """Test that queries share cached results only when dispatched identically."""
+        service = RecordingSearchService()
+        plugin = ProspectFinderPlugin(
+            search_service=service, normalize_queries=normalize, result_cache_ttl=300
+        )
+        await plugin.on_agent_start(None)
+
+        await plugin.find_prospects("IT", "Belgium")
+        await plugin.find_prospects("Technology", "Belgium")
+
+        assert service.calls == expected
@@ -1,9 +1,13 @@
 """Tests for the ProspectFinder plugin."""
 
+import asyncio
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from egile_agent_prospectfinder import ProspectFinderPlugin, MCPClient
+from egile_agent_prospectfinder.mcp_client import ToolResult
 
 
 class TestMCPClient:
@@ -37,6 +41,137 @@ class TestMCPClient:
             assert "Test prospect results" in result
             mock_agno_client.call_tool.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_inprocess_transport(self):
+        """Test calling tools on a server hosted in the same process."""
+        from mcp.server.fastmcp import FastMCP
+
+        server = FastMCP("prospectfinder-test")
+
+        @server.tool()
+        def find_prospects(sector: str, country: str = "Belgium", limit: int = 10) -> str:
+            return f"Found {limit} {sector} prospects in {country}"
+
+        async with MCPClient(transport="inprocess", server=server) as client:
+            tools = await client.list_tools()
+            result = await client.find_prospects("Marketing", limit=3)
+
+        assert [tool["name"] for tool in tools] == ["find_prospects"]
+        assert result == "Found 3 Marketing prospects in Belgium"
+        assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_inprocess_blocking_tool_keeps_loop_responsive(self):
+        """Test that a synchronous tool blocks neither the caller's loop nor its timeout."""
+        import time
+
+        from mcp.server.fastmcp import FastMCP
+
+        server = FastMCP("prospectfinder-test")
+
+        @server.tool()
+        def find_prospects(sector: str, country: str = "Belgium", limit: int = 10) -> str:
+            time.sleep(0.5)
+            return "1. Acme\n   URL: https://acme.be\n"
+
+        async with MCPClient(transport="inprocess", server=server, timeout=0.1) as client:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                await client.find_prospects("Marketing")
+            assert time.monotonic() - start < 0.3
+
+            plugin = ProspectFinderPlugin(use_mcp=True)
+            plugin._client = client
+            client.timeout = 5.0
+            start = time.monotonic()
+            result = await plugin.find_prospects("Marketing", "Belgium", deadline_ms=50)
+            assert time.monotonic() - start < 0.3
+            assert result.startswith("Partial results")
+
+    @pytest.mark.asyncio
+    async def test_streamable_http_transport(self, unused_tcp_port):
+        """Test tool calls over streamable HTTP and release of the pooled HTTP client."""
+        uvicorn = pytest.importorskip("uvicorn")
+        from mcp.server.fastmcp import FastMCP
+
+        from egile_agent_prospectfinder import mcp_client
+
+        server = FastMCP("prospectfinder-test", json_response=True)
+
+        @server.tool()
+        def find_prospects(sector: str, country: str = "Belgium", limit: int = 10) -> str:
+            return f"Found {limit} {sector} prospects in {country}"
+
+        http_server = uvicorn.Server(
+            uvicorn.Config(
+                server.streamable_http_app(), port=unused_tcp_port, log_level="warning",
+                lifespan="on",
+            )
+        )
+        serving = asyncio.create_task(http_server.serve())
+        try:
+            while not http_server.started:
+                await asyncio.sleep(0.01)
+            first = MCPClient(transport="streamable-http", host="127.0.0.1", port=unused_tcp_port)
+            second = MCPClient(transport="streamable-http", host="127.0.0.1", port=unused_tcp_port)
+            await first.connect()
+            await second.connect()
+            pool = mcp_client.get_shared_http_client()
+
+            assert await first.find_prospects("Marketing", limit=2) == (
+                "Found 2 Marketing prospects in Belgium"
+            )
+            assert await second.find_prospects("Legal", limit=1) == (
+                "Found 1 Legal prospects in Belgium"
+            )
+
+            await second.close()
+            assert not pool.is_closed
+            await first.close()
+            # The last borrower closes this loop's pool
+            assert pool.is_closed
+        finally:
+            http_server.should_exit = True
+            await serving
+
+    @pytest.mark.asyncio
+    async def test_call_tool_structured(self):
+        """Test that structured content is passed through unchanged."""
+        client = MCPClient()
+        client._session = AsyncMock()
+        client._session.call_tool.return_value = SimpleNamespace(
+            content=[SimpleNamespace(text="1 prospect")],
+            structuredContent={"results": [{"title": "Acme", "link": "https://acme.be"}]},
+            isError=False,
+        )
+
+        result = await client.call_tool_structured("find_prospects", {"sector": "Marketing"})
+
+        assert result.structured["results"][0]["title"] == "Acme"
+        assert not result.spooled
+        assert result.size == 10
+        assert result.text() == "1 prospect"
+
+    @pytest.mark.asyncio
+    async def test_call_tool_structured_spools_large_results(self):
+        """Test that large text results are spooled out of memory."""
+        client = MCPClient(spool_threshold=16)
+        client._session = AsyncMock()
+        client._session.call_tool.return_value = SimpleNamespace(
+            content=[SimpleNamespace(text="é" * 20), SimpleNamespace(text="tail")],
+            structuredContent=None,
+            isError=False,
+        )
+
+        result = await client.call_tool_structured("find_prospects")
+
+        assert result.spooled
+        assert result.content == []
+        assert result.size == 25
+        assert result.text() == "é" * 20 + "\ntail"
+        assert "".join(result.iter_text(chunk_size=3)) == "é" * 20 + "\ntail"
+        result.close()
+
 
 class TestProspectFinderPlugin:
     """Tests for the ProspectFinder plugin."""
@@ -86,6 +221,66 @@ class TestProspectFinderPlugin:
             "Marketing", "Belgium", 5
         )
 
+    @pytest.mark.asyncio
+    async def test_mcp_error_is_raised(self):
+        """Test that an MCP tool error surfaces instead of reading as no results."""
+        plugin = ProspectFinderPlugin(use_mcp=True)
+        plugin._client = AsyncMock()
+        plugin._client.call_tool_structured.return_value = ToolResult(
+            content=[SimpleNamespace(text="Search API quota exceeded")], is_error=True
+        )
+
+        with pytest.raises(RuntimeError, match="Search API quota exceeded"):
+            await plugin.find_prospects("Marketing", "Belgium")
+
+    @pytest.mark.asyncio
+    async def test_mcp_listing_details_are_kept(self, tmp_path):
+        """Test that MCP listings with extra detail lines still become prospects."""
+        text = "1. Acme\n   URL: https://acme.be\n   Potential Gen AI Use Cases: Chatbots\n"
+        plugin = ProspectFinderPlugin(use_mcp=True, delta_dir=str(tmp_path))
+        plugin._client = AsyncMock()
+        plugin._client.call_tool_structured.side_effect = lambda *args: ToolResult(
+            content=[SimpleNamespace(text=text)]
+        )
+
+        first = await plugin.find_prospects("Marketing", "Belgium", only_new=True)
+        second = await plugin.find_prospects("Marketing", "Belgium", only_new=True)
+
+        assert "1. Acme - https://acme.be\n   Potential Gen AI Use Cases: Chatbots" in first
+        assert second == "No new prospects found for Marketing in Belgium."
+
+    @pytest.mark.asyncio
+    async def test_mcp_spooled_listing_is_parsed_incrementally(self):
+        """Test that a spooled MCP listing is parsed without reading it back whole."""
+        listing = "".join(f"{i}. Company {i}\n   URL: https://c{i}.be\n" for i in range(1, 4))
+        tool_result = ToolResult(content=[SimpleNamespace(text=listing)])
+        tool_result._spool_text_blocks(16)
+        tool_result.text = MagicMock(side_effect=AssertionError("read back whole"))
+        plugin = ProspectFinderPlugin(use_mcp=True)
+        plugin._client = AsyncMock()
+        plugin._client.call_tool_structured.return_value = tool_result
+
+        result = await plugin.find_prospects("Marketing", "Belgium", limit=3)
+
+        assert "3. Company 3 - https://c3.be" in result
+        assert list(ToolResult(content=[SimpleNamespace(text="a\r\nb")]).iter_lines()) == [
+            "a", "b"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mcp_output_without_listing(self, tmp_path):
+        """Test that MCP text without prospects passes through unless features need records."""
+        text = "Search backend is warming up, try again in a minute."
+        plugin = ProspectFinderPlugin(use_mcp=True, delta_dir=str(tmp_path))
+        plugin._client = AsyncMock()
+        plugin._client.call_tool_structured.side_effect = lambda *args: ToolResult(
+            content=[SimpleNamespace(text=text)]
+        )
+
+        assert await plugin.find_prospects("Marketing", "Belgium") == text
+        with pytest.raises(RuntimeError, match="only_new cannot be applied"):
+            await plugin.find_prospects("Marketing", "Belgium", only_new=True)
+
     @pytest.mark.asyncio
     async def test_message_processing(self):
         """Test message processing hook."""
@@ -0,0 +1,84 @@
+"""Tests for the Prospect record and its parsers."""
+
+import pytest
+
+from egile_agent_prospectfinder import Prospect
+from egile_agent_prospectfinder.prospect import (
+    UnparsedListingError,
+    format_prospects,
+    prospects_from_structured,
+    prospects_from_text,
+)
+
+
+class TestProspect:
+    """Tests for Prospect conversion and formatting."""
+
+    def test_slots_and_interning(self):
+        """Test that prospects have no instance dict and share sector strings."""
+        sector = "".join(["Market", "ing"])
+        a = Prospect("A", "https://a.be", sector=sector, country="Belgium")
+        b = Prospect.from_dict({"title": "B", "url": "https://b.be"}, "Marketing", "Belgium")
+
+        assert not hasattr(a, "__dict__")
+        assert a.sector is b.sector
+        assert b.link == "https://b.be"
+
+    def test_format_prospects(self):
+        """Test the compact listing handed to the LLM."""
+        prospects = [Prospect("Acme", "https://acme.be"), Prospect("Beta", "https://beta.be")]
+
+        assert format_prospects(prospects, "Marketing", "Belgium") == (
+            "Found 2 Marketing prospects in Belgium:\n\n"
+            "1. Acme - https://acme.be\n"
+            "2. Beta - https://beta.be\n"
+        )
+        assert format_prospects([], "Marketing", "Belgium") == (
+            "No prospects found for Marketing in Belgium."
+        )
+
+    def test_parse_server_text_listing(self):
+        """Test parsing the MCP server's multi-line text format."""
+        text = (
+            "Found 2 prospects for Marketing in Belgium:\n\n"
+            "1. Digital Marketing Agency Brussels\n"
+            "   URL: https://example.com/marketing-agency\n"
+            "   Snippet: Leading digital marketing agency...\n"
+            "   Potential Gen AI Use Cases: Content generation\n\n"
+            "2. Creative Solutions - https://example.com/creative\n"
+        )
+        prospects = prospects_from_text(text, "Marketing", "Belgium")
+
+        assert [p.link for p in prospects] == [
+            "https://example.com/marketing-agency",
+            "https://example.com/creative",
+        ]
+        assert prospects[0].snippet == "Leading digital marketing agency..."
+        assert prospects[0].details == ("Potential Gen AI Use Cases: Content generation",)
+        assert prospects[1].title == "Creative Solutions"
+        assert prospects_from_text(text, "Marketing", "Belgium", strict=True) == prospects
+
+        # Detail lines survive formatting and a round trip through dicts
+        assert "   Potential Gen AI Use Cases: Content generation\n" in format_prospects(
+            prospects, "Marketing", "Belgium"
+        )
+        assert Prospect.from_dict(prospects[0].to_dict()) == prospects[0]
+        assert "details" not in prospects[1].to_dict()
+
+    def test_parse_strict(self):
+        """Test that strict parsing rejects text without items but accepts plain listings."""
+        with pytest.raises(UnparsedListingError) as excinfo:
+            prospects_from_text("Search backend quota exceeded", strict=True)
+        assert excinfo.value.text == "Search backend quota exceeded"
+
+        assert prospects_from_text("", strict=True) == []
+        assert len(prospects_from_text("1. Acme - https://acme.be\n", strict=True)) == 1
+
+    def test_parse_structured(self):
+        """Test converting structured tool output."""
+        prospects = prospects_from_structured(
+            {"results": [{"title": "Acme", "link": "https://acme.be"}]}, "IT", "France"
+        )
+
+        assert prospects == [Prospect("Acme", "https://acme.be", sector="IT", country="France")]
+        assert prospects_from_structured({"result": "plain text"}) is None
@@ -0,0 +1,81 @@
+"""Tests for relevance re-ranking and near-duplicate pruning."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from egile_agent_prospectfinder import Prospect, ProspectFinderPlugin  # noqa: E402
+from egile_agent_prospectfinder.ranking import (  # noqa: E402
+    MinHasher,
+    ResultRanker,
+    is_blocked,
+    tfidf_scores,
+)
+
+RESULTS = [
+    Prospect("Top 10 marketing agencies in Belgium - Clutch", "https://clutch.co/be/agencies"),
+    Prospect("Acme Bakery", "https://acmebakery.be", "Fresh bread daily"),
+    Prospect("Pixel Marketing Agency Brussels", "https://pixel.be", "Digital marketing agency"),
+    Prospect("Pixel - Contact", "https://www.pixel.be/contact", "Get in touch"),
+    Prospect("Pixel Marketing Agency in Brussels", "https://pixel-agency.com",
+             "Digital marketing agency"),
+    Prospect("Nova Marketing", "https://nova.be", "Brand strategy and marketing services"),
+]
+
+
+class FakeSearchService:
+    """Search service returning fixed results and recording the requested limit."""
+
+    def __init__(self):
+        self.limits = []
+
+    def search_prospects(self, sector, country, limit):
+        self.limits.append(limit)
+        return [p.to_dict() for p in RESULTS[:limit]]
+
+
+class TestRanking:
+    """Tests for ResultRanker and its building blocks."""
+
+    def test_blocklist_matches_subdomains(self):
+        """Test that aggregator domains and their subdomains are blocked."""
+        assert is_blocked("https://be.linkedin.com/company/acme", {"linkedin.com"})
+        assert not is_blocked("https://notlinkedin.com/", {"linkedin.com"})
+
+    def test_tfidf_scores(self):
+        """Test that documents sharing query terms score higher."""
+        scores = tfidf_scores([["bakery"], ["marketing", "agency"], []], ["marketing"])
+
+        assert scores[1] > scores[0] == scores[2] == 0
+
+    def test_minhash_estimates_similarity(self):
+        """Test that signatures agree on near-identical texts only."""
+        hasher = MinHasher()
+        a = hasher.signature("pixel digital marketing agency in brussels".split())
+        b = hasher.signature("pixel digital marketing agency brussels".split())
+        c = hasher.signature("fresh bread and pastries every day".split())
+
+        assert (a == b).mean() > 0.3
+        assert (a == c).mean() < 0.1
+
+    def test_rank(self):
+        """Test blocklist, per-site, near-duplicate pruning and relevance order."""
+        ranked, stats = ResultRanker(duplicate_threshold=0.5).rank(RESULTS, "Marketing", 10)
+
+        assert [p.link for p in ranked] == [
+            "https://pixel.be", "https://nova.be", "https://acmebakery.be"
+        ]
+        assert (stats.blocked, stats.same_site, stats.near_duplicates) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_plugin_overfetches(self):
+        """Test that the plugin over-fetches and returns the top results."""
+        service = FakeSearchService()
+        plugin = ProspectFinderPlugin(search_service=service, rerank=True, overfetch=3)
+        await plugin.on_agent_start(None)
+
+        result = await plugin.find_prospects("marketing", "Belgium", limit=2)
+
+        assert service.limits == [6]
+        assert result.startswith("Found 2 Marketing prospects in Belgium")
+        assert "clutch.co" not in result and "acmebakery" not in result
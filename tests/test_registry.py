@@ -0,0 +1,94 @@
+"""Tests for the shared MCP connection registry."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from egile_agent_prospectfinder import MCPClient, MCPConnectionRegistry
+
+
+class TestMCPConnectionRegistry:
+    """Tests for reference-counted connection sharing."""
+
+    @pytest.mark.asyncio
+    async def test_shares_connection_until_last_release(self):
+        """Test that one connection serves all users with the same settings."""
+        registry = MCPConnectionRegistry()
+        with patch.object(MCPClient, "connect", AsyncMock()) as connect, \
+                patch.object(MCPClient, "close", AsyncMock()) as close:
+            first, second = await asyncio.gather(
+                registry.acquire(transport="stdio", command="python -m server"),
+                registry.acquire(transport="stdio", command="python -m server"),
+            )
+            other = await registry.acquire(transport="sse", host="localhost", port=8001)
+
+            assert first is second
+            assert other is not first
+            assert connect.await_count == 2
+            assert registry.refcount(first) == 2
+
+            await registry.release(first)
+            close.assert_not_awaited()
+            await registry.release(second)
+            assert close.await_count == 1
+            assert registry.refcount(first) == 0
+
+            await registry.release(other)
+            assert close.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_is_not_cached(self):
+        """Test that a failed connection attempt can be retried."""
+        registry = MCPConnectionRegistry()
+        with patch.object(MCPClient, "connect", AsyncMock(side_effect=OSError("boom"))):
+            with pytest.raises(OSError):
+                await registry.acquire(transport="sse", port=8001)
+
+        with patch.object(MCPClient, "connect", AsyncMock()):
+            client = await registry.acquire(transport="sse", port=8001)
+            assert registry.refcount(client) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_connect_does_not_block_other_keys(self):
+        """Test that a hanging connection attempt leaves other servers reachable."""
+        registry = MCPConnectionRegistry()
+        hang = asyncio.Event()
+
+        async def connect(client):
+            if client.port == 8001:
+                await hang.wait()
+
+        with patch.object(MCPClient, "connect", connect), \
+                patch.object(MCPClient, "close", AsyncMock()):
+            slow = asyncio.create_task(registry.acquire(transport="sse", port=8001))
+            await asyncio.sleep(0)
+            fast = await asyncio.wait_for(registry.acquire(transport="sse", port=8002), 1.0)
+
+            assert registry.refcount(fast) == 1
+            assert not slow.done()
+            hang.set()
+            await registry.release(await slow)
+            await registry.release(fast)
+
+    @pytest.mark.asyncio
+    async def test_dead_connection_is_replaced(self):
+        """Test that a connection whose task died is evicted and reconnected."""
+        registry = MCPConnectionRegistry()
+        with patch.object(MCPClient, "connect", AsyncMock()) as connect, \
+                patch.object(MCPClient, "close", AsyncMock()):
+            first = await registry.acquire(transport="stdio", command="python -m server")
+            # Simulate the server subprocess crashing under the background task
+            dead = next(iter(registry._connections.values()))
+            dead.task.cancel()
+            await asyncio.gather(dead.task, return_exceptions=True)
+
+            second = await registry.acquire(transport="stdio", command="python -m server")
+
+            assert second is not first
+            assert connect.await_count == 2
+            assert registry.refcount(first) == 1
+            await registry.release(first)
+            assert registry.refcount(first) == 0
+            assert registry.refcount(second) == 1
+            await registry.release(second)
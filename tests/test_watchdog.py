@@ -0,0 +1,111 @@
+"""Tests for the event-loop lag watchdog."""
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from egile_agent_prospectfinder import ProspectFinderPlugin
+from egile_agent_prospectfinder.watchdog import LagHistogram, LoopWatchdog
+
+
+class SearchService:
+    """Search service returning one result."""
+
+    def search_prospects(self, sector, country, limit):
+        return [{"title": "Acme", "link": "https://acme.be"}]
+
+
+class BlockingRanker:
+    """Ranker doing synchronous work on the event loop."""
+
+    def rank(self, prospects, sector, limit):
+        time.sleep(0.3)
+        return prospects[:limit], None
+
+
+class TestWatchdog:
+    """Tests for lag measurement and stall attribution."""
+
+    def test_histogram(self):
+        """Test cumulative buckets and the Prometheus rendering."""
+        histogram = LagHistogram(buckets=(0.01, 0.1, float("inf")))
+        for lag in (0.001, 0.05, 0.05, 3.0):
+            histogram.observe(lag)
+
+        assert histogram.snapshot()["buckets"] == {"0.01": 1, "0.1": 3, "+Inf": 4}
+        assert 'event_loop_lag_seconds_bucket{le="+Inf"} 4' in histogram.prometheus()
+        assert histogram.max == 3.0
+
+    @pytest.mark.asyncio
+    async def test_reports_blocking_tool_call(self, caplog):
+        """Test that blocking work is logged with the plugin call that ran it."""
+        plugin = ProspectFinderPlugin(search_service=SearchService())
+        await plugin.on_agent_start(None)
+        plugin._ranker = BlockingRanker()
+        watchdog = LoopWatchdog(interval=0.02, threshold=0.1)
+        watchdog.start()
+        try:
+            with caplog.at_level(logging.WARNING, logger="egile_agent_prospectfinder.watchdog"):
+                await asyncio.sleep(0.05)
+                await plugin.find_prospects("Legal", "Belgium")
+                await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+
+        blocked = [r for r in caplog.records if r.getMessage().startswith("Event loop blocked")]
+        assert len(blocked) == 1
+        assert blocked[0].blocked_in.startswith("ProspectFinderPlugin._gather (")
+        assert "rank" in blocked[0].getMessage()
+        assert watchdog.snapshot()["stalls"] == 1
+        assert watchdog.histogram.max >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_asgi_metrics_endpoint(self):
+        """Test that the wrapped app starts the watchdog and serves the histogram."""
+        watchdog = LoopWatchdog()
+        sent = []
+
+        async def app(scope, receive, send):
+            raise AssertionError("metrics requests are answered by the wrapper")
+
+        async def send(message):
+            sent.append(message)
+
+        await watchdog.asgi_app(app)({"type": "http", "path": "/_watchdog/event-loop"}, None, send)
+        await watchdog.stop()
+
+        assert sent[0]["status"] == 200
+        assert b"# TYPE event_loop_stalls_total counter\nevent_loop_stalls_total 0" in (
+            sent[1]["body"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_asgi_lifespan_shutdown_stops_watchdog(self):
+        """Test that the watchdog stops when the server shuts the app down."""
+        watchdog = LoopWatchdog()
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        running_at_startup = []
+
+        async def app(scope, receive, send):
+            assert (await receive())["type"] == "lifespan.startup"
+            running_at_startup.append(watchdog.running)
+            assert (await receive())["type"] == "lifespan.shutdown"
+
+        async def receive():
+            return messages.pop(0)
+
+        await watchdog.asgi_app(app)({"type": "lifespan"}, receive, None)
+
+        assert running_at_startup == [True]
+        assert not watchdog.running
+        assert watchdog._sampler is None
+
+    def test_asgi_metrics_path_must_be_free(self):
+        """Test that the metrics route refuses to shadow a route of the wrapped app."""
+        app = SimpleNamespace(routes=[SimpleNamespace(path="/_watchdog/event-loop")])
+
+        with pytest.raises(ValueError, match="already routed"):
+            LoopWatchdog().asgi_app(app)